@@ -0,0 +1,428 @@
+"""
+Benchmarks for FIFA World Cup 2026 Analytics
+
+This script measures the performance of the analytics building blocks on
+synthetic data sized like full international match archives.
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_loaders import iter_records, read_event_frame
+from data_store import DataStore
+from event_table import EventTable
+from match_analyzer import MatchAnalyzer
+from player_performance_analyzer import PlayerAnalyzer
+from rating_engine import RatingEngine
+from scoreline_model import ScorelineModel
+from team_performance_analyzer import TeamAnalyzer
+from tournament_simulator import TournamentSimulator
+
+
+def _timed(func, *args):
+    """Run a function and return its result with the elapsed time in seconds."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def build_synthetic_store(n_teams=211, n_matches=10000, n_events=1000000, seed=0):
+    """Build a data store filled with synthetic teams, matches and events."""
+    rng = random.Random(seed)
+    confederations = ['UEFA', 'CONMEBOL', 'CONCACAF', 'AFC', 'CAF', 'OFC']
+    phases = ['0-15', '16-30', '31-45', '46-60', '61-90']
+    event_types = ['goal', 'yellow_card', 'red_card', 'substitution']
+
+    store = DataStore(load=False)
+    team_codes = [f'T{i:03d}' for i in range(n_teams)]
+    for i, code in enumerate(team_codes):
+        store.add_team(code, {'name': code, 'confederation': confederations[i % len(confederations)],
+                              'qualified': i < 48, 'ranking': i + 1})
+
+    match_ids = [f'M{i:05d}' for i in range(n_matches)]
+    for match_id in match_ids:
+        team1, team2 = rng.sample(team_codes, 2)
+        store.add_match(match_id, {'team1': team1, 'team2': team2,
+                                   'score1': rng.randint(0, 4), 'score2': rng.randint(0, 4),
+                                   'date': '2024-01-01', 'tournament': 'Synthetic', 'stage': 'Group Stage'})
+
+    for _ in range(n_events):
+        match_id = match_ids[rng.randrange(n_matches)]
+        match = store.matches_data[match_id]
+        minute = rng.randint(1, 90)
+        store.add_match_event({'match_id': match_id,
+                               'team': match['team1'] if rng.random() < 0.5 else match['team2'],
+                               'event_type': rng.choice(event_types),
+                               'player': 'Player', 'minute': minute,
+                               'phase': phases[min((minute - 1) // 15, 4)]})
+    return store
+
+
+def benchmark_data_store(n_matches=10000, n_events=1000000, sample_size=20):
+    """Compare linear-scan lookups against the data store indexes."""
+    store, build_time = _timed(build_synthetic_store, 211, n_matches, n_events)
+    print(f"Built store with {n_matches} matches and {n_events} events in {build_time:.2f}s")
+
+    team_codes = list(store.teams_data)
+    match_ids = list(store.matches_data)
+    sample_ids = match_ids[:sample_size]
+
+    def scan_team_matches():
+        for code in team_codes:
+            [m for m in store.matches_data.values() if m['team1'] == code or m['team2'] == code]
+
+    def index_team_matches():
+        for code in team_codes:
+            [store.matches_data[mid] for mid in store.matches_by_team.get(code, [])]
+
+    def scan_match_events():
+        for match_id in sample_ids:
+            [e for e in store.match_events if e['match_id'] == match_id]
+
+    def index_match_events():
+        for match_id in match_ids:
+            list(store.events_by_match.get(match_id, []))
+
+    results = [
+        ('get_team_matches', scan_team_matches, len(team_codes), index_team_matches, len(team_codes)),
+        ('get_match_events', scan_match_events, len(sample_ids), index_match_events, len(match_ids)),
+    ]
+    for name, scan, scan_calls, index, index_calls in results:
+        _, scan_time = _timed(scan)
+        _, index_time = _timed(index)
+        per_scan = scan_time / scan_calls
+        per_index = index_time / index_calls
+        print(f"{name}: scan {per_scan * 1e6:.1f}us/lookup, index {per_index * 1e6:.1f}us/lookup, "
+              f"speedup {per_scan / per_index:.0f}x")
+
+
+def benchmark_event_table(n_matches=104, n_events=100000):
+    """Compare per-match list scans against the columnar event table for a full tournament."""
+    store = build_synthetic_store(48, n_matches, n_events)
+    phases = ['0-15', '16-30', '31-45', '46-60', '61-90']
+
+    table, build_time = _timed(EventTable.from_events, store.match_events, store.matches_data)
+    dict_bytes = sum(sys.getsizeof(e) for e in store.match_events) / len(store.match_events)
+    print(f"Built table in {build_time * 1e3:.1f}ms; memory {dict_bytes:.0f} bytes/event as dicts, "
+          f"{table.nbytes / len(table):.0f} bytes/event as columns")
+
+    def scan_phases():
+        for match_id, match in store.matches_data.items():
+            events = [e for e in store.match_events if e['match_id'] == match_id]
+            for phase in phases:
+                phase_events = [e for e in events if e['phase'] == phase]
+                [e for e in phase_events if e['event_type'] == 'goal' and e['team'] == match['team1']]
+                [e for e in phase_events if e['event_type'] == 'goal' and e['team'] == match['team2']]
+                [e for e in phase_events if 'card' in e['event_type'] and e['team'] == match['team1']]
+                [e for e in phase_events if 'card' in e['event_type'] and e['team'] == match['team2']]
+
+    def columnar_phases():
+        table.phase_counts()
+        table.cumulative_momentum()
+
+    _, scan_time = _timed(scan_phases)
+    _, columnar_time = _timed(columnar_phases)
+    print(f"Phase breakdown of {n_matches} matches: scan {scan_time * 1e3:.1f}ms, "
+          f"columnar {columnar_time * 1e3:.1f}ms (with momentum), speedup {scan_time / columnar_time:.0f}x")
+
+
+def benchmark_data_loaders(n_matches=40000, n_events=2000000, chunk_size=100000):
+    """Time streaming a match events file into event dicts and straight into an event table."""
+    rng = np.random.default_rng(0)
+    minutes = rng.integers(1, 91, n_events)
+    events = pd.DataFrame({
+        'match_id': np.char.add('M', rng.integers(0, n_matches, n_events).astype(str)),
+        'team': np.char.add('T', rng.integers(0, 211, n_events).astype(str)),
+        'event_type': rng.choice(['goal', 'yellow_card', 'red_card', 'substitution'], n_events),
+        'player': np.char.add('P', rng.integers(0, 5000, n_events).astype(str)),
+        'minute': minutes,
+        'phase': np.array(['0-15', '16-30', '31-45', '46-60', '61-90'])[np.minimum((minutes - 1) // 15, 4)]
+    })
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        for extension in ('.csv', '.parquet'):
+            path = os.path.join(data_dir, 'match_events' + extension)
+            if extension == '.csv':
+                events.to_csv(path, index=False)
+            else:
+                events.to_parquet(path, row_group_size=chunk_size)
+
+            def load_dicts():
+                return sum(len(records) for records in iter_records(path, 'match_events', chunk_size))
+
+            def load_table():
+                return EventTable.from_frame(read_event_frame(path, chunk_size), {})
+
+            _, dict_time = _timed(load_dicts)
+            table, table_time = _timed(load_table)
+            print(f"{extension[1:]}: {n_events} events as dicts in {dict_time:.1f}s, "
+                  f"as event table in {table_time:.1f}s ({table.nbytes / 1e6:.0f}MB)")
+            os.remove(path)
+
+
+def benchmark_head_to_head(n_teams=211, n_matches=40000, n_pairs_teams=48):
+    """Compare scanning the match history per pair against the pair index for all pairs of 48 teams."""
+    rng = random.Random(0)
+    store = DataStore(load=False)
+    team_codes = [f'T{i:03d}' for i in range(n_teams)]
+    for _ in range(n_matches):
+        team1, team2 = rng.sample(team_codes, 2)
+        score1, score2 = rng.randint(0, 4), rng.randint(0, 4)
+        store.add_historical_match({'team1': team1, 'team2': team2, 'score1': score1, 'score2': score2,
+                                    'winner': team1 if score1 > score2 else team2 if score2 > score1 else None})
+
+    analyzer = TeamAnalyzer()
+    analyzer.store = store
+    teams = team_codes[:n_pairs_teams]
+    pairs = [(a, b) for i, a in enumerate(teams) for b in teams[i + 1:]]
+
+    def scan_pairs():
+        for team1, team2 in pairs:
+            [m for m in store.match_history
+             if (m['team1'] == team1 and m['team2'] == team2) or (m['team1'] == team2 and m['team2'] == team1)]
+
+    _, scan_time = _timed(scan_pairs)
+    _, index_time = _timed(lambda: [analyzer.head_to_head(a, b) for a, b in pairs])
+    _, matrix_time = _timed(analyzer.all_head_to_heads, teams)
+    print(f"{len(pairs)} pairs over {n_matches} matches: scan {scan_time * 1e3:.0f}ms, "
+          f"pair index {index_time * 1e3:.1f}ms, all_head_to_heads {matrix_time * 1e3:.1f}ms")
+
+
+def benchmark_rating_engine(n_teams=211, n_matches=40000, n_fixtures=10000):
+    """Time building Elo ratings from a match archive and predicting a batch of fixtures."""
+    rng = random.Random(0)
+    team_codes = [f'T{i:03d}' for i in range(n_teams)]
+    teams_data = {code: {'ranking': i + 1} for i, code in enumerate(team_codes)}
+    matches = []
+    for i in range(n_matches):
+        team1, team2 = rng.sample(team_codes, 2)
+        matches.append({'team1': team1, 'team2': team2, 'score1': rng.randint(0, 4), 'score2': rng.randint(0, 4),
+                        'date': f'{1990 + i * 35 // n_matches}-01-01', 'tournament': 'Friendly'})
+
+    engine, build_time = _timed(RatingEngine.from_history, matches, teams_data)
+    fixtures = [tuple(rng.sample(team_codes, 2)) for _ in range(n_fixtures)]
+    team1s = [team1 for team1, _ in fixtures]
+    team2s = [team2 for _, team2 in fixtures]
+
+    _, single_time = _timed(lambda: [engine.predict(team1, team2) for team1, team2 in fixtures])
+    _, batch_time = _timed(engine.predict_many, team1s, team2s)
+    print(f"Rated {n_matches} matches in {build_time * 1e3:.0f}ms "
+          f"({build_time / n_matches * 1e6:.1f}us/update); {n_fixtures} predictions: "
+          f"one by one {single_time * 1e3:.0f}ms, batch {batch_time * 1e3:.1f}ms")
+
+
+def benchmark_scoreline_model(n_teams=211, n_matches=40000, n_new=500):
+    """Time fitting the scoreline model, warm-start refitting after new results and batch scoreline matrices."""
+    rng = np.random.default_rng(0)
+    strength = rng.normal(0, 0.3, n_teams)
+    team1 = rng.integers(0, n_teams, n_matches + n_new)
+    team2 = (team1 + rng.integers(1, n_teams, n_matches + n_new)) % n_teams
+    score1 = rng.poisson(np.exp(0.1 + strength[team1] - strength[team2]))
+    score2 = rng.poisson(np.exp(0.1 + strength[team2] - strength[team1]))
+    matches = [{'team1': f'T{i:03d}', 'team2': f'T{j:03d}', 'score1': int(x), 'score2': int(y)}
+               for i, j, x, y in zip(team1, team2, score1, score2)]
+
+    model = ScorelineModel()
+    _, fit_time = _timed(model.fit, matches[:n_matches])
+    _, refit_time = _timed(model.fit, matches)
+    fixtures = [matches[k] for k in range(104)]
+    matrices, batch_time = _timed(model.scoreline_matrices, [m['team1'] for m in fixtures],
+                                  [m['team2'] for m in fixtures])
+    print(f"Fitted {n_matches} matches in {fit_time:.2f}s, warm refit with {n_new} new in {refit_time:.2f}s; "
+          f"{matrices.shape[0]} scoreline matrices in {batch_time * 1e3:.1f}ms")
+
+
+def benchmark_predict_matrix(n_teams=48):
+    """Compare per-pair predict_match_outcome calls against predict_matrix for all pairings of 48 teams."""
+    analyzer = MatchAnalyzer()
+    analyzer.store = build_synthetic_store(n_teams, 1000, 0)
+    teams = list(analyzer.teams_data)
+
+    def per_pair():
+        return [analyzer.predict_match_outcome(team1, team2) for team1 in teams for team2 in teams if team1 != team2]
+
+    analyzer.store.get_rating_engine()
+    _, pair_time = _timed(per_pair)
+    (probs, _), matrix_time = _timed(analyzer.predict_matrix, teams)
+    print(f"{n_teams}x{n_teams} pairings: per pair {pair_time * 1e3:.1f}ms, "
+          f"predict_matrix {matrix_time * 1e3:.2f}ms, speedup {pair_time / matrix_time:.0f}x")
+
+
+def build_synthetic_player_store(n_players=1200, n_events=2000000, seed=0):
+    """Build a data store with a World Cup squad pool of players and their goal and assist events."""
+    rng = np.random.default_rng(seed)
+    store = DataStore(load=False)
+    positions = ['Goalkeeper', 'Defender', 'Midfielder', 'Forward']
+    confederations = ['UEFA', 'CONMEBOL', 'CONCACAF', 'AFC', 'CAF', 'OFC']
+    for t in range(n_players // 25):
+        store.add_team(f'T{t:02d}', {'name': f'Team {t}', 'confederation': confederations[t % len(confederations)],
+                                     'qualified': True, 'ranking': t + 1})
+
+    player_ids = [f'P{i:04d}' for i in range(n_players)]
+    for i, player_id in enumerate(player_ids):
+        store.add_player(player_id, {'name': player_id, 'team': f'T{i // 25:02d}', 'position': positions[i % 4],
+                                     'age': 20 + i % 15, 'caps': int(rng.integers(1, 150)),
+                                     'goals': int(rng.integers(0, 60))})
+
+    scorers = rng.integers(0, n_players, n_events)
+    is_goal = rng.random(n_events) < 0.6
+    for k in range(n_events):
+        store.add_player_event({'match_id': f'M{k % 5000:04d}', 'player_id': player_ids[scorers[k]],
+                                'event_type': 'goal' if is_goal[k] else 'assist', 'minute': 1 + k % 90})
+    return store
+
+
+def benchmark_player_metrics(n_players=1200, n_events=2000000, sample_size=20):
+    """Compare rescanning the event list against the per-player counters for per-player metrics."""
+    store, build_time = _timed(build_synthetic_player_store, n_players, n_events)
+    print(f"Built store with {n_players} players and {n_events} events in {build_time:.1f}s")
+
+    analyzer = PlayerAnalyzer()
+    analyzer.store = store
+    player_ids = list(store.players_data)
+
+    def scan_metrics():
+        for player_id in player_ids[:sample_size]:
+            caps = store.players_data[player_id]['caps']
+            len([e for e in store.player_events if e['player_id'] == player_id and e['event_type'] == 'goal']) / caps
+            len([e for e in store.player_events if e['player_id'] == player_id and e['event_type'] == 'assist']) / caps
+
+    def counter_metrics():
+        for player_id in player_ids:
+            analyzer.calculate_goals_per_match(player_id)
+            analyzer.calculate_assists_per_match(player_id)
+
+    _, scan_time = _timed(scan_metrics)
+    _, counter_time = _timed(counter_metrics)
+    per_scan = scan_time / sample_size
+    per_counter = counter_time / n_players
+    print(f"goals and assists per match: scan {per_scan * 1e3:.0f}ms/player, "
+          f"counters {per_counter * 1e6:.1f}us/player, speedup {per_scan / per_counter:,.0f}x")
+
+
+def benchmark_leaderboards(n_players=1200, n_goals=100000, n_queries=1000):
+    """Compare sorting all players per top scorer query against maintained leaderboards under live goals."""
+    store = build_synthetic_player_store(n_players, n_events=0)
+    analyzer = PlayerAnalyzer()
+    analyzer.store = store
+    player_ids = list(store.players_data)
+    confederation = store.teams_data[store.players_data[player_ids[0]]['team']]['confederation']
+
+    def sort_top_scorers():
+        for _ in range(n_queries):
+            sorted(store.players_data.items(), key=lambda x: x[1]['goals'], reverse=True)[:10]
+            players = [(pid, store.players_data[pid]) for team_code in store.teams_by_confederation[confederation]
+                       for pid in store.players_by_team[team_code]]
+            sorted(players, key=lambda x: x[1]['goals'], reverse=True)[:5]
+
+    def leaderboard_top_scorers():
+        for _ in range(n_queries):
+            analyzer.get_top_scorers(10)
+            analyzer.get_top_scorers_by_confederation(confederation, 5)
+
+    _, sort_time = _timed(sort_top_scorers)
+    _, build_time = _timed(store.get_leaderboards)
+    _, query_time = _timed(leaderboard_top_scorers)
+    print(f"{n_queries} global and confederation top scorer queries: sort {sort_time * 1e3:.0f}ms, "
+          f"leaderboards {query_time * 1e3:.0f}ms (built in {build_time * 1e3:.0f}ms), "
+          f"speedup {sort_time / query_time:.0f}x")
+
+    scorers = np.random.default_rng(0).integers(0, n_players, n_goals)
+    _, goal_time = _timed(lambda: [analyzer.record_goal('M0001', player_ids[i], 90) for i in scorers])
+    print(f"{n_goals} live goals recorded in {goal_time:.2f}s ({goal_time / n_goals * 1e6:.1f}us/goal)")
+
+
+def synthetic_groups(n_groups=12):
+    """Build a synthetic group draw with ranking-based outcome probabilities."""
+    teams = [f'T{i:02d}' for i in range(n_groups * 4)]
+    groups = [teams[g::n_groups] for g in range(n_groups)]
+    ordered = [team for group in groups for team in group]
+
+    strength = np.array([1 / (int(team[1:]) + 1) for team in ordered])
+    share = strength[:, None] / (strength[:, None] + strength[None, :])
+    outcome_probs = np.stack([0.75 * share, np.full_like(share, 0.25), 0.75 * share.T], axis=2)
+    return groups, outcome_probs
+
+
+def benchmark_tournament_simulator(n_tournaments=1000000):
+    """Time Monte Carlo simulation of the 48-team tournament on one core and on all cores."""
+    groups, outcome_probs = synthetic_groups()
+    simulator = TournamentSimulator(groups, outcome_probs)
+
+    results = []
+    for n_workers in sorted({1, os.cpu_count() or 1}):
+        counts, elapsed = _timed(simulator.simulate, n_tournaments, 2026, 100000, n_workers)
+        results.append(counts)
+        print(f"Simulated {n_tournaments} tournaments on {n_workers} worker(s) in {elapsed:.1f}s "
+              f"({n_tournaments / elapsed:,.0f} tournaments/s)")
+    print(f"Identical results across worker counts: {all(np.array_equal(results[0], r) for r in results)}")
+
+
+def benchmark_import_time(repeat=5):
+    """Measure cold-start latency of importing each analyzer and answering one lookup.
+
+    The baseline reproduces the analyzers before imports were deferred: pandas,
+    numpy, matplotlib and seaborn imported up front and every dataset loaded
+    on construction.
+    """
+    eager_modules = ['numpy', 'pandas', 'matplotlib.pyplot', 'seaborn']
+    eager_imports = '; '.join(f'import {name}' for name in eager_modules
+                              if importlib.util.find_spec(name.split('.')[0]) is not None)
+    cold_starts = {
+        'team_performance_analyzer': "TeamAnalyzer().get_team_info('ARG')",
+        'match_analyzer': "MatchAnalyzer().get_match_info('M001')",
+        'player_performance_analyzer': "PlayerAnalyzer().get_player_info('P001')",
+        'qualification_analyzer': "QualificationAnalyzer().get_team_qualification_data('ARG')",
+    }
+
+    def cold_start(code):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    baseline = cold_start('pass')
+    for module, lookup in cold_starts.items():
+        import_time = cold_start(f'import {module}') - baseline
+        lookup_time = cold_start(f'from {module} import *; {lookup}') - baseline
+        eager_time = cold_start(f'{eager_imports}; from {module} import *; '
+                                f'from data_store import get_data_store; get_data_store().load_data(); {lookup}')
+        eager_time -= baseline
+        print(f"{module}: import {import_time * 1e3:.0f}ms, import + first lookup {lookup_time * 1e3:.0f}ms, "
+              f"eager baseline {eager_time * 1e3:.0f}ms")
+
+
+BENCHMARKS = {
+    'data_store': benchmark_data_store,
+    'event_table': benchmark_event_table,
+    'data_loaders': benchmark_data_loaders,
+    'head_to_head': benchmark_head_to_head,
+    'rating_engine': benchmark_rating_engine,
+    'scoreline_model': benchmark_scoreline_model,
+    'predict_matrix': benchmark_predict_matrix,
+    'player_metrics': benchmark_player_metrics,
+    'leaderboards': benchmark_leaderboards,
+    'tournament_simulator': benchmark_tournament_simulator,
+    'import_time': benchmark_import_time,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run analytics benchmarks.')
+    parser.add_argument('names', nargs='*', default=list(BENCHMARKS),
+                        help='Benchmarks to run (default: all)')
+    args = parser.parse_args()
+
+    for name in args.names:
+        print(f"== {name} ==")
+        BENCHMARKS[name]()
@@ -0,0 +1,221 @@
+"""
+Data Loaders for FIFA World Cup 2026
+
+This module provides loaders that stream the datasets of a data directory from
+CSV, JSON Lines or Parquet files in bounded-memory chunks. Every chunk is
+checked against the dataset schema and coerced to its column types in one
+vectorized pass, then handed to the DataStore as records or, for match events,
+kept as categorical columns for the EventTable without building event dicts.
+"""
+
+from pathlib import Path
+
+# File formats by extension, in the order they are looked for
+FILE_FORMATS = {'.parquet': 'parquet', '.jsonl': 'jsonl', '.csv': 'csv'}
+
+DEFAULT_CHUNK_SIZE = 100000
+
+# Columns and types of each dataset. Datasets with a key are loaded as dicts
+# keyed by that column; optional columns may be missing or empty.
+SCHEMAS = {
+    'teams': {
+        'key': 'team_code',
+        'columns': {'team_code': 'str', 'name': 'str', 'confederation': 'str', 'qualified': 'bool',
+                    'ranking': 'int'},
+        'optional': ['ranking']
+    },
+    'players': {
+        'key': 'player_id',
+        'columns': {'player_id': 'str', 'name': 'str', 'team': 'str', 'position': 'str', 'age': 'int',
+                    'caps': 'int', 'goals': 'int'},
+        'optional': ['age', 'caps', 'goals']
+    },
+    'matches': {
+        'key': 'match_id',
+        'columns': {'match_id': 'str', 'team1': 'str', 'team2': 'str', 'score1': 'int', 'score2': 'int',
+                    'date': 'str', 'tournament': 'str', 'stage': 'str'},
+        'optional': ['date', 'tournament', 'stage']
+    },
+    'match_history': {
+        'columns': {'team1': 'str', 'team2': 'str', 'score1': 'int', 'score2': 'int', 'winner': 'str',
+                    'tournament': 'str', 'stage': 'str'},
+        'optional': ['winner', 'tournament', 'stage']
+    },
+    'match_events': {
+        'columns': {'match_id': 'str', 'team': 'str', 'event_type': 'str', 'player': 'str', 'minute': 'int',
+                    'phase': 'str'},
+        'optional': ['player']
+    },
+    'player_events': {
+        'columns': {'match_id': 'str', 'player_id': 'str', 'event_type': 'str', 'minute': 'int'},
+        'optional': []
+    },
+    'qualification': {
+        'key': 'team_code',
+        'columns': {'team_code': 'str', 'matches_played': 'int', 'wins': 'int', 'draws': 'int', 'losses': 'int',
+                    'goals_for': 'int', 'goals_against': 'int', 'points': 'int', 'status': 'str'},
+        'optional': []
+    },
+    'confederation_formats': {
+        'key': 'confederation',
+        'columns': {'confederation': 'str', 'total_slots': 'int', 'direct_slots': 'int', 'playoff_slots': 'int',
+                    'format': 'str'},
+        'optional': ['direct_slots', 'playoff_slots', 'format']
+    },
+}
+
+# Text values accepted for boolean columns
+_BOOL_VALUES = {'true': True, 'false': False, '1': True, '0': False, 'yes': True, 'no': False}
+
+
+def find_dataset_file(data_dir, name):
+    """Get the file holding a dataset in a data directory, or None if there is none."""
+    for extension in FILE_FORMATS:
+        path = Path(data_dir) / f'{name}{extension}'
+        if path.is_file():
+            return path
+    return None
+
+
+def read_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, columns=None, text_columns=()):
+    """Read a CSV, JSON Lines or Parquet file as a sequence of DataFrames of at most chunk_size rows.
+
+    Columns in text_columns are read as text as written, so that codes such
+    as '001' keep their leading zeros. Other CSV columns have their types
+    guessed, and JSON values keep their own types.
+    """
+    import pandas as pd
+
+    path = Path(path)
+    file_format = FILE_FORMATS.get(path.suffix.lower())
+    if file_format is None:
+        raise ValueError(f"Unsupported data file format: {path}")
+
+    if file_format == 'csv':
+        usecols = None if columns is None else set(columns).__contains__
+        dtype = {column: str for column in text_columns}
+        yield from pd.read_csv(path, chunksize=chunk_size, usecols=usecols, dtype=dtype)
+    elif file_format == 'jsonl':
+        for chunk in pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False, convert_dates=False):
+            yield chunk if columns is None else chunk[[c for c in columns if c in chunk]]
+    else:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet files requires pyarrow (pip install pyarrow)") from e
+        parquet_file = pq.ParquetFile(path)
+        if columns is not None:
+            available = set(parquet_file.schema_arrow.names)
+            columns = [c for c in columns if c in available]
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+
+
+def validate_chunk(chunk, name, path='<data>', first_row=0):
+    """Check a chunk against a dataset schema and coerce its columns to the schema types.
+
+    Missing optional columns are added as empty. Raises ValueError naming the
+    column and the first offending rows if a required column is missing or
+    holds empty or malformed values.
+    """
+    import pandas as pd
+
+    schema = SCHEMAS[name]
+    optional = set(schema['optional'])
+
+    missing = [c for c in schema['columns'] if c not in chunk and c not in optional]
+    if missing:
+        raise ValueError(f"Missing columns {missing} in {path}")
+
+    validated = {}
+    for column, kind in schema['columns'].items():
+        if column not in chunk:
+            validated[column] = pd.Series(None, index=chunk.index, dtype=object)
+            continue
+
+        values = chunk[column]
+        present = values.notna()
+        if kind == 'int':
+            coerced = pd.to_numeric(values, errors='coerce')
+            invalid = present & (coerced.isna() | (coerced % 1 != 0))
+        elif kind == 'bool':
+            coerced = values if values.dtype == bool else values.astype(str).str.strip().str.lower().map(_BOOL_VALUES)
+            invalid = present & coerced.isna()
+        else:
+            coerced = values.astype(str).where(present, None)
+            invalid = present & (coerced == '')
+        if column not in optional:
+            invalid |= ~present
+
+        if invalid.any():
+            rows = (invalid.to_numpy().nonzero()[0][:5] + first_row).tolist()
+            raise ValueError(f"Invalid {column} values in {path} at rows {rows}")
+
+        if kind == 'int':
+            coerced = coerced.astype('int64') if present.all() else coerced.astype('Int64')
+        elif kind == 'bool':
+            coerced = coerced.astype(bool) if present.all() else coerced
+        validated[column] = coerced
+
+    # Columns outside the schema are kept as they are
+    for column in chunk:
+        if column not in validated:
+            validated[column] = chunk[column]
+    return pd.DataFrame(validated, index=chunk.index)
+
+
+def iter_dataset(path, name, chunk_size=DEFAULT_CHUNK_SIZE, columns=None):
+    """Stream a dataset file as validated DataFrame chunks."""
+    text_columns = [column for column, kind in SCHEMAS[name]['columns'].items() if kind == 'str']
+    first_row = 0
+    for chunk in read_chunks(path, chunk_size, columns, text_columns):
+        yield validate_chunk(chunk.reset_index(drop=True), name, path, first_row)
+        first_row += len(chunk)
+
+
+def _chunk_records(chunk):
+    """Convert a validated chunk to a list of dicts, leaving out empty values."""
+    columns = list(chunk.columns)
+    values = chunk.astype(object).where(chunk.notna(), None)
+    return [{c: v for c, v in zip(columns, row) if v is not None}
+            for row in values.itertuples(index=False, name=None)]
+
+
+def iter_records(path, name, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Stream a dataset file as lists of records, one list per chunk.
+
+    Keyed datasets (see SCHEMAS) yield (key, record) pairs with the key column
+    removed from the record; the others yield plain record dicts.
+    """
+    key = SCHEMAS[name].get('key')
+    for chunk in iter_dataset(path, name, chunk_size):
+        records = _chunk_records(chunk)
+        if key is not None:
+            records = [(record.pop(key), record) for record in records]
+        yield records
+
+
+def read_event_frame(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Read a match events file into one DataFrame of categorical columns, chunk by chunk.
+
+    Text columns are converted to categoricals as each chunk arrives, so memory
+    stays close to the size of the final codes rather than of the raw strings.
+    """
+    import pandas as pd
+    from pandas.api.types import union_categoricals
+
+    columns = list(SCHEMAS['match_events']['columns'])
+    categorical = ['match_id', 'team', 'event_type', 'player', 'phase']
+
+    chunks = []
+    for chunk in iter_dataset(path, 'match_events', chunk_size, columns):
+        chunk = chunk[columns]
+        chunks.append(chunk.assign(**{c: chunk[c].astype('category') for c in categorical},
+                                   minute=chunk['minute'].astype('int16')))
+
+    if not chunks:
+        return pd.DataFrame({c: pd.Series(dtype='category' if c in categorical else 'int16') for c in columns})
+
+    frame = {c: union_categoricals([chunk[c] for chunk in chunks]) for c in categorical}
+    frame['minute'] = pd.concat([chunk['minute'] for chunk in chunks], ignore_index=True)
+    return pd.DataFrame(frame)[columns]
@@ -0,0 +1,603 @@
+"""
+Data Store for FIFA World Cup 2026
+
+This module provides a shared, load-once data store that holds team, player,
+match, event and qualification data together with hash indexes, so that the
+analyzers can answer lookups without scanning the full datasets. Datasets are
+streamed from CSV, JSON Lines or Parquet files in the data directory (see
+data_loaders). A directory without any dataset files gets built-in sample data
+instead; in a directory with some files, datasets without one are left empty.
+"""
+
+from collections import Counter, defaultdict, deque
+import logging
+from pathlib import Path
+
+from data_loaders import SCHEMAS, find_dataset_file, iter_records, read_event_frame
+
+logger = logging.getLogger(__name__)
+
+# Stores shared between analyzers, keyed by resolved data directory
+_stores = {}
+
+
+def _index():
+    """Create an empty index mapping keys to lists."""
+    return defaultdict(list)
+
+
+# Number of most recent results kept in each team's form
+FORM_WINDOW = 5
+
+
+def _team_record():
+    """Create an empty running record of a team's historical results."""
+    return {'played': 0, 'won': 0, 'drawn': 0, 'lost': 0, 'goals_for': 0, 'goals_against': 0,
+            'shootout_wins': 0, 'shootout_losses': 0, 'form': deque(maxlen=FORM_WINDOW)}
+
+
+# Attributes (data and indexes) making up each dataset, with their empty factories.
+# Datasets are loaded independently, the first time one of their attributes is used.
+DATASETS = {
+    'teams': {'teams_data': dict, 'teams_by_confederation': _index, 'qualified_teams': list},
+    'players': {'players_data': dict, 'players_by_team': _index, 'players_by_position': _index},
+    'matches': {'matches_data': dict, 'matches_by_team': _index},
+    'match_history': {'match_history': list, 'history_by_team': _index, 'history_by_pair': _index,
+                      'head_to_head_tallies': dict, 'team_records': lambda: defaultdict(_team_record)},
+    'match_events': {'match_events': list, 'events_by_match': _index,
+                     'events_by_match_phase': _index, 'events_by_type': _index},
+    'player_events': {'player_events': list, 'player_events_by_player': _index,
+                      'player_events_by_type': _index, 'player_event_counts': lambda: defaultdict(Counter)},
+    'qualification': {'qualification_data': dict, 'qualification_by_status': lambda: defaultdict(dict)},
+    'confederation_formats': {'confederation_formats': dict},
+}
+
+_DATASET_BY_ATTRIBUTE = {attr: name for name, attrs in DATASETS.items() for attr in attrs}
+
+# Sample teams present only as the teams of sample players; analyses of the
+# other samples, such as qualification, leave them out
+PLAYER_SAMPLE_TEAMS = {'POR'}
+
+
+def team_pair(team1_code, team2_code):
+    """Get the unordered-pair key of two teams: their codes in sorted order."""
+    return (team1_code, team2_code) if team1_code <= team2_code else (team2_code, team1_code)
+
+
+def match_outcome(match):
+    """Get the winner of a result (None for a draw) and the penalty shootout winner, if any.
+
+    Equal scores are a draw even when 'winner' names the team that won the
+    shootout; 'winner' decides the result only when scores are missing.
+    """
+    score1, score2 = match.get('score1'), match.get('score2')
+    if score1 is None or score2 is None:
+        return match.get('winner'), None
+    if score1 > score2:
+        return match['team1'], None
+    if score2 > score1:
+        return match['team2'], None
+    return None, match.get('winner')
+
+
+def get_data_store(data_dir='../../data'):
+    """Get the shared data store for a data directory; its datasets load on first use."""
+    key = str(Path(data_dir).resolve())
+    if key not in _stores:
+        _stores[key] = DataStore(data_dir)
+    return _stores[key]
+
+
+class DataStore:
+    """Class holding World Cup data with indexes keyed by team, confederation, player, match and event type.
+
+    Datasets are loaded lazily: teams_data, matches_data, match_events and the
+    other attributes listed in DATASETS are filled in on first access.
+    """
+
+    def __init__(self, data_dir='../../data', load=True):
+        """Initialize the DataStore with data directory path, optionally leaving it empty."""
+        self.data_dir = Path(data_dir)
+        self._loaded = set()
+        self._uses_sample = None
+        self._event_table = None
+        self._rating_engine = None
+        self._scoreline_model = None
+        self._scoreline_version = None
+        self._leaderboards = None
+
+        # Incremented whenever teams or qualification data change, so that
+        # cached qualification aggregates know when to rebuild
+        self.qualification_version = 0
+
+        # Incremented whenever a match is added or replaced, so that the
+        # scoreline model knows when to refit
+        self.matches_version = 0
+
+        # Objects mirroring the data, such as SQLite stores; every add_* and
+        # set_* change is passed on to their method of the same name
+        self.listeners = []
+
+        if not load:
+            for name in DATASETS:
+                self._init_dataset(name)
+
+    def __getattr__(self, attr):
+        """Load the dataset owning a data or index attribute on first access."""
+        name = _DATASET_BY_ATTRIBUTE.get(attr)
+        if name is None or attr.startswith('_'):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+        self.load_dataset(name)
+        return self.__dict__[attr]
+
+    def _notify(self, method, *args):
+        """Pass a change on to every listener."""
+        for listener in self.listeners:
+            getattr(listener, method)(*args)
+
+    def _init_dataset(self, name):
+        """Create the empty data and index attributes of a dataset and mark it loaded."""
+        for attr, factory in DATASETS[name].items():
+            self.__dict__[attr] = factory()
+        self._loaded.add(name)
+
+    def uses_sample_data(self):
+        """Check whether the data directory has no dataset files, so that sample data is used."""
+        if self._uses_sample is None:
+            self._uses_sample = not any(find_dataset_file(self.data_dir, name) for name in DATASETS)
+        return self._uses_sample
+
+    def is_loaded(self, name):
+        """Check whether a dataset has been loaded."""
+        return name in self._loaded
+
+    def load_data(self):
+        """Load all datasets that have not been loaded yet."""
+        for name in DATASETS:
+            self.load_dataset(name)
+
+    def load_dataset(self, name):
+        """Load one dataset and build its indexes, if not loaded yet.
+
+        The dataset is streamed in chunks from <name>.parquet, .jsonl or .csv in
+        the data directory if one exists. If the directory has no dataset files
+        at all, the sample data is used; otherwise a missing file leaves the
+        dataset empty, so that real data is never mixed with sample records.
+        """
+        if name in self._loaded:
+            return
+        self._init_dataset(name)
+
+        path = find_dataset_file(self.data_dir, name)
+        if path is None:
+            if self.uses_sample_data():
+                sample = _sample_data()[name]
+                self._add_records(name, sample.items() if SCHEMAS[name].get('key') else sample)
+            else:
+                logger.warning("No %s file in %s; loading it as empty", name, self.data_dir)
+            return
+
+        for records in iter_records(path, name):
+            self._add_records(name, records)
+
+    def _add_records(self, name, records):
+        """Add records of a dataset, as (key, record) pairs for keyed datasets."""
+        if name == 'confederation_formats':
+            self.confederation_formats.update(records)
+            return
+
+        add = {
+            'teams': self.add_team,
+            'players': self.add_player,
+            'matches': self.add_match,
+            'qualification': self.set_qualification,
+            'match_history': self.add_historical_match,
+            'match_events': self.add_match_event,
+            'player_events': self.add_player_event,
+        }[name]
+        if SCHEMAS[name].get('key'):
+            for key, record in records:
+                add(key, record)
+        else:
+            for record in records:
+                add(record)
+
+    def get_event_table(self):
+        """Get the match events as a columnar EventTable, rebuilding it when events have been added.
+
+        If the events come from a file and have not been loaded as dicts, the
+        table is built straight from the file's columns without creating them.
+        """
+        from event_table import EventTable
+
+        if not self.is_loaded('match_events'):
+            path = find_dataset_file(self.data_dir, 'match_events')
+            if path is not None:
+                if self._event_table is None:
+                    self._event_table = EventTable.from_frame(read_event_frame(path), self.matches_data)
+                return self._event_table
+
+        if self._event_table is None or len(self._event_table) != len(self.match_events):
+            self._event_table = EventTable.from_events(self.match_events, self.matches_data)
+        return self._event_table
+
+    def add_team(self, team_code, team):
+        """Add or replace a team and index it by confederation and qualification."""
+        previous = self.teams_data.get(team_code)
+        if previous is not None:
+            self.teams_by_confederation[previous.get('confederation')].remove(team_code)
+            if previous.get('qualified', False):
+                self.qualified_teams.remove(team_code)
+        self.teams_data[team_code] = team
+        if self._rating_engine is not None:
+            self._rating_engine.add_team(team_code, team.get('ranking'))
+        self.teams_by_confederation[team.get('confederation')].append(team_code)
+        if self._leaderboards is not None:
+            for player_id in self.players_by_team.get(team_code, []):
+                self._update_leaderboards(player_id)
+        if team.get('qualified', False):
+            self.qualified_teams.append(team_code)
+        self.qualification_version += 1
+        self._notify('add_team', team_code, team)
+
+    def add_player(self, player_id, player):
+        """Add or replace a player and index it by team and position."""
+        previous = self.players_data.get(player_id)
+        if previous is not None:
+            self.players_by_team[previous.get('team')].remove(player_id)
+            self.players_by_position[previous.get('position')].remove(player_id)
+        self.players_data[player_id] = player
+        self.players_by_team[player.get('team')].append(player_id)
+        self.players_by_position[player.get('position')].append(player_id)
+        if self._leaderboards is not None:
+            self._update_leaderboards(player_id)
+        self._notify('add_player', player_id, player)
+
+    def add_match(self, match_id, match):
+        """Add or replace a match and index it by both teams."""
+        previous = self.matches_data.get(match_id)
+        if previous is not None:
+            for team in {previous['team1'], previous['team2']}:
+                self.matches_by_team[team].remove(match_id)
+        self.matches_data[match_id] = match
+        self.matches_by_team[match['team1']].append(match_id)
+        if match['team2'] != match['team1']:
+            self.matches_by_team[match['team2']].append(match_id)
+        self.matches_version += 1
+        self._notify('add_match', match_id, match)
+
+    def add_historical_match(self, match):
+        """Add a historical result, index it by both teams and by pair, and update tallies and records."""
+        self.match_history.append(match)
+        self.history_by_team[match['team1']].append(match)
+        if match['team2'] != match['team1']:
+            self.history_by_team[match['team2']].append(match)
+
+        if self._rating_engine is not None:
+            self._rating_engine.update(match)
+
+        # Tallies are [wins of pair[0], wins of pair[1], draws]
+        winner, shootout_winner = match_outcome(match)
+        pair = team_pair(match['team1'], match['team2'])
+        self.history_by_pair[pair].append(match)
+        tallies = self.head_to_head_tallies.setdefault(pair, [0, 0, 0])
+        tallies[0 if winner == pair[0] else 1 if winner == pair[1] else 2] += 1
+
+        sides = [(match['team1'], match.get('score1'), match.get('score2'))]
+        if match['team2'] != match['team1']:
+            sides.append((match['team2'], match.get('score2'), match.get('score1')))
+        for team, goals_for, goals_against in sides:
+            record = self.team_records[team]
+            record['played'] += 1
+            record['goals_for'] += goals_for or 0
+            record['goals_against'] += goals_against or 0
+            if winner is None:
+                record['drawn'] += 1
+                record['form'].append('D')
+                if shootout_winner is not None:
+                    record['shootout_wins' if shootout_winner == team else 'shootout_losses'] += 1
+            elif winner == team:
+                record['won'] += 1
+                record['form'].append('W')
+            else:
+                record['lost'] += 1
+                record['form'].append('L')
+        self._notify('add_historical_match', match)
+
+    def add_match_event(self, event):
+        """Add a match event and index it by match, phase and event type."""
+        self.match_events.append(event)
+        self.events_by_match[event['match_id']].append(event)
+        self.events_by_match_phase[(event['match_id'], event['phase'])].append(event)
+        self.events_by_type[event['event_type']].append(event)
+        self._notify('add_match_event', event)
+
+    def add_player_event(self, event):
+        """Add a player event, index it by player and event type, and count it per player and type."""
+        self.player_events.append(event)
+        self.player_events_by_player[event['player_id']].append(event)
+        self.player_events_by_type[event['event_type']].append(event)
+        self.player_event_counts[event['player_id']][event['event_type']] += 1
+        if self._leaderboards is not None and event['event_type'] == 'assist':
+            self._update_leaderboards(event['player_id'])
+        self._notify('add_player_event', event)
+
+    def record_player_event(self, event):
+        """Add a player event from a live match, crediting a goal to the player's total and leaderboards.
+
+        Events loaded with add_player_event are taken to be counted in the
+        players' goal totals already; events recorded here add to them.
+        """
+        player = self.players_data.get(event['player_id'])
+        if player is not None and event['event_type'] == 'goal':
+            player['goals'] = (player.get('goals') or 0) + 1
+        self.add_player_event(event)
+        if player is not None and event['event_type'] == 'goal':
+            if self._leaderboards is not None:
+                self._update_leaderboards(event['player_id'])
+            self._notify('add_player', event['player_id'], player)
+
+    def get_leaderboards(self):
+        """Get the top scorer leaderboards of all players, updated as players and events are added."""
+        if self._leaderboards is None:
+            from leaderboards import Leaderboards
+            assists = {player_id: counts['assist'] for player_id, counts in self.player_event_counts.items()}
+            self._leaderboards = Leaderboards.from_players(self.players_data, self.teams_data, assists)
+        return self._leaderboards
+
+    def _update_leaderboards(self, player_id):
+        """Update a player's place on the leaderboards from their current goals, caps and assists."""
+        player = self.players_data.get(player_id)
+        if player is not None:
+            counts = self.player_event_counts.get(player_id)
+            self._leaderboards.update(player_id, player, self.teams_data, counts['assist'] if counts else 0)
+
+    def get_rating_engine(self):
+        """Get the Elo rating engine built from the match history, updated as results are added."""
+        if self._rating_engine is None:
+            from rating_engine import RatingEngine
+            self._rating_engine = RatingEngine.from_history(self.match_history, self.teams_data)
+        return self._rating_engine
+
+    def get_scoreline_model(self):
+        """Get the scoreline model fitted on the matches, warm-start refitted when matches are added or replaced."""
+        from scoreline_model import ScorelineModel
+
+        matches = list(self.matches_data.values())
+        if self._scoreline_model is None:
+            self._scoreline_model = ScorelineModel().fit(matches, warm_start=False)
+        elif self._scoreline_version != self.matches_version:
+            self._scoreline_model.fit(matches, warm_start=True)
+        self._scoreline_version = self.matches_version
+        return self._scoreline_model
+
+    def set_qualification(self, team_code, qual_data):
+        """Set qualification data for a team and index it by status."""
+        previous = self.qualification_data.get(team_code)
+        if previous is not None:
+            self.qualification_by_status[previous.get('status')].pop(team_code, None)
+        self.qualification_data[team_code] = qual_data
+        self.qualification_by_status[qual_data.get('status')][team_code] = None
+        self.qualification_version += 1
+        self._notify('set_qualification', team_code, qual_data)
+
+
+def _sample_data():
+    """Build the sample datasets used until real data files are available."""
+    teams = {
+        'ARG': {'name': 'Argentina', 'confederation': 'CONMEBOL', 'qualified': True, 'ranking': 1},
+        'BRA': {'name': 'Brazil', 'confederation': 'CONMEBOL', 'qualified': False, 'ranking': 5},
+        'URU': {'name': 'Uruguay', 'confederation': 'CONMEBOL', 'qualified': False, 'ranking': 15},
+        'COL': {'name': 'Colombia', 'confederation': 'CONMEBOL', 'qualified': False, 'ranking': 12},
+        'CAN': {'name': 'Canada', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 43},
+        'MEX': {'name': 'Mexico', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 15},
+        'USA': {'name': 'United States', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 13},
+        'CRC': {'name': 'Costa Rica', 'confederation': 'CONCACAF', 'qualified': False, 'ranking': 52},
+        'JPN': {'name': 'Japan', 'confederation': 'AFC', 'qualified': True, 'ranking': 20},
+        'IRN': {'name': 'IR Iran', 'confederation': 'AFC', 'qualified': True, 'ranking': 22},
+        'KOR': {'name': 'Korea Republic', 'confederation': 'AFC', 'qualified': False, 'ranking': 24},
+        'AUS': {'name': 'Australia', 'confederation': 'AFC', 'qualified': False, 'ranking': 25},
+        'QAT': {'name': 'Qatar', 'confederation': 'AFC', 'qualified': False, 'ranking': 37},
+        'NZL': {'name': 'New Zealand', 'confederation': 'OFC', 'qualified': True, 'ranking': 103},
+        'SOL': {'name': 'Solomon Islands', 'confederation': 'OFC', 'qualified': False, 'ranking': 142},
+        'ENG': {'name': 'England', 'confederation': 'UEFA', 'qualified': False, 'ranking': 4},
+        'FRA': {'name': 'France', 'confederation': 'UEFA', 'qualified': False, 'ranking': 2},
+        'ESP': {'name': 'Spain', 'confederation': 'UEFA', 'qualified': False, 'ranking': 8},
+        'GER': {'name': 'Germany', 'confederation': 'UEFA', 'qualified': False, 'ranking': 16},
+        'ITA': {'name': 'Italy', 'confederation': 'UEFA', 'qualified': False, 'ranking': 9},
+        'POR': {'name': 'Portugal', 'confederation': 'UEFA', 'qualified': False, 'ranking': 6},
+        'EGY': {'name': 'Egypt', 'confederation': 'CAF', 'qualified': False, 'ranking': 36},
+        'SEN': {'name': 'Senegal', 'confederation': 'CAF', 'qualified': False, 'ranking': 18},
+        'MAR': {'name': 'Morocco', 'confederation': 'CAF', 'qualified': False, 'ranking': 13},
+        'NGA': {'name': 'Nigeria', 'confederation': 'CAF', 'qualified': False, 'ranking': 30}
+    }
+
+    players = {
+        'P001': {'name': 'Lionel Messi', 'team': 'ARG', 'position': 'Forward', 'age': 37, 'caps': 180, 'goals': 106},
+        'P002': {'name': 'Cristiano Ronaldo', 'team': 'POR', 'position': 'Forward', 'age': 40, 'caps': 206, 'goals': 128},
+        'P003': {'name': 'Kylian Mbappé', 'team': 'FRA', 'position': 'Forward', 'age': 26, 'caps': 76, 'goals': 46},
+        'P004': {'name': 'Alphonso Davies', 'team': 'CAN', 'position': 'Defender', 'age': 24, 'caps': 44, 'goals': 14},
+        'P005': {'name': 'Christian Pulisic', 'team': 'USA', 'position': 'Midfielder', 'age': 26, 'caps': 64, 'goals': 27},
+        'P006': {'name': 'Hirving Lozano', 'team': 'MEX', 'position': 'Forward', 'age': 29, 'caps': 67, 'goals': 18},
+        'P007': {'name': 'Almoez Ali', 'team': 'QAT', 'position': 'Forward', 'age': 28, 'caps': 85, 'goals': 42},
+        'P008': {'name': 'Mohamed Salah', 'team': 'EGY', 'position': 'Forward', 'age': 33, 'caps': 93, 'goals': 54},
+        'P009': {'name': 'Takumi Minamino', 'team': 'JPN', 'position': 'Midfielder', 'age': 30, 'caps': 56, 'goals': 21},
+        'P010': {'name': 'Mehdi Taremi', 'team': 'IRN', 'position': 'Forward', 'age': 32, 'caps': 73, 'goals': 45},
+    }
+
+    matches = {
+        'M001': {
+            'team1': 'ARG', 'team2': 'BRA',
+            'score1': 2, 'score2': 1,
+            'date': '2024-11-15',
+            'tournament': 'World Cup Qualifier',
+            'stage': 'CONMEBOL Qualifier'
+        },
+        'M002': {
+            'team1': 'FRA', 'team2': 'ENG',
+            'score1': 3, 'score2': 2,
+            'date': '2024-10-12',
+            'tournament': 'UEFA Nations League',
+            'stage': 'Group Stage'
+        },
+        'M003': {
+            'team1': 'USA', 'team2': 'MEX',
+            'score1': 2, 'score2': 0,
+            'date': '2024-09-07',
+            'tournament': 'CONCACAF Nations League',
+            'stage': 'Final'
+        },
+        'M004': {
+            'team1': 'QAT', 'team2': 'IRN',
+            'score1': 3, 'score2': 1,
+            'date': '2024-11-20',
+            'tournament': 'World Cup Qualifier',
+            'stage': 'AFC Qualifier'
+        },
+        'M005': {
+            'team1': 'EGY', 'team2': 'SEN',
+            'score1': 1, 'score2': 1,
+            'date': '2024-10-09',
+            'tournament': 'World Cup Qualifier',
+            'stage': 'CAF Qualifier'
+        },
+        'M006': {
+            'team1': 'JPN', 'team2': 'KOR',
+            'score1': 2, 'score2': 2,
+            'date': '2024-11-18',
+            'tournament': 'World Cup Qualifier',
+            'stage': 'AFC Qualifier'
+        }
+    }
+
+    match_history = [
+        {'team1': 'ARG', 'team2': 'FRA', 'score1': 3, 'score2': 3, 'winner': 'ARG', 'tournament': 'World Cup 2022', 'stage': 'Final'},
+        {'team1': 'ARG', 'team2': 'BRA', 'score1': 1, 'score2': 0, 'winner': 'ARG', 'tournament': 'Copa America 2021', 'stage': 'Final'},
+        {'team1': 'ENG', 'team2': 'FRA', 'score1': 1, 'score2': 2, 'winner': 'FRA', 'tournament': 'World Cup 2022', 'stage': 'Quarter-final'},
+        {'team1': 'USA', 'team2': 'MEX', 'score1': 2, 'score2': 0, 'winner': 'USA', 'tournament': 'CONCACAF Nations League 2023', 'stage': 'Final'},
+        {'team1': 'JPN', 'team2': 'IRN', 'score1': 3, 'score2': 0, 'winner': 'JPN', 'tournament': 'Asian Cup 2023', 'stage': 'Semi-final'},
+    ]
+
+    match_events = [
+        # Match M001 (ARG vs BRA)
+        {'match_id': 'M001', 'team': 'ARG', 'event_type': 'goal', 'player': 'Messi', 'minute': 23, 'phase': '16-30'},
+        {'match_id': 'M001', 'team': 'BRA', 'event_type': 'goal', 'player': 'Vinicius', 'minute': 45, 'phase': '31-45'},
+        {'match_id': 'M001', 'team': 'ARG', 'event_type': 'goal', 'player': 'Martinez', 'minute': 78, 'phase': '61-90'},
+        {'match_id': 'M001', 'team': 'ARG', 'event_type': 'yellow_card', 'player': 'De Paul', 'minute': 34, 'phase': '31-45'},
+        {'match_id': 'M001', 'team': 'BRA', 'event_type': 'yellow_card', 'player': 'Casemiro', 'minute': 56, 'phase': '46-60'},
+
+        # Match M002 (FRA vs ENG)
+        {'match_id': 'M002', 'team': 'FRA', 'event_type': 'goal', 'player': 'Mbappé', 'minute': 12, 'phase': '0-15'},
+        {'match_id': 'M002', 'team': 'ENG', 'event_type': 'goal', 'player': 'Kane', 'minute': 27, 'phase': '16-30'},
+        {'match_id': 'M002', 'team': 'FRA', 'event_type': 'goal', 'player': 'Griezmann', 'minute': 43, 'phase': '31-45'},
+        {'match_id': 'M002', 'team': 'ENG', 'event_type': 'goal', 'player': 'Bellingham', 'minute': 58, 'phase': '46-60'},
+        {'match_id': 'M002', 'team': 'FRA', 'event_type': 'goal', 'player': 'Mbappé', 'minute': 82, 'phase': '61-90'},
+
+        # Match M003 (USA vs MEX)
+        {'match_id': 'M003', 'team': 'USA', 'event_type': 'goal', 'player': 'Pulisic', 'minute': 36, 'phase': '31-45'},
+        {'match_id': 'M003', 'team': 'USA', 'event_type': 'goal', 'player': 'Weah', 'minute': 67, 'phase': '61-90'},
+        {'match_id': 'M003', 'team': 'MEX', 'event_type': 'yellow_card', 'player': 'Alvarez', 'minute': 42, 'phase': '31-45'},
+        {'match_id': 'M003', 'team': 'USA', 'event_type': 'yellow_card', 'player': 'Adams', 'minute': 51, 'phase': '46-60'},
+
+        # Match M004 (QAT vs IRN)
+        {'match_id': 'M004', 'team': 'QAT', 'event_type': 'goal', 'player': 'Ali', 'minute': 5, 'phase': '0-15'},
+        {'match_id': 'M004', 'team': 'QAT', 'event_type': 'goal', 'player': 'Ali', 'minute': 34, 'phase': '31-45'},
+        {'match_id': 'M004', 'team': 'IRN', 'event_type': 'goal', 'player': 'Taremi', 'minute': 52, 'phase': '46-60'},
+        {'match_id': 'M004', 'team': 'QAT', 'event_type': 'goal', 'player': 'Afif', 'minute': 88, 'phase': '61-90'},
+
+        # Match M005 (EGY vs SEN)
+        {'match_id': 'M005', 'team': 'EGY', 'event_type': 'goal', 'player': 'Salah', 'minute': 45, 'phase': '31-45'},
+        {'match_id': 'M005', 'team': 'SEN', 'event_type': 'goal', 'player': 'Mané', 'minute': 76, 'phase': '61-90'},
+
+        # Match M006 (JPN vs KOR)
+        {'match_id': 'M006', 'team': 'JPN', 'event_type': 'goal', 'player': 'Minamino', 'minute': 22, 'phase': '16-30'},
+        {'match_id': 'M006', 'team': 'KOR', 'event_type': 'goal', 'player': 'Son', 'minute': 39, 'phase': '31-45'},
+        {'match_id': 'M006', 'team': 'JPN', 'event_type': 'goal', 'player': 'Kamada', 'minute': 61, 'phase': '61-90'},
+        {'match_id': 'M006', 'team': 'KOR', 'event_type': 'goal', 'player': 'Hwang', 'minute': 84, 'phase': '61-90'}
+    ]
+
+    player_events = [
+        {'match_id': 'M001', 'player_id': 'P001', 'event_type': 'goal', 'minute': 23},
+        {'match_id': 'M001', 'player_id': 'P001', 'event_type': 'assist', 'minute': 64},
+        {'match_id': 'M002', 'player_id': 'P003', 'event_type': 'goal', 'minute': 12},
+        {'match_id': 'M002', 'player_id': 'P003', 'event_type': 'goal', 'minute': 78},
+        {'match_id': 'M003', 'player_id': 'P005', 'event_type': 'assist', 'minute': 56},
+        {'match_id': 'M004', 'player_id': 'P007', 'event_type': 'goal', 'minute': 34},
+        {'match_id': 'M004', 'player_id': 'P007', 'event_type': 'goal', 'minute': 67},
+        {'match_id': 'M005', 'player_id': 'P008', 'event_type': 'goal', 'minute': 45},
+        {'match_id': 'M006', 'player_id': 'P010', 'event_type': 'goal', 'minute': 22},
+        {'match_id': 'M006', 'player_id': 'P010', 'event_type': 'assist', 'minute': 51},
+    ]
+
+    qualification = {
+        'ARG': {'matches_played': 8, 'wins': 6, 'draws': 1, 'losses': 1, 'goals_for': 16, 'goals_against': 5, 'points': 19, 'status': 'qualified'},
+        'BRA': {'matches_played': 8, 'wins': 4, 'draws': 2, 'losses': 2, 'goals_for': 12, 'goals_against': 7, 'points': 14, 'status': 'in_progress'},
+        'URU': {'matches_played': 8, 'wins': 4, 'draws': 1, 'losses': 3, 'goals_for': 11, 'goals_against': 9, 'points': 13, 'status': 'in_progress'},
+        'COL': {'matches_played': 8, 'wins': 3, 'draws': 3, 'losses': 2, 'goals_for': 9, 'goals_against': 8, 'points': 12, 'status': 'in_progress'},
+        'JPN': {'matches_played': 6, 'wins': 6, 'draws': 0, 'losses': 0, 'goals_for': 15, 'goals_against': 2, 'points': 18, 'status': 'qualified'},
+        'IRN': {'matches_played': 6, 'wins': 5, 'draws': 1, 'losses': 0, 'goals_for': 12, 'goals_against': 3, 'points': 16, 'status': 'qualified'},
+        'KOR': {'matches_played': 6, 'wins': 3, 'draws': 2, 'losses': 1, 'goals_for': 8, 'goals_against': 5, 'points': 11, 'status': 'in_progress'},
+        'AUS': {'matches_played': 6, 'wins': 3, 'draws': 1, 'losses': 2, 'goals_for': 9, 'goals_against': 7, 'points': 10, 'status': 'in_progress'},
+        'QAT': {'matches_played': 6, 'wins': 2, 'draws': 1, 'losses': 3, 'goals_for': 7, 'goals_against': 8, 'points': 7, 'status': 'in_progress'},
+        'NZL': {'matches_played': 4, 'wins': 4, 'draws': 0, 'losses': 0, 'goals_for': 12, 'goals_against': 1, 'points': 12, 'status': 'qualified'},
+        'SOL': {'matches_played': 4, 'wins': 2, 'draws': 0, 'losses': 2, 'goals_for': 5, 'goals_against': 7, 'points': 6, 'status': 'eliminated'},
+        'ENG': {'matches_played': 4, 'wins': 3, 'draws': 1, 'losses': 0, 'goals_for': 10, 'goals_against': 2, 'points': 10, 'status': 'in_progress'},
+        'FRA': {'matches_played': 4, 'wins': 3, 'draws': 0, 'losses': 1, 'goals_for': 8, 'goals_against': 3, 'points': 9, 'status': 'in_progress'},
+        'ESP': {'matches_played': 4, 'wins': 2, 'draws': 2, 'losses': 0, 'goals_for': 7, 'goals_against': 2, 'points': 8, 'status': 'in_progress'},
+        'GER': {'matches_played': 4, 'wins': 2, 'draws': 1, 'losses': 1, 'goals_for': 8, 'goals_against': 4, 'points': 7, 'status': 'in_progress'},
+        'ITA': {'matches_played': 4, 'wins': 2, 'draws': 1, 'losses': 1, 'goals_for': 6, 'goals_against': 4, 'points': 7, 'status': 'in_progress'},
+        'EGY': {'matches_played': 4, 'wins': 2, 'draws': 2, 'losses': 0, 'goals_for': 6, 'goals_against': 1, 'points': 8, 'status': 'in_progress'},
+        'SEN': {'matches_played': 4, 'wins': 2, 'draws': 1, 'losses': 1, 'goals_for': 5, 'goals_against': 3, 'points': 7, 'status': 'in_progress'},
+        'MAR': {'matches_played': 4, 'wins': 3, 'draws': 0, 'losses': 1, 'goals_for': 8, 'goals_against': 2, 'points': 9, 'status': 'in_progress'},
+        'NGA': {'matches_played': 4, 'wins': 2, 'draws': 0, 'losses': 2, 'goals_for': 5, 'goals_against': 4, 'points': 6, 'status': 'in_progress'}
+    }
+
+    confederation_formats = {
+        'UEFA': {
+            'total_slots': 16,
+            'direct_slots': 16,
+            'playoff_slots': 0,
+            'format': '12 groups of 4-5 teams, group winners qualify directly, best runners-up enter playoffs'
+        },
+        'CONMEBOL': {
+            'total_slots': 6,
+            'direct_slots': 6,
+            'playoff_slots': 1,
+            'format': 'Single round-robin league, top 6 teams qualify directly'
+        },
+        'CONCACAF': {
+            'total_slots': 6,
+            'direct_slots': 6,
+            'playoff_slots': 2,
+            'format': 'Three rounds: First round (30 teams), Second round (8 groups of 4), Final round (8 teams)'
+        },
+        'AFC': {
+            'total_slots': 8,
+            'direct_slots': 8,
+            'playoff_slots': 1,
+            'format': 'Three rounds: First round (22 teams), Second round (9 groups of 4), Final round (3 groups of 6)'
+        },
+        'CAF': {
+            'total_slots': 9,
+            'direct_slots': 9,
+            'playoff_slots': 1,
+            'format': 'First round (28 teams), Second round (9 groups of 6), group winners qualify'
+        },
+        'OFC': {
+            'total_slots': 1,
+            'direct_slots': 1,
+            'playoff_slots': 1,
+            'format': 'Group stage followed by knockout rounds'
+        }
+    }
+
+    return {
+        'teams': teams,
+        'players': players,
+        'matches': matches,
+        'match_history': match_history,
+        'match_events': match_events,
+        'player_events': player_events,
+        'qualification': qualification,
+        'confederation_formats': confederation_formats
+    }
@@ -0,0 +1,264 @@
+"""
+Columnar Event Table for FIFA World Cup 2026
+
+This module provides a NumPy-backed columnar representation of match events.
+Teams, event types, phases and players are stored as categorical codes and
+rows are sorted by (match_id, minute), so that phase breakdowns and momentum
+can be computed as vectorized group-bys instead of Python loops.
+"""
+
+import numpy as np
+import pandas as pd
+
+PHASES = ['0-15', '16-30', '31-45', '46-60', '61-90']
+
+# Momentum contribution of an event for the team that produced it
+GOAL_MOMENTUM = 2.0
+CARD_MOMENTUM = -0.5
+
+
+class EventTable:
+    """Class holding match events as categorical-coded NumPy columns sorted by match and minute."""
+
+    def __init__(self, match_ids, teams, event_types, players, phases,
+                 match_codes, team_codes, event_type_codes, player_codes, phase_codes,
+                 minutes, sides, positions):
+        """Initialize the EventTable from category labels and sorted code columns."""
+        # Category labels (codes index into these)
+        self.match_ids = match_ids
+        self.teams = teams
+        self.event_types = event_types
+        self.players = players
+        self.phases = phases
+
+        # Columns, one entry per event
+        self.match_codes = match_codes
+        self.team_codes = team_codes
+        self.event_type_codes = event_type_codes
+        self.player_codes = player_codes
+        self.phase_codes = phase_codes
+        self.minutes = minutes
+        self.sides = sides  # 0 = team1, 1 = team2, -1 = neither
+        self.positions = positions  # position of each event in the input, before sorting
+
+        # Row offsets of each match (rows of match i are offsets[i]:offsets[i + 1])
+        counts = np.bincount(match_codes, minlength=len(match_ids))
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self._match_index = {match_id: i for i, match_id in enumerate(match_ids)}
+
+        # Per-category flags used by the group-bys
+        self.is_goal = np.array([t == 'goal' for t in event_types], dtype=bool)[event_type_codes]
+        self.is_card = np.array(['card' in t for t in event_types], dtype=bool)[event_type_codes]
+
+    @classmethod
+    def from_events(cls, events, matches_data, phases=PHASES):
+        """Build an EventTable from a list of event dicts and the matches they belong to."""
+        frame = pd.DataFrame({
+            'match_id': pd.Series([e['match_id'] for e in events], dtype=object),
+            'team': pd.Series([e['team'] for e in events], dtype=object),
+            'event_type': pd.Series([e['event_type'] for e in events], dtype=object),
+            'player': pd.Series([e.get('player') for e in events], dtype=object),
+            'phase': pd.Series([e['phase'] for e in events], dtype=object),
+            'minute': np.array([e['minute'] for e in events], dtype=np.int16)
+        })
+        return cls.from_frame(frame, matches_data, phases)
+
+    @classmethod
+    def from_frame(cls, frame, matches_data, phases=PHASES):
+        """Build an EventTable from a DataFrame of events, such as data_loaders.read_event_frame output.
+
+        Text columns may be plain or categorical; categoricals are factorized
+        from their existing codes without touching the strings of every row.
+        """
+        match_codes, match_ids = pd.factorize(frame['match_id'], sort=True)
+        team_codes, teams = pd.factorize(frame['team'])
+        event_type_codes, event_types = pd.factorize(frame['event_type'])
+        player_codes, players = pd.factorize(frame['player'])
+        phase_codes = pd.Categorical(frame['phase'], categories=phases).codes
+        minutes = frame['minute'].to_numpy(dtype=np.int16)
+        n_events = len(frame)
+
+        # Side of each event relative to its match (team1 or team2)
+        teams = list(teams)
+        team_lookup = {team: i for i, team in enumerate(teams)}
+        match_team1 = np.array([team_lookup.get(matches_data.get(mid, {}).get('team1'), -1)
+                                for mid in match_ids], dtype=np.int32)
+        match_team2 = np.array([team_lookup.get(matches_data.get(mid, {}).get('team2'), -1)
+                                for mid in match_ids], dtype=np.int32)
+        sides = np.full(n_events, -1, dtype=np.int8)
+        sides[team_codes == match_team1[match_codes]] = 0
+        sides[team_codes == match_team2[match_codes]] = 1
+
+        # Sort rows by (match_id, minute), keeping the original order for ties
+        order = np.lexsort((minutes, match_codes))
+
+        return cls(
+            match_ids=list(match_ids),
+            teams=teams,
+            event_types=list(event_types),
+            players=list(players),
+            phases=list(phases),
+            match_codes=match_codes[order].astype(np.int32),
+            team_codes=team_codes[order].astype(np.int16),
+            event_type_codes=event_type_codes[order].astype(np.int8),
+            player_codes=player_codes[order].astype(np.int32),
+            phase_codes=phase_codes[order].astype(np.int8),
+            minutes=minutes[order],
+            sides=sides[order],
+            positions=order.astype(np.int32)
+        )
+
+    def __len__(self):
+        """Get the number of events in the table."""
+        return len(self.match_codes)
+
+    @property
+    def nbytes(self):
+        """Get the memory used by the event columns in bytes."""
+        columns = [self.match_codes, self.team_codes, self.event_type_codes,
+                   self.player_codes, self.phase_codes, self.minutes, self.sides, self.positions]
+        return sum(column.nbytes for column in columns)
+
+    def match_position(self, match_id):
+        """Get the position of a match along the match axis, or None if it has no events."""
+        return self._match_index.get(match_id)
+
+    def match_slice(self, match_id):
+        """Get the row slice holding the events of a match."""
+        i = self.match_position(match_id)
+        if i is None:
+            return slice(0, 0)
+        return slice(self.offsets[i], self.offsets[i + 1])
+
+    def phase_events(self, match_id):
+        """Get the events of a match as event dicts, in one list per phase in their input order."""
+        match_rows = self.match_slice(match_id)
+        rows = np.arange(match_rows.start, match_rows.stop)[np.argsort(self.positions[match_rows], kind='stable')]
+        by_phase = [[] for _ in self.phases]
+        columns = zip(self.team_codes[rows].tolist(), self.event_type_codes[rows].tolist(),
+                      self.player_codes[rows].tolist(), self.minutes[rows].tolist(),
+                      self.phase_codes[rows].tolist())
+        for team, event_type, player, minute, phase in columns:
+            if phase < 0:
+                continue
+            event = {'match_id': match_id, 'team': self.teams[team], 'event_type': self.event_types[event_type],
+                     'minute': minute, 'phase': self.phases[phase]}
+            if player >= 0:
+                event['player'] = self.players[player]
+            by_phase[phase].append(event)
+        return by_phase
+
+    def phase_counts(self, match_id=None):
+        """Count events, goals and cards per match, phase and side in one vectorized pass.
+
+        Returns a dict of arrays: 'events' has shape (matches, phases) and
+        'goals' and 'cards' have shape (matches, phases, 2) for team1 and team2.
+        If match_id is given, only that match is counted and matches is 1.
+        """
+        if match_id is None:
+            rows = slice(None)
+            n_matches = len(self.match_ids)
+            match_codes = self.match_codes.astype(np.int64)
+        else:
+            rows = self.match_slice(match_id)
+            n_matches = 1
+            match_codes = np.zeros(rows.stop - rows.start, dtype=np.int64)
+
+        n_phases = len(self.phases)
+        phase_codes = self.phase_codes[rows]
+        sides = self.sides[rows]
+        in_phase = phase_codes >= 0
+        cell = match_codes * n_phases + phase_codes
+
+        events = np.bincount(cell[in_phase], minlength=n_matches * n_phases)
+
+        on_side = in_phase & (sides >= 0)
+        side_cell = cell * 2 + sides
+        goals = np.bincount(side_cell[on_side & self.is_goal[rows]], minlength=n_matches * n_phases * 2)
+        cards = np.bincount(side_cell[on_side & self.is_card[rows]], minlength=n_matches * n_phases * 2)
+
+        return {
+            'events': events.reshape(n_matches, n_phases),
+            'goals': goals.reshape(n_matches, n_phases, 2),
+            'cards': cards.reshape(n_matches, n_phases, 2)
+        }
+
+    def momentum_deltas(self, rows=slice(None)):
+        """Get the momentum change of each event (positive = team1 advantage)."""
+        # Events not credited to team1 count against team2
+        sign = np.where(self.sides[rows] == 0, 1.0, -1.0)
+        return sign * (GOAL_MOMENTUM * self.is_goal[rows] + CARD_MOMENTUM * self.is_card[rows])
+
+    def cumulative_momentum(self):
+        """Get the running momentum after each event, restarting at zero for every match."""
+        deltas = self.momentum_deltas()
+        running = np.cumsum(deltas)
+        starts = self.offsets[:-1]
+        counts = np.diff(self.offsets)
+        # Subtract the running total reached before each match begins
+        baseline = np.zeros(len(starts))
+        nonempty = counts > 0
+        baseline[nonempty] = running[starts[nonempty]] - deltas[starts[nonempty]]
+        return running - np.repeat(baseline, counts)
+
+    def _match_rows(self, match_ids):
+        """Map match ids to rows of their distinct ids, which may repeat.
+
+        Returns each event's row among the distinct ids (-1 if not selected),
+        the number of distinct ids and the distinct row of every given id.
+        """
+        distinct = {}
+        inverse = np.array([distinct.setdefault(match_id, len(distinct)) for match_id in match_ids],
+                           dtype=np.int64)
+        out_row = np.full(len(self.match_ids), -1, dtype=np.int64)
+        for match_id, row in distinct.items():
+            i = self.match_position(match_id)
+            if i is not None:
+                out_row[i] = row
+        return out_row[self.match_codes], len(distinct), inverse
+
+    def momentum_curves(self, match_ids=None):
+        """Get the event-level momentum curves of many matches at once.
+
+        Returns a dict with 'match_ids', flat 'minutes' and 'momentum' arrays
+        holding the running momentum after each event, and 'offsets' such that
+        the events of match_ids[k] are at offsets[k]:offsets[k + 1].
+        """
+        if match_ids is None:
+            match_ids = self.match_ids
+        event_rows, n_distinct, inverse = self._match_rows(match_ids)
+        selected = event_rows >= 0
+
+        # Rows are already sorted by (match, minute); order the selection by distinct row
+        order = np.argsort(event_rows[selected], kind='stable')
+        distinct_counts = np.bincount(event_rows[selected], minlength=n_distinct)
+        distinct_offsets = np.concatenate(([0], np.cumsum(distinct_counts)))
+
+        # Repeat the events of ids given more than once
+        counts = distinct_counts[inverse]
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        events = np.repeat(distinct_offsets[:-1][inverse] - offsets[:-1], counts) + np.arange(offsets[-1])
+
+        return {
+            'match_ids': list(match_ids),
+            'offsets': offsets,
+            'minutes': self.minutes[selected][order][events],
+            'momentum': self.cumulative_momentum()[selected][order][events]
+        }
+
+    def momentum_grid(self, match_ids=None, max_minute=90):
+        """Get momentum resampled to a per-minute grid for many matches at once.
+
+        Returns an array of shape (len(match_ids), max_minute + 1) whose entry
+        [k, t] is the momentum of match_ids[k] after all events up to minute t.
+        Events after max_minute (such as stoppage time) fall in the last minute.
+        """
+        if match_ids is None:
+            match_ids = self.match_ids
+        event_rows, n_distinct, inverse = self._match_rows(match_ids)
+        selected = event_rows >= 0
+
+        grid = np.zeros((n_distinct, max_minute + 1))
+        minutes = np.clip(self.minutes[selected], 0, max_minute)
+        np.add.at(grid, (event_rows[selected], minutes), self.momentum_deltas()[selected])
+        return np.cumsum(grid, axis=1)[inverse]
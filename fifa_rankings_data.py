@@ -1,19 +1,28 @@
 """
 FIFA Rankings Data Collection for UEFA and CONCACAF Teams
-This script collects and processes FIFA ranking data for top UEFA and CONCACAF teams
+This module collects and processes FIFA ranking data for top UEFA and CONCACAF teams
 for visualization in an interactive chart.
+
+Importing the module has no side effects: build_ranking_history() runs the
+pipeline in memory and only writes files when given an output directory, and
+get_ranking_history() keeps one in-memory copy per process. Running the module
+as a script writes data/fifa_rankings_history.parquet (plus a CSV copy for
+compatibility), data/team_info.json and the data/fifa_rank_matrix.npy rank
+matrix, which RankMatrix.load() opens memory-mapped so that worker processes
+share one copy.
+
+The Parquet and Feather files store team names, codes and confederations as
+dictionary-encoded categoricals and dates as typed timestamps; read_rankings()
+loads only the requested columns and teams. They require pyarrow.
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import requests
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 import json
 import os
 
-# Create directories for data storage
-os.makedirs('data', exist_ok=True)
+import numpy as np
+import pandas as pd
 
 # Define the teams we want to track (top UEFA and CONCACAF teams)
 uefa_teams = [
@@ -45,87 +54,309 @@ concacaf_teams = [
 # Combine all teams
 all_teams = uefa_teams + concacaf_teams
 
+# Columns repeated on every row of a team, stored as categoricals in columnar files
+CATEGORICAL_COLUMNS = ["team_name", "team_code", "confederation"]
+
+# Ranking history file extension per supported format
+HISTORY_FORMATS = {"parquet": ".parquet", "feather": ".feather", "csv": ".csv"}
+
+# Base rankings (approximate starting points based on current FIFA rankings)
+base_rankings = {
+    "ESP": 2, "FRA": 3, "ENG": 4, "NED": 6, "POR": 7, "BEL": 8, "ITA": 9, "GER": 10,
+    "CRO": 11, "SUI": 20, "DEN": 21, "AUT": 22, "USA": 16, "MEX": 17, "CAN": 45,
+    "CRC": 50, "JAM": 55, "HON": 80, "PAN": 85, "SLV": 90
+}
+
 # Generate historical ranking data (simulated for demonstration)
 # In a real scenario, this would be fetched from an API or database
-def generate_historical_rankings():
+def generate_historical_rankings(teams=None, base_rankings=base_rankings,
+                                 start='2023-01-01', end='2025-06-01', seed=None):
+    """Generate monthly ranking history for teams (all tracked teams by default).
+    
+    The whole team x month grid is computed as NumPy arrays; pass seed for
+    reproducible output.
+    """
+    if teams is None:
+        teams = all_teams
+    rng = np.random.default_rng(seed)
+    
     # Time periods (months from 2023 to 2025)
-    months = pd.date_range(start='2023-01-01', end='2025-06-01', freq='MS')
+    months = pd.date_range(start=start, end=end, freq='MS')
+    n_teams, n_months = len(teams), len(months)
     
-    rankings_data = []
+    base_rank = np.array([base_rankings[team["code"]] for team in teams], dtype=float)
     
-    # Base rankings (approximate starting points based on current FIFA rankings)
-    base_rankings = {
-        "ESP": 2, "FRA": 3, "ENG": 4, "NED": 6, "POR": 7, "BEL": 8, "ITA": 9, "GER": 10,
-        "CRO": 11, "SUI": 20, "DEN": 21, "AUT": 22, "USA": 16, "MEX": 17, "CAN": 45,
-        "CRC": 50, "JAM": 55, "HON": 80, "PAN": 85, "SLV": 90
-    }
+    # Teams with higher base rankings have less volatility
+    volatility = np.where(base_rank > 30, 5, np.where(base_rank > 10, 3, 2))
     
-    # Generate data for each team over time
-    for team in all_teams:
-        base_rank = base_rankings[team["code"]]
-        
-        for date in months:
-            # Add some random variation to create realistic ranking changes
-            # Teams with higher base rankings have less volatility
-            volatility = 5 if base_rank > 30 else 3 if base_rank > 10 else 2
-            
-            # Trend component - slight improvement for most teams over time
-            trend = -0.5 * (date - months[0]).days / 30  # negative because lower rank is better
-            
-            # Random component
-            random_change = np.random.normal(0, volatility)
-            
-            # Calculate rank for this month (ensure it's at least 1)
-            rank = max(1, int(base_rank + trend + random_change))
-            
-            # Add entry to data
-            rankings_data.append({
-                "team_name": team["name"],
-                "team_code": team["code"],
-                "confederation": team["confederation"],
-                "date": date.strftime('%Y-%m'),
-                "rank": rank,
-                "qualified": team.get("qualified", False),
-                "host": team.get("host", False)
-            })
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(rankings_data)
-    return df
-
-# Generate the data
-rankings_df = generate_historical_rankings()
-
-# Save to CSV
-rankings_df.to_csv('data/fifa_rankings_history.csv', index=False)
-
-# Create a JSON file with team information for the visualization
-team_info = []
-for team in all_teams:
-    status = "Host" if team.get("host", False) else "Qualified" if team["qualified"] else "Potential"
-    
-    # Get latest rank and convert numpy.int64 to regular int for JSON serialization
-    latest_rank = rankings_df[(rankings_df["team_code"] == team["code"]) & 
-                             (rankings_df["date"] == rankings_df["date"].max())]["rank"].values[0]
-    
-    # Convert numpy.int64 to regular int
-    latest_rank = int(latest_rank)
-    
-    team_info.append({
-        "name": team["name"],
-        "code": team["code"],
-        "confederation": team["confederation"],
-        "status": status,
-        "latest_rank": latest_rank
+    # Trend component - slight improvement for most teams over time
+    trend = -0.5 * (months - months[0]).days.to_numpy() / 30  # negative because lower rank is better
+    
+    # Random component, one draw per team and month
+    random_change = rng.normal(0, 1, size=(n_teams, n_months)) * volatility[:, None]
+    
+    # Calculate rank for each team and month (ensure it's at least 1)
+    ranks = np.maximum(1, (base_rank[:, None] + trend[None, :] + random_change).astype(int))
+    
+    # Build the DataFrame directly from the arrays, one row per team and month
+    def per_team(key, default=None):
+        return np.repeat([team.get(key, default) for team in teams], n_months)
+    
+    return pd.DataFrame({
+        "team_name": per_team("name"),
+        "team_code": per_team("code"),
+        "confederation": per_team("confederation"),
+        "date": np.tile(months.strftime('%Y-%m'), n_teams),
+        "rank": ranks.ravel(),
+        "qualified": per_team("qualified", False),
+        "host": per_team("host", False)
     })
 
-# Sort by latest ranking
-team_info = sorted(team_info, key=lambda x: x["latest_rank"])
+class RankMatrix:
+    """Team x month matrix of rankings with index maps for O(1) rank lookups.
+    
+    Each cell holds the team's rank as of that month: months without a new
+    ranking carry the previous one forward, and 0 means not yet ranked.
+    """
+    
+    # File names of the persisted matrix and its index maps
+    MATRIX_FILE = 'fifa_rank_matrix.npy'
+    INDEX_FILE = 'fifa_rank_matrix.json'
+    
+    def __init__(self, ranks, team_codes, dates):
+        """Initialize the RankMatrix from a (teams, months) rank array and its labels."""
+        self.ranks = ranks
+        self.team_codes = list(team_codes)
+        self.dates = list(dates)  # Sorted 'YYYY-MM' strings
+        self.team_index = {code: i for i, code in enumerate(self.team_codes)}
+        self.date_index = {date: j for j, date in enumerate(self.dates)}
+    
+    @classmethod
+    def from_rankings(cls, rankings_df):
+        """Build the matrix from a rankings DataFrame with team_code, date and rank columns."""
+        dates = rankings_df["date"]
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            rankings_df = rankings_df.assign(date=dates.dt.strftime('%Y-%m'))
+        matrix = rankings_df.pivot(index="team_code", columns="date", values="rank")
+        matrix = matrix.sort_index(axis=1).ffill(axis=1).fillna(0)
+        return cls(matrix.to_numpy(dtype=np.int16), matrix.index, matrix.columns)
+    
+    def save(self, output_dir='data'):
+        """Write the matrix as .npy with its team and month index maps as JSON, returning the paths."""
+        os.makedirs(output_dir, exist_ok=True)
+        
+        matrix_file = os.path.join(output_dir, self.MATRIX_FILE)
+        np.save(matrix_file, np.ascontiguousarray(self.ranks, dtype=np.int16))
+        
+        index_file = os.path.join(output_dir, self.INDEX_FILE)
+        with open(index_file, 'w') as f:
+            json.dump({"team_codes": self.team_codes, "dates": self.dates}, f)
+        
+        return matrix_file, index_file
+    
+    @classmethod
+    def load(cls, data_dir='data', mmap=True):
+        """Open a saved matrix, memory-mapped read-only by default so processes share the pages."""
+        with open(os.path.join(data_dir, cls.INDEX_FILE)) as f:
+            index = json.load(f)
+        ranks = np.load(os.path.join(data_dir, cls.MATRIX_FILE), mmap_mode='r' if mmap else None)
+        return cls(ranks, index["team_codes"], index["dates"])
+    
+    def _date_column(self, date):
+        """Get the column of the latest month on or before a date, or None if before the first."""
+        month = str(date)[:7]
+        j = self.date_index.get(month)
+        if j is None:
+            j = bisect_right(self.dates, month) - 1
+        return j if j >= 0 else None
+    
+    def rank_as_of(self, team_code, date):
+        """Get a team's rank as of a date ('YYYY-MM' or 'YYYY-MM-DD'), or None if unranked."""
+        i = self.team_index.get(team_code)
+        j = self._date_column(date)
+        if i is None or j is None or self.ranks[i, j] == 0:
+            return None
+        return int(self.ranks[i, j])
+    
+    def latest_rank(self, team_code):
+        """Get a team's most recent rank, or None if unranked."""
+        return self.rank_as_of(team_code, self.dates[-1]) if self.dates else None
+    
+    def team_series(self, team_code, start=None, end=None):
+        """Get a team's monthly ranks between two dates (inclusive) as a (dates, ranks) view."""
+        i = self.team_index.get(team_code)
+        if i is None:
+            raise ValueError(f"Team {team_code} not found in data")
+        
+        first = 0 if start is None else bisect_left(self.dates, str(start)[:7])
+        last = len(self.dates) if end is None else bisect_right(self.dates, str(end)[:7])
+        return self.dates[first:last], self.ranks[i, first:last]
+    
+    def month_snapshot(self, date):
+        """Get every team's rank as of a date as an array aligned with team_codes."""
+        j = self._date_column(date)
+        if j is None:
+            return np.zeros(len(self.team_codes), dtype=self.ranks.dtype)
+        return self.ranks[:, j]
+    
+    def latest_snapshot(self):
+        """Get the most recent rank of every ranked team."""
+        if not self.dates:
+            return {}
+        return {code: int(rank) for code, rank in zip(self.team_codes, self.ranks[:, -1]) if rank > 0}
+
+def build_team_info(rankings_df, teams=None, rank_matrix=None):
+    """Build the team information list for the visualization, sorted by latest ranking (unranked teams last)."""
+    if teams is None:
+        teams = all_teams
+    if rank_matrix is None:
+        rank_matrix = RankMatrix.from_rankings(rankings_df)
+    
+    # Latest ranks as regular ints for JSON serialization
+    latest_ranks = rank_matrix.latest_snapshot()
+    
+    team_info = []
+    for team in teams:
+        status = "Host" if team.get("host", False) else "Qualified" if team["qualified"] else "Potential"
+        latest_rank = latest_ranks.get(team["code"])
+        
+        team_info.append({
+            "name": team["name"],
+            "code": team["code"],
+            "confederation": team["confederation"],
+            "status": status,
+            "latest_rank": latest_rank
+        })
+    
+    # Sort by latest ranking, teams without a rank in the last month at the end
+    return sorted(team_info, key=lambda x: (x["latest_rank"] is None, x["latest_rank"] or 0))
+
+def _history_format(path, format=None):
+    """Get the file format of a ranking history path, inferred from its extension by default."""
+    if format is None:
+        extension = os.path.splitext(path)[1].lower()
+        format = next((name for name, ext in HISTORY_FORMATS.items() if ext == extension), None)
+    if format not in HISTORY_FORMATS:
+        raise ValueError(f"Unsupported ranking history format for {path}")
+    return format
+
+def _require_pyarrow(format):
+    """Raise a clear error if pyarrow, needed for Parquet and Feather files, is missing."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(f"Reading or writing {format} files requires pyarrow (pip install pyarrow)") from e
+
+def to_columnar_rankings(rankings_df):
+    """Convert a rankings DataFrame to compact column types: categoricals, typed dates and int16 ranks."""
+    columnar_df = rankings_df.copy()
+    for column in CATEGORICAL_COLUMNS:
+        columnar_df[column] = columnar_df[column].astype("category")
+    columnar_df["date"] = pd.to_datetime(columnar_df["date"])
+    columnar_df["rank"] = columnar_df["rank"].astype(np.int16)
+    columnar_df["qualified"] = columnar_df["qualified"].astype(bool)
+    columnar_df["host"] = columnar_df["host"].astype(bool)
+    return columnar_df
+
+def write_rankings(rankings_df, path, format=None):
+    """Write the ranking history to a Parquet, Feather or CSV file, returning the path."""
+    format = _history_format(path, format)
+    if format == "csv":
+        rankings_df.to_csv(path, index=False)
+        return path
+    
+    _require_pyarrow(format)
+    columnar_df = to_columnar_rankings(rankings_df)
+    if format == "parquet":
+        columnar_df.to_parquet(path, index=False)
+    else:
+        columnar_df.reset_index(drop=True).to_feather(path)
+    return path
+
+def read_rankings(path, columns=None, teams=None, format=None):
+    """Read a ranking history file, loading only the given columns and team codes.
+    
+    Parquet files push the team filter down to the reader so that row groups of
+    other teams are skipped; CSV files are converted to the columnar types.
+    """
+    format = _history_format(path, format)
+    read_columns = None
+    if columns is not None:
+        read_columns = list(columns)
+        if teams is not None and "team_code" not in read_columns:
+            read_columns.append("team_code")
+    
+    if format == "parquet":
+        _require_pyarrow(format)
+        filters = [("team_code", "in", list(teams))] if teams is not None else None
+        rankings_df = pd.read_parquet(path, columns=read_columns, filters=filters)
+    elif format == "feather":
+        _require_pyarrow(format)
+        rankings_df = pd.read_feather(path, columns=read_columns)
+    else:
+        rankings_df = pd.read_csv(path, usecols=read_columns)
+        for column in CATEGORICAL_COLUMNS:
+            if column in rankings_df:
+                rankings_df[column] = rankings_df[column].astype("category")
+        if "date" in rankings_df:
+            rankings_df["date"] = pd.to_datetime(rankings_df["date"])
+        if "rank" in rankings_df:
+            rankings_df["rank"] = rankings_df["rank"].astype(np.int16)
+    
+    if teams is not None:
+        rankings_df = rankings_df[rankings_df["team_code"].isin(list(teams))]
+        if "team_code" in rankings_df and isinstance(rankings_df["team_code"].dtype, pd.CategoricalDtype):
+            rankings_df["team_code"] = rankings_df["team_code"].cat.remove_unused_categories()
+    if columns is not None:
+        rankings_df = rankings_df[list(columns)]
+    return rankings_df.reset_index(drop=True)
+
+def save_ranking_history(rankings_df, team_info, output_dir='data', formats=("parquet", "csv")):
+    """Write the ranking history in the given formats and the team info JSON.
+    
+    Returns a dict mapping each format to its history file and the team info path.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    history_files = {}
+    for format in formats:
+        history_file = os.path.join(output_dir, 'fifa_rankings_history' + HISTORY_FORMATS[format])
+        history_files[format] = write_rankings(rankings_df, history_file, format)
+    
+    team_info_file = os.path.join(output_dir, 'team_info.json')
+    with open(team_info_file, 'w') as f:
+        json.dump(team_info, f, indent=2)
+    
+    return history_files, team_info_file
 
-# Save team info to JSON
-with open('data/team_info.json', 'w') as f:
-    json.dump(team_info, f, indent=2)
+def build_ranking_history(teams=None, output_dir=None, seed=None, base_rankings=base_rankings):
+    """Run the ranking-history pipeline, writing files only if output_dir is given.
+    
+    base_rankings must hold a starting rank for every team. Returns the
+    rankings DataFrame and the team info list.
+    """
+    rankings_df = generate_historical_rankings(teams, base_rankings, seed=seed)
+    rank_matrix = RankMatrix.from_rankings(rankings_df)
+    team_info = build_team_info(rankings_df, teams, rank_matrix)
+    
+    if output_dir is not None:
+        save_ranking_history(rankings_df, team_info, output_dir)
+        rank_matrix.save(output_dir)
+    
+    return rankings_df, team_info
 
-print("Data collection and processing complete.")
-print(f"Generated data for {len(all_teams)} teams across {len(rankings_df['date'].unique())} time periods.")
-print("Files saved: data/fifa_rankings_history.csv and data/team_info.json")
+@lru_cache(maxsize=None)
+def get_ranking_history():
+    """Get the ranking history for all tracked teams, built in memory once per process.
+    
+    The returned DataFrame and list are shared between callers and should not be modified.
+    """
+    return build_ranking_history()
+
+if __name__ == "__main__":
+    rankings_df, team_info = build_ranking_history(output_dir='data')
+    
+    print("Data collection and processing complete.")
+    print(f"Generated data for {len(all_teams)} teams across {len(rankings_df['date'].unique())} time periods.")
+    print("Files saved: data/fifa_rankings_history.parquet, data/fifa_rankings_history.csv, "
+          "data/team_info.json and data/fifa_rank_matrix.npy")
@@ -0,0 +1,108 @@
+"""
+Leaderboards for FIFA World Cup 2026
+
+This module provides top scorer leaderboards for the whole tournament and for
+every confederation, team and position, maintained as players score instead
+of sorting all players on each query. Each leaderboard is a heap of ranking
+keys with lazy removal of outdated entries, so a goal updates a player's
+leaderboards in O(log n) and the top K players are read in O(K log n). Ties on
+goals are broken by caps, then assists, then player id.
+"""
+
+import heapq
+
+# Scopes a player is ranked in besides the global leaderboard
+SCOPES = ['confederation', 'team', 'position']
+
+
+def ranking_key(player_id, player, assists=0):
+    """Get the key ordering a player on a leaderboard, smallest first."""
+    return (-(player.get('goals') or 0), -(player.get('caps') or 0), -assists, player_id)
+
+
+class Leaderboard:
+    """Class keeping players ordered by ranking key in a heap with lazy removal."""
+
+    def __init__(self):
+        """Initialize an empty Leaderboard."""
+        self.heap = []
+        self.keys = {}
+
+    def __len__(self):
+        """Number of players on the leaderboard."""
+        return len(self.keys)
+
+    def update(self, player_id, key):
+        """Set a player's ranking key, leaving any previous entry to be discarded lazily."""
+        if self.keys.get(player_id) == key:
+            return
+        self.keys[player_id] = key
+        heapq.heappush(self.heap, key)
+        self._compact()
+
+    def remove(self, player_id):
+        """Remove a player from the leaderboard."""
+        if self.keys.pop(player_id, None) is not None:
+            self._compact()
+
+    def _compact(self):
+        """Rebuild the heap from the current keys once outdated entries outnumber them."""
+        if len(self.heap) > 2 * len(self.keys) + 16:
+            self.heap = list(self.keys.values())
+            heapq.heapify(self.heap)
+
+    def top(self, k):
+        """Get the ids of the top k players, best first."""
+        ranked = []
+        while self.heap and len(ranked) < k:
+            key = heapq.heappop(self.heap)
+            # Outdated entries are dropped as they surface
+            if self.keys.get(key[-1]) == key and (not ranked or ranked[-1] != key):
+                ranked.append(key)
+        for key in ranked:
+            heapq.heappush(self.heap, key)
+        return [key[-1] for key in ranked]
+
+
+class Leaderboards:
+    """Class maintaining the global leaderboard and one leaderboard per confederation, team and position."""
+
+    def __init__(self):
+        """Initialize empty Leaderboards."""
+        self.global_board = Leaderboard()
+        self.boards = {scope: {} for scope in SCOPES}
+        self.player_scopes = {}
+
+    @classmethod
+    def from_players(cls, players_data, teams_data=None, assists=None):
+        """Build leaderboards for all players, with assists counts keyed by player id."""
+        leaderboards = cls()
+        for player_id, player in players_data.items():
+            leaderboards.update(player_id, player, teams_data, (assists or {}).get(player_id, 0))
+        return leaderboards
+
+    def update(self, player_id, player, teams_data=None, assists=0):
+        """Place a player on the leaderboards of their scopes with their current goals, caps and assists."""
+        team = (teams_data or {}).get(player.get('team'), {})
+        scopes = {'confederation': team.get('confederation'), 'team': player.get('team'),
+                  'position': player.get('position')}
+        previous = self.player_scopes.get(player_id, {})
+        key = ranking_key(player_id, player, assists)
+
+        self.global_board.update(player_id, key)
+        for scope, value in scopes.items():
+            old_value = previous.get(scope)
+            if old_value is not None and old_value != value:
+                self.boards[scope][old_value].remove(player_id)
+            if value is not None:
+                self.boards[scope].setdefault(value, Leaderboard()).update(player_id, key)
+        self.player_scopes[player_id] = scopes
+
+    def top(self, k=10, scope=None, value=None):
+        """Get the ids of the top k scorers overall, or within one confederation, team or position."""
+        if scope is None:
+            return self.global_board.top(k)
+        if scope not in self.boards:
+            raise ValueError(f"Unknown leaderboard scope {scope}; expected one of {SCOPES}")
+        board = self.boards[scope].get(value)
+        return board.top(k) if board is not None else []
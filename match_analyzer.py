@@ -5,130 +5,50 @@ This module provides analytics functions for analyzing match dynamics,
 phase-specific performance, and outcome predictions.
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 import json
 import os
 
+from data_store import get_data_store
+
 class MatchAnalyzer:
     """Class for analyzing match data for the World Cup."""
     
-    def __init__(self, data_dir='../../data'):
-        """Initialize the MatchAnalyzer with data directory path."""
+    def __init__(self, data_dir='../../data', columnar=False, sql=False):
+        """Initialize the MatchAnalyzer with data directory path; data is loaded on first access.
+
+        If columnar is True, phase breakdowns and momentum are computed from a
+        columnar event table instead of the list of event dicts. If sql is True,
+        phase counts are aggregated by the indexed SQLite store instead.
+        """
         self.data_dir = Path(data_dir)
-        self.matches_data = None
-        self.teams_data = None
-        self.match_events = None
-        self.load_data()
+        self.columnar = columnar
+        self.store = get_data_store(self.data_dir)
+        self.sql = None
+        if sql:
+            from sqlite_store import get_sqlite_store
+            self.sql = get_sqlite_store(self.data_dir)
         
     def load_data(self):
-        """Load match, team, and event data from files."""
-        # In a real implementation, this would load actual data files
-        # For now, we'll create sample data structures
-        
-        # Sample matches data
-        self.matches_data = {
-            'M001': {
-                'team1': 'ARG', 'team2': 'BRA', 
-                'score1': 2, 'score2': 1, 
-                'date': '2024-11-15', 
-                'tournament': 'World Cup Qualifier',
-                'stage': 'CONMEBOL Qualifier'
-            },
-            'M002': {
-                'team1': 'FRA', 'team2': 'ENG', 
-                'score1': 3, 'score2': 2, 
-                'date': '2024-10-12', 
-                'tournament': 'UEFA Nations League',
-                'stage': 'Group Stage'
-            },
-            'M003': {
-                'team1': 'USA', 'team2': 'MEX', 
-                'score1': 2, 'score2': 0, 
-                'date': '2024-09-07', 
-                'tournament': 'CONCACAF Nations League',
-                'stage': 'Final'
-            },
-            'M004': {
-                'team1': 'QAT', 'team2': 'IRN', 
-                'score1': 3, 'score2': 1, 
-                'date': '2024-11-20', 
-                'tournament': 'World Cup Qualifier',
-                'stage': 'AFC Qualifier'
-            },
-            'M005': {
-                'team1': 'EGY', 'team2': 'SEN', 
-                'score1': 1, 'score2': 1, 
-                'date': '2024-10-09', 
-                'tournament': 'World Cup Qualifier',
-                'stage': 'CAF Qualifier'
-            },
-            'M006': {
-                'team1': 'JPN', 'team2': 'KOR', 
-                'score1': 2, 'score2': 2, 
-                'date': '2024-11-18', 
-                'tournament': 'World Cup Qualifier',
-                'stage': 'AFC Qualifier'
-            }
-        }
-        
-        # Sample teams data
-        self.teams_data = {
-            'ARG': {'name': 'Argentina', 'confederation': 'CONMEBOL', 'qualified': True, 'ranking': 1},
-            'BRA': {'name': 'Brazil', 'confederation': 'CONMEBOL', 'qualified': False, 'ranking': 5},
-            'FRA': {'name': 'France', 'confederation': 'UEFA', 'qualified': False, 'ranking': 2},
-            'ENG': {'name': 'England', 'confederation': 'UEFA', 'qualified': False, 'ranking': 4},
-            'USA': {'name': 'United States', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 13},
-            'MEX': {'name': 'Mexico', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 15},
-            'QAT': {'name': 'Qatar', 'confederation': 'AFC', 'qualified': False, 'ranking': 37},
-            'IRN': {'name': 'IR Iran', 'confederation': 'AFC', 'qualified': True, 'ranking': 22},
-            'EGY': {'name': 'Egypt', 'confederation': 'CAF', 'qualified': False, 'ranking': 36},
-            'SEN': {'name': 'Senegal', 'confederation': 'CAF', 'qualified': False, 'ranking': 18},
-            'JPN': {'name': 'Japan', 'confederation': 'AFC', 'qualified': True, 'ranking': 20},
-            'KOR': {'name': 'Korea Republic', 'confederation': 'AFC', 'qualified': False, 'ranking': 24}
-        }
-        
-        # Sample match events data
-        self.match_events = [
-            # Match M001 (ARG vs BRA)
-            {'match_id': 'M001', 'team': 'ARG', 'event_type': 'goal', 'player': 'Messi', 'minute': 23, 'phase': '16-30'},
-            {'match_id': 'M001', 'team': 'BRA', 'event_type': 'goal', 'player': 'Vinicius', 'minute': 45, 'phase': '31-45'},
-            {'match_id': 'M001', 'team': 'ARG', 'event_type': 'goal', 'player': 'Martinez', 'minute': 78, 'phase': '61-90'},
-            {'match_id': 'M001', 'team': 'ARG', 'event_type': 'yellow_card', 'player': 'De Paul', 'minute': 34, 'phase': '31-45'},
-            {'match_id': 'M001', 'team': 'BRA', 'event_type': 'yellow_card', 'player': 'Casemiro', 'minute': 56, 'phase': '46-60'},
-            
-            # Match M002 (FRA vs ENG)
-            {'match_id': 'M002', 'team': 'FRA', 'event_type': 'goal', 'player': 'Mbappé', 'minute': 12, 'phase': '0-15'},
-            {'match_id': 'M002', 'team': 'ENG', 'event_type': 'goal', 'player': 'Kane', 'minute': 27, 'phase': '16-30'},
-            {'match_id': 'M002', 'team': 'FRA', 'event_type': 'goal', 'player': 'Griezmann', 'minute': 43, 'phase': '31-45'},
-            {'match_id': 'M002', 'team': 'ENG', 'event_type': 'goal', 'player': 'Bellingham', 'minute': 58, 'phase': '46-60'},
-            {'match_id': 'M002', 'team': 'FRA', 'event_type': 'goal', 'player': 'Mbappé', 'minute': 82, 'phase': '61-90'},
-            
-            # Match M003 (USA vs MEX)
-            {'match_id': 'M003', 'team': 'USA', 'event_type': 'goal', 'player': 'Pulisic', 'minute': 36, 'phase': '31-45'},
-            {'match_id': 'M003', 'team': 'USA', 'event_type': 'goal', 'player': 'Weah', 'minute': 67, 'phase': '61-90'},
-            {'match_id': 'M003', 'team': 'MEX', 'event_type': 'yellow_card', 'player': 'Alvarez', 'minute': 42, 'phase': '31-45'},
-            {'match_id': 'M003', 'team': 'USA', 'event_type': 'yellow_card', 'player': 'Adams', 'minute': 51, 'phase': '46-60'},
-            
-            # Match M004 (QAT vs IRN)
-            {'match_id': 'M004', 'team': 'QAT', 'event_type': 'goal', 'player': 'Ali', 'minute': 5, 'phase': '0-15'},
-            {'match_id': 'M004', 'team': 'QAT', 'event_type': 'goal', 'player': 'Ali', 'minute': 34, 'phase': '31-45'},
-            {'match_id': 'M004', 'team': 'IRN', 'event_type': 'goal', 'player': 'Taremi', 'minute': 52, 'phase': '46-60'},
-            {'match_id': 'M004', 'team': 'QAT', 'event_type': 'goal', 'player': 'Afif', 'minute': 88, 'phase': '61-90'},
-            
-            # Match M005 (EGY vs SEN)
-            {'match_id': 'M005', 'team': 'EGY', 'event_type': 'goal', 'player': 'Salah', 'minute': 45, 'phase': '31-45'},
-            {'match_id': 'M005', 'team': 'SEN', 'event_type': 'goal', 'player': 'Mané', 'minute': 76, 'phase': '61-90'},
-            
-            # Match M006 (JPN vs KOR)
-            {'match_id': 'M006', 'team': 'JPN', 'event_type': 'goal', 'player': 'Minamino', 'minute': 22, 'phase': '16-30'},
-            {'match_id': 'M006', 'team': 'KOR', 'event_type': 'goal', 'player': 'Son', 'minute': 39, 'phase': '31-45'},
-            {'match_id': 'M006', 'team': 'JPN', 'event_type': 'goal', 'player': 'Kamada', 'minute': 61, 'phase': '61-90'},
-            {'match_id': 'M006', 'team': 'KOR', 'event_type': 'goal', 'player': 'Hwang', 'minute': 84, 'phase': '61-90'}
-        ]
+        """Load match, team, and event data from the shared data store now rather than on first access."""
+        self.store.load_dataset('matches')
+        self.store.load_dataset('teams')
+        self.store.load_dataset('match_events')
+    
+    @property
+    def matches_data(self):
+        """Match data keyed by match id."""
+        return self.store.matches_data
+    
+    @property
+    def teams_data(self):
+        """Team data keyed by team code."""
+        return self.store.teams_data
+    
+    @property
+    def match_events(self):
+        """Match events (goals, cards) with team and phase."""
+        return self.store.match_events
     
     def get_match_info(self, match_id):
         """Get basic information about a match."""
@@ -138,24 +58,34 @@ class MatchAnalyzer:
     
     def get_team_matches(self, team_code):
         """Get all matches involving a specific team."""
-        return {mid: match for mid, match in self.matches_data.items() 
-                if match['team1'] == team_code or match['team2'] == team_code}
+        return {mid: self.matches_data[mid]
+                for mid in self.store.matches_by_team.get(team_code, [])}
     
     def get_match_events(self, match_id):
         """Get all events from a specific match."""
-        return [event for event in self.match_events 
-                if event['match_id'] == match_id]
+        return list(self.store.events_by_match.get(match_id, []))
     
     def get_events_by_phase(self, match_id, phase):
         """Get events from a specific match phase."""
-        return [event for event in self.match_events 
-                if event['match_id'] == match_id and event['phase'] == phase]
+        return list(self.store.events_by_match_phase.get((match_id, phase), []))
+    
+    def get_event_table(self):
+        """Get the columnar event table, rebuilding it when events have been added."""
+        return self.store.get_event_table()
     
     def analyze_match_phases(self, match_id):
         """Analyze a match by breaking it down into phases."""
         if match_id not in self.matches_data:
             raise ValueError(f"Match {match_id} not found in data")
         
+        if self.sql is not None:
+            phases = ['0-15', '16-30', '31-45', '46-60', '61-90']
+            events_count, goals, cards = self.sql.phase_counts(match_id)
+            phase_events = [self.get_events_by_phase(match_id, phase) for phase in phases]
+            return self._phase_analysis_from_counts(phases, events_count, goals, cards, phase_events)
+        if self.columnar:
+            return self._analyze_match_phases_columnar(match_id)
+        
         match = self.matches_data[match_id]
         events = self.get_match_events(match_id)
         
@@ -188,11 +118,79 @@ class MatchAnalyzer:
         
         return phase_analysis
     
+    def _analyze_match_phases_columnar(self, match_id):
+        """Analyze a match by phases using vectorized counts from the event table."""
+        table = self.get_event_table()
+        counts = table.phase_counts(match_id)
+        return self._phase_analysis_from_counts(table.phases, counts['events'][0], counts['goals'][0],
+                                                counts['cards'][0], table.phase_events(match_id))
+    
+    def _phase_analysis_from_counts(self, phases, events_count, goals, cards, phase_events):
+        """Build the per-phase analysis of a match from its event, goal and card count arrays and event lists."""
+        phase_analysis = {}
+        for i, phase in enumerate(phases):
+            team1_goals, team2_goals = (int(n) for n in goals[i])
+            team1_cards, team2_cards = (int(n) for n in cards[i])
+            
+            phase_analysis[phase] = {
+                'events_count': int(events_count[i]),
+                'goals': team1_goals + team2_goals,
+                'cards': team1_cards + team2_cards,
+                'team1_goals': team1_goals,
+                'team2_goals': team2_goals,
+                'team1_cards': team1_cards,
+                'team2_cards': team2_cards,
+                'events': phase_events[i]
+            }
+        
+        return phase_analysis
+    
+    def analyze_all_match_phases(self, match_ids=None):
+        """Analyze the phases of many matches with a single pass over the events.
+        
+        Returns a dict mapping each match id (all matches by default) to the
+        same per-phase analysis produced by analyze_match_phases.
+        """
+        import numpy as np
+        
+        if match_ids is None:
+            match_ids = list(self.matches_data)
+        for match_id in match_ids:
+            if match_id not in self.matches_data:
+                raise ValueError(f"Match {match_id} not found in data")
+        
+        table = self.get_event_table()
+        counts = table.phase_counts()
+        n_phases = len(table.phases)
+        
+        all_phases = {}
+        for match_id in match_ids:
+            i = table.match_position(match_id)
+            if i is None:
+                # Match without any recorded events
+                events_count = np.zeros(n_phases, dtype=int)
+                goals = cards = np.zeros((n_phases, 2), dtype=int)
+            else:
+                events_count, goals, cards = counts['events'][i], counts['goals'][i], counts['cards'][i]
+            all_phases[match_id] = self._phase_analysis_from_counts(table.phases, events_count, goals, cards,
+                                                                    table.phase_events(match_id))
+        
+        return all_phases
+    
     def calculate_match_momentum(self, match_id):
         """Calculate momentum shifts during a match based on events."""
         if match_id not in self.matches_data:
             raise ValueError(f"Match {match_id} not found in data")
         
+        if self.columnar:
+            import numpy as np
+            
+            table = self.get_event_table()
+            rows = table.match_slice(match_id)
+            momentum = [0] + np.cumsum(table.momentum_deltas(rows)).tolist()
+            minutes = [0] + table.minutes[rows].tolist()
+            return {'minutes': minutes + [90], 'momentum': momentum + momentum[-1:]}
+        
         match = self.matches_data[match_id]
         events = sorted(self.get_match_events(match_id), key=lambda x: x['minute'])
         
@@ -223,35 +221,95 @@ class MatchAnalyzer:
         
         return {'minutes': minutes, 'momentum': momentum}
     
+    def calculate_all_match_momentum(self, match_ids=None):
+        """Calculate momentum for many matches at once from grouped cumulative sums.
+        
+        Returns a dict mapping each match id (all matches by default) to the
+        same minutes/momentum curve produced by calculate_match_momentum.
+        """
+        if match_ids is None:
+            match_ids = list(self.matches_data)
+        for match_id in match_ids:
+            if match_id not in self.matches_data:
+                raise ValueError(f"Match {match_id} not found in data")
+        
+        curves = self.get_event_table().momentum_curves(match_ids)
+        offsets = curves['offsets']
+        
+        all_momentum = {}
+        for k, match_id in enumerate(match_ids):
+            momentum = [0] + curves['momentum'][offsets[k]:offsets[k + 1]].tolist()
+            minutes = [0] + curves['minutes'][offsets[k]:offsets[k + 1]].tolist()
+            all_momentum[match_id] = {'minutes': minutes + [90], 'momentum': momentum + momentum[-1:]}
+        
+        return all_momentum
+    
+    def calculate_momentum_grid(self, match_ids=None, max_minute=90):
+        """Calculate per-minute momentum for many matches as a dense array.
+        
+        Returns the list of match ids and an array of shape
+        (len(match_ids), max_minute + 1) with one momentum value per minute.
+        """
+        if match_ids is None:
+            match_ids = list(self.matches_data)
+        for match_id in match_ids:
+            if match_id not in self.matches_data:
+                raise ValueError(f"Match {match_id} not found in data")
+        
+        return match_ids, self.get_event_table().momentum_grid(match_ids, max_minute)
+    
     def predict_match_outcome(self, team1_code, team2_code):
-        """Predict match outcome based on team rankings and historical performance."""
+        """Predict match outcome from Elo ratings seeded by FIFA ranking and built from historical results."""
         if team1_code not in self.teams_data or team2_code not in self.teams_data:
             raise ValueError("Team not found in data")
         
-        team1 = self.teams_data[team1_code]
-        team2 = self.teams_data[team2_code]
-        
-        # Simple prediction model based on FIFA ranking
-        team1_strength = 1 / team1['ranking']
-        team2_strength = 1 / team2['ranking']
-        
-        total_strength = team1_strength + team2_strength
-        team1_win_prob = team1_strength / total_strength
-        team2_win_prob = team2_strength / total_strength
-        draw_prob = 0.25  # Arbitrary draw probability
-        
-        # Adjust to ensure probabilities sum to 1
-        team1_win_prob *= (1 - draw_prob)
-        team2_win_prob *= (1 - draw_prob)
+        return self.store.get_rating_engine().predict(team1_code, team2_code)
+    
+    def predict_many(self, pairs):
+        """Predict many (team1, team2) fixtures at once from the Elo ratings.
+        
+        Returns an array of shape (fixtures, 3) with [team1_win, draw, team2_win]
+        rows and a boolean mask of fixtures whose teams are both in the data.
+        Unknown teams are predicted at the default rating instead of raising.
+        """
+        import numpy as np
+        
+        pairs = list(pairs)
+        known = np.array([team1 in self.teams_data and team2 in self.teams_data for team1, team2 in pairs],
+                         dtype=bool)
+        probs = self.store.get_rating_engine().predict_many([team1 for team1, _ in pairs],
+                                                            [team2 for _, team2 in pairs])
+        return probs.reshape(len(pairs), 3), known
+    
+    def predict_matrix(self, teams):
+        """Predict every pairing of a list of teams in one vectorized expression.
+        
+        Returns an array of shape (teams, teams, 3) whose entry [i, j] holds the
+        [win, draw, loss] probabilities of teams[i] against teams[j] (zero on the
+        diagonal), as accepted by TournamentSimulator, and a boolean mask of the
+        teams found in the data.
+        """
+        import numpy as np
+        
+        engine = self.store.get_rating_engine()
+        ratings = engine.lookup(teams)
+        probs = engine.predict_ratings(ratings[:, None], ratings[None, :])
+        probs[np.arange(len(teams)), np.arange(len(teams))] = 0
+        known = np.array([team in self.teams_data for team in teams], dtype=bool)
+        return probs, known
+    
+    def predict_scoreline(self, team1_code, team2_code, neutral=False):
+        """Predict a match's outcome, expected goals and most likely scoreline from the scoreline model."""
+        if team1_code not in self.teams_data or team2_code not in self.teams_data:
+            raise ValueError("Team not found in data")
         
-        return {
-            'team1_win': team1_win_prob,
-            'team2_win': team2_win_prob,
-            'draw': draw_prob
-        }
+        return self.store.get_scoreline_model().predict(team1_code, team2_code, neutral)
     
     def generate_phase_analysis_chart(self, match_id, output_file=None):
         """Generate a visualization of match phases."""
+        import matplotlib.pyplot as plt
+        import numpy as np
+        
         if match_id not in self.matches_data:
             raise ValueError(f"Match {match_id} not found in data")
         
@@ -294,6 +352,8 @@ class MatchAnalyzer:
     
     def generate_momentum_chart(self, match_id, output_file=None):
         """Generate a visualization of match momentum shifts."""
+        import matplotlib.pyplot as plt
+        
         if match_id not in self.matches_data:
             raise ValueError(f"Match {match_id} not found in data")
         
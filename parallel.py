@@ -0,0 +1,91 @@
+"""
+Parallel Simulation Runner for FIFA World Cup 2026
+
+This module provides a process-pool runner for Monte Carlo simulations. Work is
+split into fixed-size chunks, each with its own RNG stream spawned from a single
+NumPy SeedSequence, and the partial histograms are summed in chunk order. The
+chunking does not depend on the number of workers, so results for a given seed
+are bit-identical whether they run on one core or many.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def _run_chunk(task):
+    """Run one simulation chunk with its own RNG stream."""
+    simulate_chunk, size, seed_seq = task
+    return simulate_chunk(np.random.default_rng(seed_seq), size)
+
+
+def _chunk_tasks(simulate_chunk, n_samples, seed_seq, chunk_size):
+    """Split a simulation into chunk tasks with RNG streams spawned from a seed sequence."""
+    if n_samples <= 0:
+        raise ValueError(f"n_samples must be positive, got {n_samples}")
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+    return [(simulate_chunk, size, child) for size, child in zip(sizes, seed_seq.spawn(len(sizes)))]
+
+
+def _run_tasks(tasks, n_workers):
+    """Run chunk tasks, optionally across processes, returning results in task order."""
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(tasks))
+
+    if n_workers <= 1:
+        return [_run_chunk(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        # map yields results in task order, which keeps the reduction deterministic
+        return list(executor.map(_run_chunk, tasks))
+
+
+def _reduce(results):
+    """Sum partial results in order."""
+    total = None
+    for result in results:
+        total = result.copy() if total is None else total + result
+    return total
+
+
+def run_chunked(simulate_chunk, n_samples, seed=None, chunk_size=100000, n_workers=1):
+    """Run a simulation in chunks, optionally across processes, and sum the partial results.
+
+    simulate_chunk(rng, size) must return an array (such as a histogram of
+    counts) and be picklable when n_workers > 1, e.g. a method of a simulator.
+    n_workers=None uses all available cores. Raises ValueError unless n_samples
+    and chunk_size are positive.
+    """
+    tasks = _chunk_tasks(simulate_chunk, n_samples, np.random.SeedSequence(seed), chunk_size)
+    return _reduce(_run_tasks(tasks, n_workers))
+
+
+def run_chunked_jobs(jobs, n_samples, seed=None, chunk_size=100000, n_workers=1):
+    """Run several independent simulations in one process pool and sum each one's results.
+
+    jobs maps names to simulate_chunk functions as accepted by run_chunked.
+    Every job gets its own seed sequence spawned in job order, and the chunks
+    of all jobs share the pool so that small jobs do not leave cores idle.
+    Returns a dict mapping each job name to its summed result. Raises
+    ValueError unless n_samples and chunk_size are positive.
+    """
+    names = list(jobs)
+    seed_seqs = np.random.SeedSequence(seed).spawn(len(names))
+
+    tasks, job_sizes = [], []
+    for name, seed_seq in zip(names, seed_seqs):
+        job_tasks = _chunk_tasks(jobs[name], n_samples, seed_seq, chunk_size)
+        tasks.extend(job_tasks)
+        job_sizes.append(len(job_tasks))
+
+    results = _run_tasks(tasks, n_workers)
+
+    summed, start = {}, 0
+    for name, size in zip(names, job_sizes):
+        summed[name] = _reduce(results[start:start + size])
+        start += size
+    return summed
@@ -5,71 +5,50 @@ This module provides analytics functions for analyzing player performance,
 statistics, and generating performance metrics.
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 import json
 import os
 
+from data_store import get_data_store
+
 class PlayerAnalyzer:
     """Class for analyzing player performance data for the World Cup."""
     
-    def __init__(self, data_dir='../../data'):
-        """Initialize the PlayerAnalyzer with data directory path."""
+    def __init__(self, data_dir='../../data', sql=False):
+        """Initialize the PlayerAnalyzer with data directory path; data is loaded on first access.
+        
+        If sql is True, event counts and top scorers are queried from the indexed
+        SQLite store instead of being read from the in-memory counters and
+        leaderboards.
+        """
         self.data_dir = Path(data_dir)
-        self.players_data = None
-        self.teams_data = None
+        self.store = get_data_store(self.data_dir)
         self.matches_data = None
-        self.load_data()
+        self.sql = None
+        if sql:
+            from sqlite_store import get_sqlite_store
+            self.sql = get_sqlite_store(self.data_dir)
         
     def load_data(self):
-        """Load player, team, and match data from files."""
-        # In a real implementation, this would load actual data files
-        # For now, we'll create sample data structures
-        
-        # Sample players data
-        self.players_data = {
-            'P001': {'name': 'Lionel Messi', 'team': 'ARG', 'position': 'Forward', 'age': 37, 'caps': 180, 'goals': 106},
-            'P002': {'name': 'Cristiano Ronaldo', 'team': 'POR', 'position': 'Forward', 'age': 40, 'caps': 206, 'goals': 128},
-            'P003': {'name': 'Kylian Mbappé', 'team': 'FRA', 'position': 'Forward', 'age': 26, 'caps': 76, 'goals': 46},
-            'P004': {'name': 'Alphonso Davies', 'team': 'CAN', 'position': 'Defender', 'age': 24, 'caps': 44, 'goals': 14},
-            'P005': {'name': 'Christian Pulisic', 'team': 'USA', 'position': 'Midfielder', 'age': 26, 'caps': 64, 'goals': 27},
-            'P006': {'name': 'Hirving Lozano', 'team': 'MEX', 'position': 'Forward', 'age': 29, 'caps': 67, 'goals': 18},
-            'P007': {'name': 'Almoez Ali', 'team': 'QAT', 'position': 'Forward', 'age': 28, 'caps': 85, 'goals': 42},
-            'P008': {'name': 'Mohamed Salah', 'team': 'EGY', 'position': 'Forward', 'age': 33, 'caps': 93, 'goals': 54},
-            'P009': {'name': 'Takumi Minamino', 'team': 'JPN', 'position': 'Midfielder', 'age': 30, 'caps': 56, 'goals': 21},
-            'P010': {'name': 'Mehdi Taremi', 'team': 'IRN', 'position': 'Forward', 'age': 32, 'caps': 73, 'goals': 45},
-        }
-        
-        # Sample teams data
-        self.teams_data = {
-            'ARG': {'name': 'Argentina', 'confederation': 'CONMEBOL', 'qualified': True, 'ranking': 1},
-            'POR': {'name': 'Portugal', 'confederation': 'UEFA', 'qualified': False, 'ranking': 6},
-            'FRA': {'name': 'France', 'confederation': 'UEFA', 'qualified': False, 'ranking': 2},
-            'CAN': {'name': 'Canada', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 43},
-            'USA': {'name': 'United States', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 13},
-            'MEX': {'name': 'Mexico', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 15},
-            'QAT': {'name': 'Qatar', 'confederation': 'AFC', 'qualified': False, 'ranking': 37},
-            'EGY': {'name': 'Egypt', 'confederation': 'CAF', 'qualified': False, 'ranking': 36},
-            'JPN': {'name': 'Japan', 'confederation': 'AFC', 'qualified': True, 'ranking': 20},
-            'IRN': {'name': 'IR Iran', 'confederation': 'AFC', 'qualified': True, 'ranking': 22},
-        }
-        
-        # Sample match events data (goals, assists, etc.)
-        self.match_events = [
-            {'match_id': 'M001', 'player_id': 'P001', 'event_type': 'goal', 'minute': 23},
-            {'match_id': 'M001', 'player_id': 'P001', 'event_type': 'assist', 'minute': 64},
-            {'match_id': 'M002', 'player_id': 'P003', 'event_type': 'goal', 'minute': 12},
-            {'match_id': 'M002', 'player_id': 'P003', 'event_type': 'goal', 'minute': 78},
-            {'match_id': 'M003', 'player_id': 'P005', 'event_type': 'assist', 'minute': 56},
-            {'match_id': 'M004', 'player_id': 'P007', 'event_type': 'goal', 'minute': 34},
-            {'match_id': 'M004', 'player_id': 'P007', 'event_type': 'goal', 'minute': 67},
-            {'match_id': 'M005', 'player_id': 'P008', 'event_type': 'goal', 'minute': 45},
-            {'match_id': 'M006', 'player_id': 'P010', 'event_type': 'goal', 'minute': 22},
-            {'match_id': 'M006', 'player_id': 'P010', 'event_type': 'assist', 'minute': 51},
-        ]
+        """Load player, team, and match data from the shared data store now rather than on first access."""
+        self.store.load_dataset('players')
+        self.store.load_dataset('teams')
+        self.store.load_dataset('player_events')
+    
+    @property
+    def players_data(self):
+        """Player data keyed by player id."""
+        return self.store.players_data
+    
+    @property
+    def teams_data(self):
+        """Team data keyed by team code."""
+        return self.store.teams_data
+    
+    @property
+    def match_events(self):
+        """Player match events (goals, assists)."""
+        return self.store.player_events
     
     def get_player_info(self, player_id):
         """Get basic information about a player."""
@@ -79,18 +58,28 @@ class PlayerAnalyzer:
     
     def get_players_by_team(self, team_code):
         """Get all players from a specific team."""
-        return {pid: data for pid, data in self.players_data.items() 
-                if data.get('team') == team_code}
+        return {pid: self.players_data[pid]
+                for pid in self.store.players_by_team.get(team_code, [])}
     
     def get_players_by_position(self, position):
         """Get all players with a specific position."""
-        return {pid: data for pid, data in self.players_data.items() 
-                if data.get('position') == position}
+        return {pid: self.players_data[pid]
+                for pid in self.store.players_by_position.get(position, [])}
     
     def get_player_events(self, player_id):
         """Get all match events involving a specific player."""
-        return [event for event in self.match_events 
-                if event['player_id'] == player_id]
+        return list(self.store.player_events_by_player.get(player_id, []))
+    
+    def _count_player_events(self, player_id, event_type):
+        """Count a player's events of one type."""
+        if self.sql is not None:
+            return self.sql.count_player_events(player_id, event_type)
+        counts = self.store.player_event_counts.get(player_id)
+        return counts[event_type] if counts else 0
+    
+    def get_player_event_counts(self, player_id):
+        """Get a player's number of events of each type, such as goals and assists."""
+        return dict(self.store.player_event_counts.get(player_id, {}))
     
     def calculate_goals_per_match(self, player_id):
         """Calculate goals per match for a player based on events data."""
@@ -98,8 +87,7 @@ class PlayerAnalyzer:
             return 0
         
         player = self.players_data[player_id]
-        goals = len([event for event in self.match_events 
-                    if event['player_id'] == player_id and event['event_type'] == 'goal'])
+        goals = self._count_player_events(player_id, 'goal')
         
         # In a real implementation, we would count actual matches played
         # Here we'll use a simplified approach with caps
@@ -114,40 +102,43 @@ class PlayerAnalyzer:
             return 0
         
         player = self.players_data[player_id]
-        assists = len([event for event in self.match_events 
-                      if event['player_id'] == player_id and event['event_type'] == 'assist'])
+        assists = self._count_player_events(player_id, 'assist')
         
         if player['caps'] == 0:
             return 0
         
         return assists / player['caps']
     
+    def _top_scorers(self, limit, scope=None, value=None):
+        """Get the top goal scorers of a leaderboard as (player_id, player) pairs."""
+        player_ids = self.store.get_leaderboards().top(limit, scope, value)
+        return [(pid, self.players_data[pid]) for pid in player_ids]
+    
     def get_top_scorers(self, limit=10):
-        """Get the top goal scorers based on total goals."""
-        # Sort players by goals
-        sorted_players = sorted(self.players_data.items(), 
-                               key=lambda x: x[1]['goals'], 
-                               reverse=True)
+        """Get the top goal scorers based on total goals, ties broken by caps and then assists."""
+        if self.sql is not None:
+            return [(player_id, self.players_data[player_id]) for player_id in self.sql.top_scorers(limit)]
         
-        # Return top N players
-        return sorted_players[:limit]
+        return self._top_scorers(limit)
     
     def get_top_scorers_by_confederation(self, confederation, limit=5):
         """Get the top goal scorers from a specific confederation."""
-        # Filter players by confederation
-        confederation_players = []
-        for pid, player in self.players_data.items():
-            team_code = player.get('team')
-            if team_code in self.teams_data and self.teams_data[team_code]['confederation'] == confederation:
-                confederation_players.append((pid, player))
-        
-        # Sort by goals
-        sorted_players = sorted(confederation_players, 
-                               key=lambda x: x[1]['goals'], 
-                               reverse=True)
-        
-        # Return top N players
-        return sorted_players[:limit]
+        return self._top_scorers(limit, 'confederation', confederation)
+    
+    def get_top_scorers_by_team(self, team_code, limit=5):
+        """Get the top goal scorers from a specific team."""
+        return self._top_scorers(limit, 'team', team_code)
+    
+    def get_top_scorers_by_position(self, position, limit=5):
+        """Get the top goal scorers playing in a specific position."""
+        return self._top_scorers(limit, 'position', position)
+    
+    def record_goal(self, match_id, player_id, minute):
+        """Record a goal scored in a live match, updating the player's total and the leaderboards."""
+        if player_id not in self.players_data:
+            raise ValueError(f"Player {player_id} not found in data")
+        self.store.record_player_event({'match_id': match_id, 'player_id': player_id,
+                                        'event_type': 'goal', 'minute': minute})
     
     def generate_player_comparison(self, player_ids, metrics=None):
         """Generate a comparison between multiple players on specified metrics."""
@@ -180,6 +171,9 @@ class PlayerAnalyzer:
     
     def generate_player_radar_chart(self, player_id, output_file=None):
         """Generate a radar chart visualization of player attributes."""
+        import matplotlib.pyplot as plt
+        import numpy as np
+        
         if player_id not in self.players_data:
             raise ValueError(f"Player {player_id} not found in data")
         
@@ -5,109 +5,48 @@ This module provides analytics functions for analyzing the qualification process
 pathways, and performance metrics for teams competing to reach the FIFA World Cup 2026.
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 import json
 import os
+from bisect import bisect_left, insort
+
+from data_store import PLAYER_SAMPLE_TEAMS, get_data_store
+
+# Qualification fields summed into the confederation aggregates
+AGGREGATE_FIELDS = ['matches_played', 'wins', 'draws', 'losses', 'goals_for', 'goals_against', 'points']
 
 class QualificationAnalyzer:
     """Class for analyzing qualification data for the World Cup."""
     
     def __init__(self, data_dir='../../data'):
-        """Initialize the QualificationAnalyzer with data directory path."""
+        """Initialize the QualificationAnalyzer with data directory path; data is loaded on first access."""
         self.data_dir = Path(data_dir)
-        self.qualification_data = None
-        self.teams_data = None
-        self.confederation_formats = None
-        self.load_data()
+        self.store = get_data_store(self.data_dir)
+        self._confederation_totals = None
+        self._confederation_totals_version = None
+        self._standings = None
+        self._standings_version = None
         
     def load_data(self):
-        """Load qualification and team data from files."""
-        # In a real implementation, this would load actual data files
-        # For now, we'll create sample data structures
-        
-        # Sample teams data
-        self.teams_data = {
-            'ARG': {'name': 'Argentina', 'confederation': 'CONMEBOL', 'qualified': True, 'ranking': 1},
-            'BRA': {'name': 'Brazil', 'confederation': 'CONMEBOL', 'qualified': False, 'ranking': 5},
-            'URU': {'name': 'Uruguay', 'confederation': 'CONMEBOL', 'qualified': False, 'ranking': 15},
-            'COL': {'name': 'Colombia', 'confederation': 'CONMEBOL', 'qualified': False, 'ranking': 12},
-            'CAN': {'name': 'Canada', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 43},
-            'MEX': {'name': 'Mexico', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 15},
-            'USA': {'name': 'United States', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 13},
-            'CRC': {'name': 'Costa Rica', 'confederation': 'CONCACAF', 'qualified': False, 'ranking': 52},
-            'JPN': {'name': 'Japan', 'confederation': 'AFC', 'qualified': True, 'ranking': 20},
-            'IRN': {'name': 'IR Iran', 'confederation': 'AFC', 'qualified': True, 'ranking': 22},
-            'KOR': {'name': 'Korea Republic', 'confederation': 'AFC', 'qualified': False, 'ranking': 24},
-            'AUS': {'name': 'Australia', 'confederation': 'AFC', 'qualified': False, 'ranking': 25},
-            'QAT': {'name': 'Qatar', 'confederation': 'AFC', 'qualified': False, 'ranking': 37},
-            'NZL': {'name': 'New Zealand', 'confederation': 'OFC', 'qualified': True, 'ranking': 103},
-            'SOL': {'name': 'Solomon Islands', 'confederation': 'OFC', 'qualified': False, 'ranking': 142},
-            'ENG': {'name': 'England', 'confederation': 'UEFA', 'qualified': False, 'ranking': 4},
-            'FRA': {'name': 'France', 'confederation': 'UEFA', 'qualified': False, 'ranking': 2},
-            'ESP': {'name': 'Spain', 'confederation': 'UEFA', 'qualified': False, 'ranking': 8},
-            'GER': {'name': 'Germany', 'confederation': 'UEFA', 'qualified': False, 'ranking': 16},
-            'ITA': {'name': 'Italy', 'confederation': 'UEFA', 'qualified': False, 'ranking': 9},
-            'EGY': {'name': 'Egypt', 'confederation': 'CAF', 'qualified': False, 'ranking': 36},
-            'SEN': {'name': 'Senegal', 'confederation': 'CAF', 'qualified': False, 'ranking': 18},
-            'MAR': {'name': 'Morocco', 'confederation': 'CAF', 'qualified': False, 'ranking': 13},
-            'NGA': {'name': 'Nigeria', 'confederation': 'CAF', 'qualified': False, 'ranking': 30}
-        }
-        
-        # Sample qualification data
-        self.qualification_data = {
-            'ARG': {'matches_played': 8, 'wins': 6, 'draws': 1, 'losses': 1, 'goals_for': 16, 'goals_against': 5, 'points': 19, 'status': 'qualified'},
-            'BRA': {'matches_played': 8, 'wins': 4, 'draws': 2, 'losses': 2, 'goals_for': 12, 'goals_against': 7, 'points': 14, 'status': 'in_progress'},
-            'URU': {'matches_played': 8, 'wins': 4, 'draws': 1, 'losses': 3, 'goals_for': 11, 'goals_against': 9, 'points': 13, 'status': 'in_progress'},
-            'COL': {'matches_played': 8, 'wins': 3, 'draws': 3, 'losses': 2, 'goals_for': 9, 'goals_against': 8, 'points': 12, 'status': 'in_progress'},
-            'JPN': {'matches_played': 6, 'wins': 6, 'draws': 0, 'losses': 0, 'goals_for': 15, 'goals_against': 2, 'points': 18, 'status': 'qualified'},
-            'IRN': {'matches_played': 6, 'wins': 5, 'draws': 1, 'losses': 0, 'goals_for': 12, 'goals_against': 3, 'points': 16, 'status': 'qualified'},
-            'KOR': {'matches_played': 6, 'wins': 3, 'draws': 2, 'losses': 1, 'goals_for': 8, 'goals_against': 5, 'points': 11, 'status': 'in_progress'},
-            'AUS': {'matches_played': 6, 'wins': 3, 'draws': 1, 'losses': 2, 'goals_for': 9, 'goals_against': 7, 'points': 10, 'status': 'in_progress'},
-            'QAT': {'matches_played': 6, 'wins': 2, 'draws': 1, 'losses': 3, 'goals_for': 7, 'goals_against': 8, 'points': 7, 'status': 'in_progress'},
-            'NZL': {'matches_played': 4, 'wins': 4, 'draws': 0, 'losses': 0, 'goals_for': 12, 'goals_against': 1, 'points': 12, 'status': 'qualified'},
-            'SOL': {'matches_played': 4, 'wins': 2, 'draws': 0, 'losses': 2, 'goals_for': 5, 'goals_against': 7, 'points': 6, 'status': 'eliminated'},
-            'ENG': {'matches_played': 4, 'wins': 3, 'draws': 1, 'losses': 0, 'goals_for': 10, 'goals_against': 2, 'points': 10, 'status': 'in_progress'},
-            'FRA': {'matches_played': 4, 'wins': 3, 'draws': 0, 'losses': 1, 'goals_for': 8, 'goals_against': 3, 'points': 9, 'status': 'in_progress'},
-            'ESP': {'matches_played': 4, 'wins': 2, 'draws': 2, 'losses': 0, 'goals_for': 7, 'goals_against': 2, 'points': 8, 'status': 'in_progress'},
-            'GER': {'matches_played': 4, 'wins': 2, 'draws': 1, 'losses': 1, 'goals_for': 8, 'goals_against': 4, 'points': 7, 'status': 'in_progress'},
-            'ITA': {'matches_played': 4, 'wins': 2, 'draws': 1, 'losses': 1, 'goals_for': 6, 'goals_against': 4, 'points': 7, 'status': 'in_progress'},
-            'EGY': {'matches_played': 4, 'wins': 2, 'draws': 2, 'losses': 0, 'goals_for': 6, 'goals_against': 1, 'points': 8, 'status': 'in_progress'},
-            'SEN': {'matches_played': 4, 'wins': 2, 'draws': 1, 'losses': 1, 'goals_for': 5, 'goals_against': 3, 'points': 7, 'status': 'in_progress'},
-            'MAR': {'matches_played': 4, 'wins': 3, 'draws': 0, 'losses': 1, 'goals_for': 8, 'goals_against': 2, 'points': 9, 'status': 'in_progress'},
-            'NGA': {'matches_played': 4, 'wins': 2, 'draws': 0, 'losses': 2, 'goals_for': 5, 'goals_against': 4, 'points': 6, 'status': 'in_progress'}
-        }
-        
-        # Sample confederation qualification formats
-        self.confederation_formats = {
-            'UEFA': {
-                'total_slots': 16,
-                'format': '12 groups of 4-5 teams, group winners qualify directly, best runners-up enter playoffs'
-            },
-            'CONMEBOL': {
-                'total_slots': 6,
-                'format': 'Single round-robin league, top 6 teams qualify directly'
-            },
-            'CONCACAF': {
-                'total_slots': 6,
-                'format': 'Three rounds: First round (30 teams), Second round (8 groups of 4), Final round (8 teams)'
-            },
-            'AFC': {
-                'total_slots': 8,
-                'format': 'Three rounds: First round (22 teams), Second round (9 groups of 4), Final round (3 groups of 6)'
-            },
-            'CAF': {
-                'total_slots': 9,
-                'format': 'First round (28 teams), Second round (9 groups of 6), group winners qualify'
-            },
-            'OFC': {
-                'total_slots': 1,
-                'format': 'Group stage followed by knockout rounds'
-            }
-        }
+        """Load qualification and team data from the shared data store now rather than on first access."""
+        self.store.load_dataset('qualification')
+        self.store.load_dataset('teams')
+        self.store.load_dataset('confederation_formats')
+    
+    @property
+    def qualification_data(self):
+        """Qualification records keyed by team code."""
+        return self.store.qualification_data
+    
+    @property
+    def teams_data(self):
+        """Team data keyed by team code."""
+        return self.store.teams_data
+    
+    @property
+    def confederation_formats(self):
+        """Qualification format and slots keyed by confederation."""
+        return self.store.confederation_formats
     
     def get_team_qualification_data(self, team_code):
         """Get qualification data for a specific team."""
@@ -115,15 +54,22 @@ class QualificationAnalyzer:
             return self.qualification_data[team_code]
         return None
     
+    def _confederation_team_codes(self):
+        """Get the codes of the teams in qualification per confederation, without teams only sample players play for."""
+        if not self.store.uses_sample_data():
+            return self.store.teams_by_confederation
+        return {confederation: [code for code in team_codes if code not in PLAYER_SAMPLE_TEAMS]
+                for confederation, team_codes in self.store.teams_by_confederation.items()}
+    
     def get_confederation_teams(self, confederation):
         """Get all teams from a specific confederation."""
-        return {code: data for code, data in self.teams_data.items() 
-                if data.get('confederation') == confederation}
+        return {code: self.teams_data[code]
+                for code in self._confederation_team_codes().get(confederation, [])}
     
     def get_qualification_by_status(self, status):
         """Get teams with a specific qualification status."""
-        return {code: data for code, data in self.qualification_data.items() 
-                if data.get('status') == status}
+        return {code: self.qualification_data[code]
+                for code in self.store.qualification_by_status.get(status, {})}
     
     def get_confederation_format(self, confederation):
         """Get qualification format for a specific confederation."""
@@ -142,48 +88,140 @@ class QualificationAnalyzer:
         
         return qual_data['points'] / qual_data['matches_played']
     
+    def _team_totals(self, team_code):
+        """Get a team's contribution to its confederation aggregates."""
+        qual_data = self.qualification_data.get(team_code)
+        if qual_data is None:
+            return None
+        totals = {field: qual_data.get(field, 0) for field in AGGREGATE_FIELDS}
+        totals['qualified_teams'] = 1 if qual_data.get('status') == 'qualified' else 0
+        return totals
+    
+    def _get_confederation_totals(self):
+        """Get aggregate totals per confederation, rebuilding them when the data version changes."""
+        if self._confederation_totals_version != self.store.qualification_version:
+            confederation_totals = {}
+            for confederation, team_codes in self._confederation_team_codes().items():
+                totals = dict.fromkeys(AGGREGATE_FIELDS + ['qualified_teams'], 0)
+                totals['team_count'] = len(team_codes)
+                for team_code in team_codes:
+                    team_totals = self._team_totals(team_code)
+                    if team_totals:
+                        for field, value in team_totals.items():
+                            totals[field] += value
+                confederation_totals[confederation] = totals
+            
+            self._confederation_totals = confederation_totals
+            self._confederation_totals_version = self.store.qualification_version
+        
+        return self._confederation_totals
+    
+    def _standing_key(self, team_code):
+        """Get the sort key of a team in its confederation standings."""
+        qual_data = self.qualification_data[team_code]
+        goal_diff = qual_data.get('goals_for', 0) - qual_data.get('goals_against', 0)
+        return (-qual_data.get('points', 0), -goal_diff, -qual_data.get('goals_for', 0), team_code)
+    
+    def _get_standings(self):
+        """Get sorted standings keys per confederation, rebuilding them when the data version changes."""
+        if self._standings_version != self.store.qualification_version:
+            standings = {}
+            for confederation, team_codes in self._confederation_team_codes().items():
+                standings[confederation] = sorted(self._standing_key(team_code) for team_code in team_codes
+                                                  if team_code in self.qualification_data)
+            
+            self._standings = standings
+            self._standings_version = self.store.qualification_version
+        
+        return self._standings
+    
+    def invalidate_confederation_stats(self):
+        """Drop cached confederation aggregates, e.g. after editing qualification data in place."""
+        self._confederation_totals = None
+        self._confederation_totals_version = None
+        self._standings = None
+        self._standings_version = None
+    
+    def update_team_qualification(self, team_code, qual_data):
+        """Replace a team's qualification data and update confederation aggregates and standings incrementally."""
+        if team_code not in self.teams_data:
+            raise ValueError(f"Team {team_code} not found in data")
+        
+        confederation = self.teams_data[team_code]['confederation']
+        totals = self._get_confederation_totals()[confederation]
+        standings = self._get_standings()[confederation]
+        
+        # Swap the team's old contribution for the new one
+        old_totals = self._team_totals(team_code)
+        if old_totals:
+            del standings[bisect_left(standings, self._standing_key(team_code))]
+        
+        self.store.set_qualification(team_code, qual_data)
+        
+        new_totals = self._team_totals(team_code)
+        for field in totals:
+            if field != 'team_count':
+                totals[field] += new_totals[field] - (old_totals[field] if old_totals else 0)
+        insort(standings, self._standing_key(team_code))
+        
+        self._confederation_totals_version = self.store.qualification_version
+        self._standings_version = self.store.qualification_version
+    
+    def apply_result(self, team1_code, team2_code, score1, score2):
+        """Apply a qualifying match result to both teams' records as it arrives.
+        
+        Both teams are checked before either record changes, so an unknown team
+        leaves the qualification data untouched.
+        """
+        for team_code in (team1_code, team2_code):
+            if team_code not in self.teams_data:
+                raise ValueError(f"Team {team_code} not found in data")
+        
+        updates = []
+        for team_code, goals_for, goals_against in ((team1_code, score1, score2), (team2_code, score2, score1)):
+            qual_data = dict(self.qualification_data.get(team_code) or
+                             {**dict.fromkeys(AGGREGATE_FIELDS, 0), 'status': 'in_progress'})
+            
+            qual_data['matches_played'] += 1
+            qual_data['goals_for'] += goals_for
+            qual_data['goals_against'] += goals_against
+            if goals_for > goals_against:
+                qual_data['wins'] += 1
+                qual_data['points'] += 3
+            elif goals_for == goals_against:
+                qual_data['draws'] += 1
+                qual_data['points'] += 1
+            else:
+                qual_data['losses'] += 1
+            updates.append((team_code, qual_data))
+        
+        for team_code, qual_data in updates:
+            self.update_team_qualification(team_code, qual_data)
+    
+    def get_confederation_standings(self, confederation):
+        """Get a confederation's teams ordered by points, goal difference and goals scored."""
+        standings = self._get_standings().get(confederation, [])
+        return [(key[-1], self.qualification_data[key[-1]]) for key in standings]
+    
     def calculate_confederation_stats(self, confederation):
         """Calculate aggregate qualification statistics for a confederation."""
-        teams = self.get_confederation_teams(confederation)
-        
-        # Initialize stats
-        total_matches = 0
-        total_wins = 0
-        total_draws = 0
-        total_losses = 0
-        total_goals_for = 0
-        total_goals_against = 0
-        total_points = 0
-        qualified_teams = 0
-        
-        # Aggregate stats
-        for team_code in teams:
-            if team_code in self.qualification_data:
-                qual_data = self.qualification_data[team_code]
-                total_matches += qual_data.get('matches_played', 0)
-                total_wins += qual_data.get('wins', 0)
-                total_draws += qual_data.get('draws', 0)
-                total_losses += qual_data.get('losses', 0)
-                total_goals_for += qual_data.get('goals_for', 0)
-                total_goals_against += qual_data.get('goals_against', 0)
-                total_points += qual_data.get('points', 0)
-                if qual_data.get('status') == 'qualified':
-                    qualified_teams += 1
+        totals = self._get_confederation_totals().get(confederation)
         
         # Calculate averages
-        team_count = len(teams)
+        team_count = totals['team_count'] if totals else 0
         if team_count == 0:
             return None
         
+        total_matches = totals['matches_played']
         avg_matches = total_matches / team_count
-        avg_points = total_points / team_count if total_matches > 0 else 0
-        avg_goals_for = total_goals_for / team_count if total_matches > 0 else 0
-        avg_goals_against = total_goals_against / team_count if total_matches > 0 else 0
+        avg_points = totals['points'] / team_count if total_matches > 0 else 0
+        avg_goals_for = totals['goals_for'] / team_count if total_matches > 0 else 0
+        avg_goals_against = totals['goals_against'] / team_count if total_matches > 0 else 0
         
         return {
             'confederation': confederation,
             'team_count': team_count,
-            'qualified_teams': qualified_teams,
+            'qualified_teams': totals['qualified_teams'],
             'avg_matches': avg_matches,
             'avg_points': avg_points,
             'avg_goals_for': avg_goals_for,
@@ -232,8 +270,19 @@ class QualificationAnalyzer:
         # Ensure probability is between 0 and 1
         return max(0, min(1, probability))
     
+    def simulate_qualification_scenarios(self, remaining_fixtures, n_samples=100000, seed=None, n_workers=1):
+        """Simulate the remaining fixtures to get qualification probabilities under slot and playoff rules."""
+        from qualification_simulator import QualificationSimulator
+        
+        simulator = QualificationSimulator(self, remaining_fixtures)
+        return simulator.run(n_samples, seed=seed, n_workers=n_workers)
+    
     def generate_confederation_comparison_chart(self, output_file=None):
         """Generate a visualization comparing qualification performance across confederations."""
+        import matplotlib.pyplot as plt
+        import numpy as np
+        import pandas as pd
+        
         confederations = ['UEFA', 'CONMEBOL', 'CONCACAF', 'AFC', 'CAF', 'OFC']
         
         # Calculate stats for each confederation
@@ -279,6 +328,9 @@ class QualificationAnalyzer:
     
     def generate_qualification_probability_chart(self, team_codes, output_file=None):
         """Generate a visualization of qualification probabilities for selected teams."""
+        import matplotlib.pyplot as plt
+        import numpy as np
+        
         # Calculate probabilities for each team
         probabilities = []
         labels = []
@@ -387,6 +439,13 @@ if __name__ == "__main__":
     probability = analyzer.predict_qualification_probability('BRA')
     print(f"Brazil qualification probability: {probability:.2%}")
     
+    # Simulate the remaining CONMEBOL and AFC fixtures
+    scenarios = analyzer.simulate_qualification_scenarios({
+        'CONMEBOL': [('BRA', 'URU'), ('COL', 'BRA'), ('URU', 'COL')],
+        'AFC': [('KOR', 'AUS'), ('QAT', 'KOR'), ('AUS', 'QAT')]
+    }, seed=2026)
+    print(f"Brazil simulated qualification probability: {scenarios['BRA']['qualification_probability']:.2%}")
+    
     # Generate and save confederation comparison chart
     chart_file = analyzer.generate_confederation_comparison_chart('confederation_comparison.png')
     print(f"Confederation comparison chart saved to: {chart_file}")
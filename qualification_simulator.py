@@ -0,0 +1,223 @@
+"""
+Qualification Scenario Simulator for FIFA World Cup 2026
+
+This module provides a Monte Carlo simulator for the remaining qualifying
+fixtures of each confederation. Outcomes are sampled in vectorized batches,
+final tables are ranked within each qualifying group, and each group's direct
+and playoff places are applied to estimate true qualification probabilities.
+Confederations qualifying through groups take their places per group from
+GROUP_FORMATS; the others are one league table with the direct and playoff
+slots of confederation_formats.
+"""
+
+import numpy as np
+
+from parallel import run_chunked_jobs
+
+# Share of the intercontinental playoff places that lead to the World Cup (2 of 6)
+PLAYOFF_WIN_PROB = 1 / 3
+
+# Places per group of the confederations that qualify through groups, as
+# (direct places, playoff places, chance that a playoff place leads to the
+# World Cup). Teams are placed in groups by the optional 'group' field of their
+# qualification record; teams without one share a single group.
+GROUP_FORMATS = {
+    # Group winners qualify; runners-up join the playoffs for the last 4 of 16 places
+    'UEFA': (1, 1, 1 / 4),
+    # Group winners qualify; the 2 best of 3 runners-up go to the intercontinental playoff
+    'CONCACAF': (1, 1, 2 / 3 * PLAYOFF_WIN_PROB),
+    # Top two qualify; 3rd and 4th play a further round for 2 places and 1 intercontinental spot
+    'AFC': (2, 2, (2 + PLAYOFF_WIN_PROB) / 6),
+    # Group winners qualify; the 4 best of 9 runners-up play off for 1 intercontinental spot
+    'CAF': (1, 1, 4 / 9 * 1 / 4 * PLAYOFF_WIN_PROB),
+}
+
+
+class ConfederationModel:
+    """Class holding one confederation's table and remaining fixtures in array form."""
+
+    def __init__(self, teams, contenders, points, goal_diff, fixtures, outcome_probs,
+                 groups, open_direct_slots, playoff_slots, playoff_win_prob=PLAYOFF_WIN_PROB):
+        """Initialize the model from team arrays and fixture outcome probabilities.
+
+        contenders is a boolean mask of teams that can still take an open slot,
+        fixtures a list of (team1, team2) index pairs and outcome_probs an array
+        of shape (fixtures, 3) with [team1_win, draw, team2_win] probabilities.
+        groups gives each team's group number, and open_direct_slots and
+        playoff_slots the places still open in each group.
+        """
+        self.teams = teams
+        self.contenders = np.asarray(contenders, dtype=bool)
+        self.points = np.asarray(points, dtype=np.float32)
+        self.goal_diff = np.asarray(goal_diff, dtype=np.float32)
+        self.groups = np.asarray(groups, dtype=np.int64)
+        self.open_direct_slots = list(open_direct_slots)
+        self.playoff_slots = list(playoff_slots)
+        self.playoff_win_prob = playoff_win_prob
+
+        n_teams = len(teams)
+        home = np.array([i for i, _ in fixtures], dtype=np.int64)
+        away = np.array([j for _, j in fixtures], dtype=np.int64)
+        outcome_probs = np.asarray(outcome_probs, dtype=float).reshape(len(fixtures), 3)
+        self._p_home = outcome_probs[:, 0]
+        self._p_home_or_draw = outcome_probs[:, 0] + outcome_probs[:, 1]
+        self._home_onehot = np.eye(n_teams, dtype=np.float32)[home].reshape(len(fixtures), n_teams)
+        self._away_onehot = np.eye(n_teams, dtype=np.float32)[away].reshape(len(fixtures), n_teams)
+
+    def simulate_chunk(self, rng, n_samples):
+        """Simulate the remaining fixtures and count direct and playoff finishes per team.
+
+        Returns an array of shape (2, teams) with direct counts in row 0 and
+        playoff counts in row 1.
+        """
+        n_teams = len(self.teams)
+        counts = np.zeros((2, n_teams), dtype=np.int64)
+
+        # Sample every remaining fixture of every scenario at once
+        u = rng.random((n_samples, len(self._p_home)))
+        home_win = u < self._p_home
+        draw = ~home_win & (u < self._p_home_or_draw)
+        away_win = ~home_win & ~draw
+        points = (self.points +
+                  (3 * home_win + draw).astype(np.float32) @ self._home_onehot +
+                  (3 * away_win + draw).astype(np.float32) @ self._away_onehot)
+
+        # Simulated results move goal difference by their smallest possible margin
+        margin = (home_win.astype(np.float32) - away_win.astype(np.float32))
+        goal_diff = self.goal_diff + margin @ self._home_onehot - margin @ self._away_onehot
+
+        # Goal difference breaks ties on points and drawing of lots breaks the rest;
+        # only contenders are ranked, everyone else sorts to the bottom
+        keys = (points + (goal_diff + 100) / 1000 +
+                rng.random((n_samples, n_teams)) / 1e6)
+        keys[:, ~self.contenders] = -np.inf
+
+        for group, (direct_slots, playoff_slots) in enumerate(zip(self.open_direct_slots, self.playoff_slots)):
+            members = np.flatnonzero((self.groups == group) & self.contenders)
+            if len(members) == 0:
+                continue
+            ranked = members[np.argsort(-keys[:, members], axis=1)]
+            direct = ranked[:, :direct_slots]
+            playoff = ranked[:, direct_slots:direct_slots + playoff_slots]
+            counts[0] += np.bincount(direct.ravel(), minlength=n_teams)
+            counts[1] += np.bincount(playoff.ravel(), minlength=n_teams)
+        return counts
+
+
+class QualificationSimulator:
+    """Class for simulating qualification scenarios over each confederation's remaining fixtures."""
+
+    def __init__(self, analyzer, remaining_fixtures, predict=None, playoff_win_prob=None):
+        """Initialize the simulator from a QualificationAnalyzer and the remaining fixtures.
+
+        remaining_fixtures maps confederations to lists of (team1, team2) codes.
+        predict(team1, team2) returns a dict with 'team1_win', 'draw' and
+        'team2_win' probabilities; by default each confederation's fixtures are
+        predicted in one batch by MatchAnalyzer.predict_many on the same data
+        directory. playoff_win_prob overrides the chance of a playoff place
+        leading to the World Cup in every confederation.
+        """
+        self.match_analyzer = None
+        if predict is None:
+            from match_analyzer import MatchAnalyzer
+            self.match_analyzer = MatchAnalyzer(analyzer.data_dir)
+            predict = self.match_analyzer.predict_match_outcome
+
+        self.analyzer = analyzer
+        self.remaining_fixtures = remaining_fixtures
+        self.predict = predict
+        self.playoff_win_prob = playoff_win_prob
+        self.models = {}
+        for confederation in analyzer.confederation_formats:
+            model = self._build_model(confederation, remaining_fixtures.get(confederation, []))
+            if model is not None:
+                self.models[confederation] = model
+
+    def _build_model(self, confederation, fixtures):
+        """Build the array model of one confederation, or None if it has no teams."""
+        analyzer = self.analyzer
+        qualification_data = analyzer.qualification_data
+
+        teams = [code for code in analyzer.get_confederation_teams(confederation) if code in qualification_data]
+        for team1, team2 in fixtures:
+            for team in (team1, team2):
+                if team not in teams:
+                    teams.append(team)
+        if not teams:
+            return None
+
+        position = {team: i for i, team in enumerate(teams)}
+        empty = {'points': 0, 'goals_for': 0, 'goals_against': 0, 'status': None}
+        records = [qualification_data.get(team, empty) for team in teams]
+
+        # Teams without a group share one; eliminated or unknown teams cannot take a place
+        group_names = list(dict.fromkeys(record.get('group') for record in records))
+        groups = [group_names.index(record.get('group')) for record in records]
+        contenders = [record['status'] == 'in_progress' for record in records]
+
+        if confederation in GROUP_FORMATS:
+            direct_slots, playoff_slots, playoff_win_prob = GROUP_FORMATS[confederation]
+        else:
+            slots = analyzer.get_confederation_format(confederation) or {}
+            direct_slots = slots.get('direct_slots', slots.get('total_slots', 0))
+            playoff_slots, playoff_win_prob = slots.get('playoff_slots', 0), PLAYOFF_WIN_PROB
+        if self.playoff_win_prob is not None:
+            playoff_win_prob = self.playoff_win_prob
+
+        # Already qualified teams hold a direct place in their group
+        open_direct_slots = [direct_slots] * len(group_names)
+        for group, record in zip(groups, records):
+            if record['status'] == 'qualified':
+                open_direct_slots[group] = max(0, open_direct_slots[group] - 1)
+
+        if self.match_analyzer is not None:
+            outcome_probs, _ = self.match_analyzer.predict_many(fixtures)
+        else:
+            outcome_probs = []
+            for team1, team2 in fixtures:
+                prediction = self.predict(team1, team2)
+                outcome_probs.append([prediction['team1_win'], prediction['draw'], prediction['team2_win']])
+
+        return ConfederationModel(
+            teams=teams,
+            contenders=contenders,
+            points=[record['points'] for record in records],
+            goal_diff=[record['goals_for'] - record['goals_against'] for record in records],
+            fixtures=[(position[team1], position[team2]) for team1, team2 in fixtures],
+            outcome_probs=outcome_probs,
+            groups=groups,
+            open_direct_slots=open_direct_slots,
+            playoff_slots=[playoff_slots] * len(group_names),
+            playoff_win_prob=playoff_win_prob
+        )
+
+    def run(self, n_samples=100000, seed=None, chunk_size=100000, n_workers=1):
+        """Simulate qualification scenarios and return per-team probabilities.
+
+        Each team maps to its probabilities of a direct slot, a playoff place,
+        and of qualifying overall (direct plus playoff places won). Confederations
+        run as parallel jobs on n_workers processes (None for all cores).
+        """
+        if n_samples <= 0:
+            raise ValueError(f"n_samples must be positive, got {n_samples}")
+
+        jobs = {confederation: model.simulate_chunk for confederation, model in self.models.items()}
+        counts = run_chunked_jobs(jobs, n_samples, seed=seed, chunk_size=chunk_size, n_workers=n_workers)
+
+        probabilities = {}
+        for confederation, model in self.models.items():
+            for i, team in enumerate(model.teams):
+                status = self.analyzer.qualification_data.get(team, {}).get('status')
+                if status == 'qualified':
+                    direct, playoff = 1.0, 0.0
+                else:
+                    direct = float(counts[confederation][0, i] / n_samples)
+                    playoff = float(counts[confederation][1, i] / n_samples)
+
+                probabilities[team] = {
+                    'confederation': confederation,
+                    'direct': direct,
+                    'playoff': playoff,
+                    'qualification_probability': direct + playoff * model.playoff_win_prob
+                }
+        return probabilities
@@ -0,0 +1,250 @@
+"""
+Scoreline Model for FIFA World Cup 2026
+
+This module provides a Dixon-Coles model of match scorelines. Each team has an
+attack and a defence strength, goals of each side are Poisson distributed
+around exp(base + attack - opposing defence [+ host advantage]), and the
+Dixon-Coles correction adjusts the probabilities of 0-0, 1-0, 0-1 and 1-1.
+The likelihood and its gradient are computed over the whole match array at
+once, fits can be warm-started from the previous parameters when new results
+arrive, and scoreline probability matrices are produced for any number of
+fixtures in one batched call.
+"""
+
+from datetime import date
+
+import numpy as np
+
+from fifa_rankings_data import concacaf_teams
+
+# The 2026 host nations play their tournament matches at home
+HOST_NATIONS = [team['code'] for team in concacaf_teams if team.get('host', False)]
+
+# Prior log-goal advantage of a home or host side, kept when the data has no home flags
+HOST_ADVANTAGE = 0.25
+
+# Ridge penalty on attack and defence strengths, shrinking teams with few matches to average
+REGULARIZATION = 1.0
+
+# Bound on the Dixon-Coles low-score dependence parameter
+RHO_BOUND = 0.2
+
+MAX_GOALS = 10
+
+
+def _log_factorials(n):
+    """Get log(k!) for k = 0..n."""
+    return np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, n + 1)))))
+
+
+def _low_score_adjustment(score1, score2, rate1, rate2, rho):
+    """Get the Dixon-Coles factor tau for arrays of scores and goal rates."""
+    tau = np.ones(np.broadcast(score1, score2, rate1, rate2).shape)
+    tau = np.where((score1 == 0) & (score2 == 0), 1 - rate1 * rate2 * rho, tau)
+    tau = np.where((score1 == 0) & (score2 == 1), 1 + rate1 * rho, tau)
+    tau = np.where((score1 == 1) & (score2 == 0), 1 + rate2 * rho, tau)
+    tau = np.where((score1 == 1) & (score2 == 1), 1 - rho, tau)
+    return tau
+
+
+class ScorelineModel:
+    """Class fitting and predicting a Dixon-Coles scoreline model over match arrays."""
+
+    def __init__(self, host_nations=HOST_NATIONS, regularization=REGULARIZATION, half_life_days=None):
+        """Initialize an unfitted ScorelineModel.
+
+        half_life_days, if given, down-weights older matches by date so that a
+        match that many days old counts half as much as one played today.
+        """
+        self.host_nations = list(host_nations)
+        self.regularization = regularization
+        self.half_life_days = half_life_days
+
+        self.teams = []
+        self.team_index = {}
+        self.attack = np.zeros(0)
+        self.defence = np.zeros(0)
+        self.base = 0.0
+        self.host_advantage = HOST_ADVANTAGE
+        self.rho = 0.0
+        self.matches_fitted = 0
+
+    def _match_arrays(self, matches):
+        """Convert match dicts to team index, score, home flag and weight arrays, adding new teams."""
+        for match in matches:
+            for team in (match['team1'], match['team2']):
+                if team not in self.team_index:
+                    self.team_index[team] = len(self.teams)
+                    self.teams.append(team)
+
+        team1 = np.array([self.team_index[m['team1']] for m in matches], dtype=np.int64)
+        team2 = np.array([self.team_index[m['team2']] for m in matches], dtype=np.int64)
+        score1 = np.array([m['score1'] for m in matches], dtype=np.int64)
+        score2 = np.array([m['score2'] for m in matches], dtype=np.int64)
+        home1 = np.array([m.get('home') == m['team1'] for m in matches], dtype=float)
+        home2 = np.array([m.get('home') == m['team2'] for m in matches], dtype=float)
+
+        weights = np.ones(len(matches))
+        dates = [m.get('date') for m in matches]
+        if self.half_life_days and all(dates):
+            days = np.array([date.fromisoformat(d[:10]).toordinal() for d in dates], dtype=float)
+            weights = 0.5 ** ((days.max() - days) / self.half_life_days)
+        return team1, team2, score1, score2, home1, home2, weights
+
+    def fit(self, matches, warm_start=True):
+        """Fit the model by maximum likelihood on matches with team1, team2, score1 and score2.
+
+        Matches may carry a 'home' team code and a 'date'. With warm_start, the
+        optimizer starts from the current parameters (new teams at zero), so
+        refitting after a few new results takes only a few iterations.
+        """
+        from scipy.optimize import minimize
+
+        matches = [m for m in matches if m.get('score1') is not None and m.get('score2') is not None]
+        if not warm_start:
+            self.teams, self.team_index = [], {}
+            self.attack, self.defence = np.zeros(0), np.zeros(0)
+            self.base, self.host_advantage, self.rho = 0.0, HOST_ADVANTAGE, 0.0
+
+        team1, team2, score1, score2, home1, home2, weights = self._match_arrays(matches)
+        n_teams = len(self.teams)
+        fit_host = bool(home1.any() or home2.any())
+        log_factorials = _log_factorials(int(max(score1.max(initial=0), score2.max(initial=0))))
+
+        def unpack(params):
+            attack, defence = params[:n_teams], params[n_teams:2 * n_teams]
+            base, host_advantage, rho = params[2 * n_teams:]
+            return attack, defence, base, host_advantage, rho
+
+        def objective(params):
+            attack, defence, base, host_advantage, rho = unpack(params)
+            log_rate1 = base + attack[team1] - defence[team2] + host_advantage * home1
+            log_rate2 = base + attack[team2] - defence[team1] + host_advantage * home2
+            rate1, rate2 = np.exp(log_rate1), np.exp(log_rate2)
+            tau = np.maximum(_low_score_adjustment(score1, score2, rate1, rate2, rho), 1e-10)
+
+            log_likelihood = (score1 * log_rate1 - rate1 - log_factorials[score1] +
+                              score2 * log_rate2 - rate2 - log_factorials[score2] + np.log(tau))
+
+            # Gradients with respect to the two log rates and rho
+            grad1, grad2 = score1 - rate1, score2 - rate2
+            both_nil = (score1 == 0) & (score2 == 0)
+            nil_one = (score1 == 0) & (score2 == 1)
+            one_nil = (score1 == 1) & (score2 == 0)
+            one_all = (score1 == 1) & (score2 == 1)
+            grad1 = grad1 + np.where(both_nil, -rate1 * rate2 * rho / tau, 0) + np.where(nil_one, rate1 * rho / tau, 0)
+            grad2 = grad2 + np.where(both_nil, -rate1 * rate2 * rho / tau, 0) + np.where(one_nil, rate2 * rho / tau, 0)
+            grad_rho = (np.where(both_nil, -rate1 * rate2 / tau, 0) + np.where(nil_one, rate1 / tau, 0) +
+                        np.where(one_nil, rate2 / tau, 0) + np.where(one_all, -1 / tau, 0))
+            grad1, grad2, grad_rho = grad1 * weights, grad2 * weights, grad_rho * weights
+
+            grad_attack = (np.bincount(team1, grad1, n_teams) + np.bincount(team2, grad2, n_teams) -
+                           self.regularization * attack)
+            grad_defence = (-np.bincount(team2, grad1, n_teams) - np.bincount(team1, grad2, n_teams) -
+                            self.regularization * defence)
+            gradient = np.concatenate([grad_attack, grad_defence, [
+                grad1.sum() + grad2.sum(),
+                (grad1 * home1).sum() + (grad2 * home2).sum() if fit_host else 0.0,
+                grad_rho.sum()
+            ]])
+
+            penalty = self.regularization * (attack @ attack + defence @ defence) / 2
+            return -(weights @ log_likelihood - penalty), -gradient
+
+        # Start from the current parameters, with new teams at average strength
+        start = np.zeros(2 * n_teams + 3)
+        start[:len(self.attack)] = self.attack
+        start[n_teams:n_teams + len(self.defence)] = self.defence
+        start[2 * n_teams:] = [self.base, self.host_advantage, self.rho]
+
+        bounds = [(None, None)] * (2 * n_teams + 1) + [(None, None), (-RHO_BOUND, RHO_BOUND)]
+        result = minimize(objective, start, jac=True, method='L-BFGS-B', bounds=bounds)
+
+        self.attack, self.defence, base, host_advantage, rho = unpack(result.x)
+        self.attack, self.defence = self.attack.copy(), self.defence.copy()
+        self.base, self.host_advantage, self.rho = float(base), float(host_advantage), float(rho)
+        self.matches_fitted = len(matches)
+        return self
+
+    def _team_positions(self, team_codes):
+        """Get team positions in the parameter arrays (-1 for teams not seen in the fit)."""
+        return np.fromiter((self.team_index.get(code, -1) for code in team_codes), dtype=np.int64)
+
+    def goal_rates(self, team1_codes, team2_codes, neutral=False):
+        """Get the expected goals of both sides for many fixtures as two arrays.
+
+        Host nations get the host advantage unless neutral is True; teams not
+        seen in the fit have average attack and defence.
+        """
+        positions1 = self._team_positions(team1_codes)
+        positions2 = self._team_positions(team2_codes)
+        attack = np.append(self.attack, 0.0)  # Position -1 reads the trailing average team
+        defence = np.append(self.defence, 0.0)
+
+        hosts = set() if neutral else set(self.host_nations)
+        host1 = np.array([code in hosts for code in team1_codes], dtype=float)
+        host2 = np.array([code in hosts for code in team2_codes], dtype=float)
+
+        rate1 = np.exp(self.base + attack[positions1] - defence[positions2] + self.host_advantage * host1)
+        rate2 = np.exp(self.base + attack[positions2] - defence[positions1] + self.host_advantage * host2)
+        return rate1, rate2
+
+    def scoreline_matrices(self, team1_codes, team2_codes, max_goals=MAX_GOALS, neutral=False):
+        """Get scoreline probabilities for many fixtures as an array of shape (fixtures, goals, goals).
+
+        Entry [f, x, y] is the probability that fixture f ends x-y, for scores
+        up to max_goals; the tail beyond it is left out, so rows sum to just under 1.
+        """
+        rate1, rate2 = self.goal_rates(team1_codes, team2_codes, neutral)
+        goals = np.arange(max_goals + 1)
+        log_factorials = _log_factorials(max_goals)
+        pmf1 = np.exp(goals * np.log(rate1)[:, None] - rate1[:, None] - log_factorials)
+        pmf2 = np.exp(goals * np.log(rate2)[:, None] - rate2[:, None] - log_factorials)
+        matrices = pmf1[:, :, None] * pmf2[:, None, :]
+
+        low = np.arange(2)
+        matrices[:, :2, :2] *= _low_score_adjustment(low[:, None], low[None, :], rate1[:, None, None],
+                                                     rate2[:, None, None], self.rho)
+        return matrices
+
+    def predict_many(self, team1_codes, team2_codes, max_goals=MAX_GOALS, neutral=False):
+        """Predict many fixtures as an array of [team1_win, draw, team2_win] rows, normalized to sum to 1."""
+        matrices = self.scoreline_matrices(team1_codes, team2_codes, max_goals, neutral)
+        team1_win = np.tril(matrices, -1).sum(axis=(1, 2))
+        draw = np.trace(matrices, axis1=1, axis2=2)
+        team2_win = np.triu(matrices, 1).sum(axis=(1, 2))
+        outcomes = np.stack([team1_win, draw, team2_win], axis=1)
+        return outcomes / outcomes.sum(axis=1, keepdims=True)
+
+    def predict(self, team1_code, team2_code, neutral=False):
+        """Predict one fixture: outcome probabilities, expected goals and the most likely scoreline."""
+        matrix = self.scoreline_matrices([team1_code], [team2_code], neutral=neutral)[0]
+        team1_win, draw, team2_win = self.predict_many([team1_code], [team2_code], neutral=neutral)[0]
+        rate1, rate2 = self.goal_rates([team1_code], [team2_code], neutral)
+        score1, score2 = np.unravel_index(matrix.argmax(), matrix.shape)
+        return {
+            'team1_win': float(team1_win),
+            'team2_win': float(team2_win),
+            'draw': float(draw),
+            'team1_expected_goals': float(rate1[0]),
+            'team2_expected_goals': float(rate2[0]),
+            'most_likely_score': (int(score1), int(score2))
+        }
+
+
+# Example usage
+if __name__ == "__main__":
+    from data_store import get_data_store
+
+    model = get_data_store().get_scoreline_model()
+    print(f"Fitted {len(model.teams)} teams on {model.matches_fitted} matches "
+          f"(host advantage {model.host_advantage:.2f}, rho {model.rho:.3f})")
+
+    prediction = model.predict('USA', 'ENG')
+    print(f"USA vs England: {prediction['team1_win']:.1%} / {prediction['draw']:.1%} / "
+          f"{prediction['team2_win']:.1%}, most likely {prediction['most_likely_score']}")
+
+    # Scoreline matrices for a batch of fixtures in one call
+    fixtures = [('MEX', 'JPN'), ('ARG', 'BRA'), ('FRA', 'ENG')]
+    matrices = model.scoreline_matrices([f[0] for f in fixtures], [f[1] for f in fixtures])
+    print(f"Scoreline matrices: {matrices.shape}")
@@ -0,0 +1,451 @@
+"""
+SQLite Store for FIFA World Cup 2026
+
+This module provides a local SQLite storage layer implementing the schema of
+sql_queries_design.md (teams, players, matches, match_events, venues and
+qualification) with indexes on the columns the key queries filter and join on.
+Analyzers created with sql=True push filtering and aggregation into these
+queries instead of scanning Python lists. A single connection is kept per
+database and every query is a constant parameterized statement, so sqlite3
+prepares it once and reuses it from its statement cache.
+"""
+
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+
+from data_store import get_data_store
+
+# Stores shared between analyzers, keyed by resolved data directory
+_stores = {}
+
+PHASES = ['0-15', '16-30', '31-45', '46-60', '61-90']
+
+# Identifiers are text codes as in the rest of the project (ARG, P001, M001).
+# match_history holds the historical results the team analysis is based on and
+# player_events the per-player goal and assist events, kept apart from
+# match_events so that phase counts are not affected by them.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+  team_id TEXT PRIMARY KEY,
+  team_name TEXT NOT NULL,
+  confederation TEXT NOT NULL,
+  fifa_ranking INTEGER,
+  world_cup_appearances INTEGER,
+  best_finish TEXT,
+  qualified_status TEXT,
+  group_assigned TEXT
+);
+
+CREATE TABLE IF NOT EXISTS players (
+  player_id TEXT PRIMARY KEY,
+  full_name TEXT NOT NULL,
+  team_id TEXT REFERENCES teams(team_id),
+  position TEXT,
+  club TEXT,
+  age INTEGER,
+  caps INTEGER,
+  goals INTEGER,
+  previous_world_cups INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS venues (
+  venue_id INTEGER PRIMARY KEY,
+  venue_name TEXT NOT NULL,
+  city TEXT NOT NULL,
+  country TEXT NOT NULL,
+  capacity INTEGER,
+  latitude REAL,
+  longitude REAL
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+  match_id TEXT PRIMARY KEY,
+  stage TEXT,
+  tournament TEXT,
+  team1_id TEXT REFERENCES teams(team_id),
+  team2_id TEXT REFERENCES teams(team_id),
+  team1_score INTEGER,
+  team2_score INTEGER,
+  match_date TEXT,
+  venue_id INTEGER REFERENCES venues(venue_id),
+  attendance INTEGER,
+  referee TEXT
+);
+
+CREATE TABLE IF NOT EXISTS match_history (
+  history_id INTEGER PRIMARY KEY,
+  team1_id TEXT,
+  team2_id TEXT,
+  team1_score INTEGER,
+  team2_score INTEGER,
+  winner_id TEXT,
+  tournament TEXT,
+  stage TEXT
+);
+
+CREATE TABLE IF NOT EXISTS match_events (
+  event_id INTEGER PRIMARY KEY,
+  match_id TEXT REFERENCES matches(match_id),
+  event_type TEXT,
+  event_time INTEGER,
+  phase TEXT,
+  player_id TEXT REFERENCES players(player_id),
+  team_id TEXT REFERENCES teams(team_id),
+  additional_info TEXT
+);
+
+CREATE TABLE IF NOT EXISTS player_events (
+  event_id INTEGER PRIMARY KEY,
+  match_id TEXT,
+  player_id TEXT REFERENCES players(player_id),
+  event_type TEXT,
+  event_time INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS qualification (
+  qualification_id INTEGER PRIMARY KEY,
+  team_id TEXT UNIQUE REFERENCES teams(team_id),
+  confederation TEXT,
+  matches_played INTEGER,
+  wins INTEGER,
+  draws INTEGER,
+  losses INTEGER,
+  goals_for INTEGER,
+  goals_against INTEGER,
+  points INTEGER,
+  qualified_status TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_teams_confederation ON teams(confederation);
+CREATE INDEX IF NOT EXISTS idx_players_team ON players(team_id);
+CREATE INDEX IF NOT EXISTS idx_players_goals ON players(goals DESC);
+CREATE INDEX IF NOT EXISTS idx_matches_teams ON matches(team1_id, team2_id);
+CREATE INDEX IF NOT EXISTS idx_matches_team2 ON matches(team2_id);
+CREATE INDEX IF NOT EXISTS idx_match_history_teams ON match_history(team1_id, team2_id);
+CREATE INDEX IF NOT EXISTS idx_match_history_team2 ON match_history(team2_id);
+CREATE INDEX IF NOT EXISTS idx_match_events_match_time ON match_events(match_id, event_time);
+CREATE INDEX IF NOT EXISTS idx_match_events_player ON match_events(player_id, event_type);
+CREATE INDEX IF NOT EXISTS idx_player_events_player ON player_events(player_id, event_type);
+CREATE INDEX IF NOT EXISTS idx_qualification_confederation ON qualification(confederation);
+"""
+
+TABLES = ['teams', 'players', 'venues', 'matches', 'match_history', 'match_events', 'player_events',
+          'qualification']
+
+HEAD_TO_HEAD_SQL = """
+SELECT team1_id, team2_id, team1_score, team2_score, winner_id, tournament, stage
+FROM match_history
+WHERE (team1_id = :team1_id AND team2_id = :team2_id) OR
+      (team1_id = :team2_id AND team2_id = :team1_id)
+ORDER BY history_id
+"""
+
+# Scores decide the result; winner_id only when scores are missing (see data_store.match_outcome)
+HEAD_TO_HEAD_TALLIES_SQL = """
+SELECT
+  COALESCE(SUM(CASE WHEN winner = :team1_id THEN 1 ELSE 0 END), 0) AS team1_wins,
+  COALESCE(SUM(CASE WHEN winner = :team2_id THEN 1 ELSE 0 END), 0) AS team2_wins,
+  COALESCE(SUM(CASE WHEN winner IS NULL OR winner NOT IN (:team1_id, :team2_id) THEN 1 ELSE 0 END), 0) AS draws
+FROM (
+  SELECT CASE
+    WHEN team1_score IS NULL OR team2_score IS NULL THEN winner_id
+    WHEN team1_score > team2_score THEN team1_id
+    WHEN team2_score > team1_score THEN team2_id
+  END AS winner
+  FROM match_history
+  WHERE (team1_id = :team1_id AND team2_id = :team2_id) OR
+        (team1_id = :team2_id AND team2_id = :team1_id)
+)
+"""
+
+TEAM_RECORD_SQL = """
+SELECT COUNT(*) AS matches_played,
+  COALESCE(SUM(CASE
+    WHEN team1_score IS NULL OR team2_score IS NULL THEN winner_id = :team_id
+    WHEN team1_id = :team_id THEN team1_score > team2_score
+    ELSE team2_score > team1_score
+  END), 0) AS wins
+FROM match_history
+WHERE team1_id = :team_id OR team2_id = :team_id
+"""
+
+TOP_SCORERS_SQL = """
+SELECT p.player_id FROM players p
+LEFT JOIN (
+  SELECT player_id, COUNT(*) AS assists FROM player_events
+  WHERE event_type = 'assist'
+  GROUP BY player_id
+) a ON a.player_id = p.player_id
+ORDER BY COALESCE(p.goals, 0) DESC, COALESCE(p.caps, 0) DESC, COALESCE(a.assists, 0) DESC, p.player_id
+LIMIT :limit
+"""
+
+PLAYER_EVENT_COUNT_SQL = """
+SELECT COUNT(*) FROM player_events
+WHERE player_id = :player_id AND event_type = :event_type
+"""
+
+PHASE_COUNTS_SQL = """
+SELECT me.phase,
+  COUNT(*) AS events,
+  SUM(me.event_type = 'goal' AND me.team_id = m.team1_id) AS team1_goals,
+  SUM(me.event_type = 'goal' AND me.team_id = m.team2_id) AS team2_goals,
+  SUM(me.event_type LIKE '%card%' AND me.team_id = m.team1_id) AS team1_cards,
+  SUM(me.event_type LIKE '%card%' AND me.team_id = m.team2_id) AS team2_cards
+FROM match_events me
+JOIN matches m ON m.match_id = me.match_id
+WHERE me.match_id = :match_id
+GROUP BY me.phase
+"""
+
+
+# Statements writing one row of each dataset, shared by the bulk load and the
+# write-through of later changes
+TEAM_INSERT_SQL = (
+    "INSERT OR REPLACE INTO teams (team_id, team_name, confederation, fifa_ranking, qualified_status) "
+    "VALUES (?, ?, ?, ?, ?)")
+PLAYER_INSERT_SQL = (
+    "INSERT OR REPLACE INTO players (player_id, full_name, team_id, position, age, caps, goals) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)")
+MATCH_INSERT_SQL = (
+    "INSERT OR REPLACE INTO matches (match_id, stage, tournament, team1_id, team2_id, "
+    "team1_score, team2_score, match_date) VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+HISTORY_INSERT_SQL = (
+    "INSERT INTO match_history (team1_id, team2_id, team1_score, team2_score, winner_id, "
+    "tournament, stage) VALUES (?, ?, ?, ?, ?, ?, ?)")
+MATCH_EVENT_INSERT_SQL = (
+    "INSERT INTO match_events (match_id, event_type, event_time, phase, player_id, team_id, "
+    "additional_info) VALUES (?, ?, ?, ?, ?, ?, ?)")
+PLAYER_EVENT_INSERT_SQL = (
+    "INSERT INTO player_events (match_id, player_id, event_type, event_time) VALUES (?, ?, ?, ?)")
+QUALIFICATION_INSERT_SQL = (
+    "INSERT OR REPLACE INTO qualification (team_id, confederation, matches_played, wins, draws, "
+    "losses, goals_for, goals_against, points, qualified_status) "
+    "VALUES (?, (SELECT confederation FROM teams WHERE team_id = ?), ?, ?, ?, ?, ?, ?, ?, ?)")
+
+
+def get_sqlite_store(data_dir='../../data', db_path=':memory:'):
+    """Get the shared SQLite store for a data directory, kept in step with its data store.
+
+    The database is rebuilt from the data store on first use, replacing any
+    rows a database file kept from an earlier run, and later changes to the
+    data store are written through to it.
+    """
+    key = (str(Path(data_dir).resolve()), str(db_path))
+    if key not in _stores:
+        data_store = get_data_store(data_dir)
+        # Load every dataset first so that only later changes are written through
+        data_store.load_data()
+        store = SqliteStore(db_path)
+        store.clear()
+        store.load_from(data_store)
+        data_store.listeners.append(store)
+        _stores[key] = store
+    return _stores[key]
+
+
+def _name_keys(team_code, name):
+    """Get the (team, name) keys a player can be named by in events: the full name and its trailing parts."""
+    words = (name or '').split()
+    return [(team_code, ' '.join(words[i:])) for i in range(len(words))]
+
+
+class SqliteStore:
+    """Class holding World Cup data in an indexed SQLite database with one reused connection.
+
+    The add_* and set_* methods mirror those of the DataStore, so a store
+    registered as a DataStore listener is kept up to date as data is added.
+    """
+
+    def __init__(self, db_path=':memory:'):
+        """Initialize the SqliteStore, opening the database and creating missing tables and indexes."""
+        self.db_path = db_path
+        self.connection = sqlite3.connect(str(db_path), cached_statements=256)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+        # Match events name players by full name or surname, as 'Messi' for 'Lionel Messi'
+        self.player_names = defaultdict(set)
+        self.player_name_keys = {}
+        for row in self.connection.execute("SELECT player_id, full_name, team_id FROM players"):
+            self._index_player_name(row['player_id'], row['team_id'], row['full_name'])
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def clear(self):
+        """Delete all rows, such as those a database file kept from an earlier run."""
+        with self.connection:
+            for table in TABLES:
+                self.connection.execute(f"DELETE FROM {table}")
+        self.player_names.clear()
+        self.player_name_keys.clear()
+
+    def _index_player_name(self, player_id, team_code, name):
+        """Index a player by the names events may use for them, replacing the names of a previous record."""
+        for key in self.player_name_keys.get(player_id, []):
+            self.player_names[key].discard(player_id)
+        keys = _name_keys(team_code, name)
+        for key in keys:
+            self.player_names[key].add(player_id)
+        self.player_name_keys[player_id] = keys
+
+    def _player_id_by_name(self, team_code, name):
+        """Get the id of the player named so in a team; names shared within a team match no one."""
+        player_ids = self.player_names.get((team_code, name))
+        return next(iter(player_ids)) if player_ids and len(player_ids) == 1 else None
+
+    @staticmethod
+    def _team_row(team_code, team):
+        """Get the teams row of a team."""
+        return (team_code, team['name'], team['confederation'], team.get('ranking'),
+                'qualified' if team.get('qualified') else None)
+
+    @staticmethod
+    def _player_row(player_id, player):
+        """Get the players row of a player."""
+        return (player_id, player['name'], player.get('team'), player.get('position'),
+                player.get('age'), player.get('caps'), player.get('goals'))
+
+    @staticmethod
+    def _match_row(match_id, match):
+        """Get the matches row of a match."""
+        return (match_id, match.get('stage'), match.get('tournament'), match['team1'], match['team2'],
+                match.get('score1'), match.get('score2'), match.get('date'))
+
+    @staticmethod
+    def _history_row(match):
+        """Get the match_history row of a historical result."""
+        return (match['team1'], match['team2'], match.get('score1'), match.get('score2'), match.get('winner'),
+                match.get('tournament'), match.get('stage'))
+
+    def _match_event_row(self, event):
+        """Get the match_events row of a match event, with the player id looked up by name."""
+        player_id = self._player_id_by_name(event.get('team'), event.get('player'))
+        return (event['match_id'], event['event_type'], event.get('minute'), event.get('phase'),
+                player_id, event.get('team'), event.get('player'))
+
+    @staticmethod
+    def _player_event_row(event):
+        """Get the player_events row of a player event."""
+        return (event.get('match_id'), event['player_id'], event['event_type'], event.get('minute'))
+
+    @staticmethod
+    def _qualification_row(team_code, qual):
+        """Get the qualification row of a team's qualification data."""
+        return (team_code, team_code, qual['matches_played'], qual['wins'], qual['draws'],
+                qual['losses'], qual['goals_for'], qual['goals_against'], qual['points'], qual['status'])
+
+    def load_from(self, store):
+        """Copy all datasets of a DataStore into the database in one transaction."""
+        for player_id, player in store.players_data.items():
+            self._index_player_name(player_id, player.get('team'), player['name'])
+
+        with self.connection:
+            self.connection.executemany(
+                TEAM_INSERT_SQL, [self._team_row(code, team) for code, team in store.teams_data.items()])
+            self.connection.executemany(
+                PLAYER_INSERT_SQL,
+                [self._player_row(player_id, player) for player_id, player in store.players_data.items()])
+            self.connection.executemany(
+                MATCH_INSERT_SQL,
+                [self._match_row(match_id, match) for match_id, match in store.matches_data.items()])
+            self.connection.executemany(
+                HISTORY_INSERT_SQL, [self._history_row(match) for match in store.match_history])
+            self.connection.executemany(
+                MATCH_EVENT_INSERT_SQL, [self._match_event_row(event) for event in store.match_events])
+            self.connection.executemany(
+                PLAYER_EVENT_INSERT_SQL, [self._player_event_row(event) for event in store.player_events])
+            self.connection.executemany(
+                QUALIFICATION_INSERT_SQL,
+                [self._qualification_row(code, qual) for code, qual in store.qualification_data.items()])
+            self.connection.execute("ANALYZE")
+
+    def add_team(self, team_code, team):
+        """Add or replace a team."""
+        with self.connection:
+            self.connection.execute(TEAM_INSERT_SQL, self._team_row(team_code, team))
+            self.connection.execute("UPDATE qualification SET confederation = ? WHERE team_id = ?",
+                                    (team['confederation'], team_code))
+
+    def add_player(self, player_id, player):
+        """Add or replace a player."""
+        self._index_player_name(player_id, player.get('team'), player['name'])
+        with self.connection:
+            self.connection.execute(PLAYER_INSERT_SQL, self._player_row(player_id, player))
+
+    def add_match(self, match_id, match):
+        """Add or replace a match."""
+        with self.connection:
+            self.connection.execute(MATCH_INSERT_SQL, self._match_row(match_id, match))
+
+    def add_historical_match(self, match):
+        """Add a historical result."""
+        with self.connection:
+            self.connection.execute(HISTORY_INSERT_SQL, self._history_row(match))
+
+    def add_match_event(self, event):
+        """Add a match event."""
+        with self.connection:
+            self.connection.execute(MATCH_EVENT_INSERT_SQL, self._match_event_row(event))
+
+    def add_player_event(self, event):
+        """Add a player event."""
+        with self.connection:
+            self.connection.execute(PLAYER_EVENT_INSERT_SQL, self._player_event_row(event))
+
+    def set_qualification(self, team_code, qual_data):
+        """Set a team's qualification data."""
+        with self.connection:
+            self.connection.execute(QUALIFICATION_INSERT_SQL, self._qualification_row(team_code, qual_data))
+
+    def head_to_head(self, team1_code, team2_code):
+        """Get the historical results between two teams as match dicts, oldest first."""
+        rows = self.connection.execute(HEAD_TO_HEAD_SQL, {'team1_id': team1_code, 'team2_id': team2_code})
+        columns = [('team1', 'team1_id'), ('team2', 'team2_id'), ('score1', 'team1_score'),
+                   ('score2', 'team2_score'), ('winner', 'winner_id'), ('tournament', 'tournament'),
+                   ('stage', 'stage')]
+        # Fields missing from the original match are left out, as in the data store
+        return [{field: row[column] for field, column in columns if row[column] is not None} for row in rows]
+
+    def head_to_head_tallies(self, team1_code, team2_code):
+        """Get the (team1 wins, team2 wins, draws) tallies of two teams' historical results."""
+        params = {'team1_id': team1_code, 'team2_id': team2_code}
+        row = self.connection.execute(HEAD_TO_HEAD_TALLIES_SQL, params).fetchone()
+        return row['team1_wins'], row['team2_wins'], row['draws']
+
+    def team_record(self, team_code):
+        """Get the number of historical matches played and won by a team."""
+        row = self.connection.execute(TEAM_RECORD_SQL, {'team_id': team_code}).fetchone()
+        return row['matches_played'], row['wins']
+
+    def top_scorers(self, limit=10):
+        """Get the ids of the players with the most goals, ties broken by caps, assists and player id."""
+        return [row['player_id'] for row in self.connection.execute(TOP_SCORERS_SQL, {'limit': limit})]
+
+    def count_player_events(self, player_id, event_type):
+        """Count a player's events of one type, such as goals or assists."""
+        params = {'player_id': player_id, 'event_type': event_type}
+        return self.connection.execute(PLAYER_EVENT_COUNT_SQL, params).fetchone()[0]
+
+    def phase_counts(self, match_id, phases=PHASES):
+        """Count events, goals and cards per phase of a match, by team1 and team2.
+
+        Returns (events, goals, cards) lists aligned with phases, with goals and
+        cards as (team1, team2) pairs.
+        """
+        counts = {row['phase']: row for row in self.connection.execute(PHASE_COUNTS_SQL, {'match_id': match_id})}
+        events, goals, cards = [], [], []
+        for phase in phases:
+            row = counts.get(phase)
+            if row is None:
+                events.append(0)
+                goals.append((0, 0))
+                cards.append((0, 0))
+            else:
+                events.append(row['events'])
+                goals.append((row['team1_goals'], row['team2_goals']))
+                cards.append((row['team1_cards'], row['team2_cards']))
+        return events, goals, cards
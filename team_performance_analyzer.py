@@ -5,51 +5,71 @@ This module provides analytics functions for analyzing team performance,
 historical data, and generating predictive metrics.
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+from functools import lru_cache
 from pathlib import Path
 import json
 import os
 
+from data_store import get_data_store, team_pair
+
+@lru_cache(maxsize=None)
+def _group_outcome_tables():
+    """Enumerate the 3^6 outcomes of a 4-team group with each team's points and finishing positions.
+    
+    Returns (outcomes, points, position_shares): outcomes has shape (729, 6) with
+    0 = home win, 1 = draw and 2 = away win per fixture, points has shape
+    (729, 4) and position_shares (729, 4, 4) holds each team's share of every
+    position, with teams level on points sharing the positions they span.
+    """
+    import numpy as np
+    from tournament_simulator import GROUP_FIXTURES, GROUP_SIZE
+    
+    n_fixtures = len(GROUP_FIXTURES)
+    outcomes = np.array(np.unravel_index(np.arange(3 ** n_fixtures), (3,) * n_fixtures)).T
+    
+    home = np.eye(GROUP_SIZE)[[i for i, _ in GROUP_FIXTURES]]
+    away = np.eye(GROUP_SIZE)[[j for _, j in GROUP_FIXTURES]]
+    home_points = np.array([3, 1, 0])[outcomes]
+    away_points = np.array([0, 1, 3])[outcomes]
+    points = home_points @ home + away_points @ away
+    
+    ahead = (points[:, None, :] > points[:, :, None]).sum(axis=2)
+    level = (points[:, None, :] == points[:, :, None]).sum(axis=2)
+    positions = np.arange(GROUP_SIZE)
+    spanned = (positions >= ahead[:, :, None]) & (positions < (ahead + level)[:, :, None])
+    position_shares = spanned / level[:, :, None]
+    return outcomes, points, position_shares
+
 class TeamAnalyzer:
     """Class for analyzing team performance data for the World Cup."""
     
-    def __init__(self, data_dir='../../data'):
-        """Initialize the TeamAnalyzer with data directory path."""
+    def __init__(self, data_dir='../../data', sql=False):
+        """Initialize the TeamAnalyzer with data directory path; data is loaded on first access.
+        
+        If sql is True, win percentages and head-to-head records are queried from
+        the indexed SQLite store instead of scanning the match history.
+        """
         self.data_dir = Path(data_dir)
-        self.teams_data = None
-        self.matches_data = None
-        self.load_data()
+        self.store = get_data_store(self.data_dir)
+        self.sql = None
+        if sql:
+            from sqlite_store import get_sqlite_store
+            self.sql = get_sqlite_store(self.data_dir)
         
     def load_data(self):
-        """Load team and match data from files."""
-        # In a real implementation, this would load actual data files
-        # For now, we'll create sample data structures
-        
-        # Sample teams data
-        self.teams_data = {
-            'ARG': {'name': 'Argentina', 'confederation': 'CONMEBOL', 'qualified': True, 'ranking': 1},
-            'BRA': {'name': 'Brazil', 'confederation': 'CONMEBOL', 'qualified': False, 'ranking': 5},
-            'CAN': {'name': 'Canada', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 43},
-            'MEX': {'name': 'Mexico', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 15},
-            'USA': {'name': 'United States', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 13},
-            'JPN': {'name': 'Japan', 'confederation': 'AFC', 'qualified': True, 'ranking': 20},
-            'IRN': {'name': 'IR Iran', 'confederation': 'AFC', 'qualified': True, 'ranking': 22},
-            'NZL': {'name': 'New Zealand', 'confederation': 'OFC', 'qualified': True, 'ranking': 103},
-            'ENG': {'name': 'England', 'confederation': 'UEFA', 'qualified': False, 'ranking': 4},
-            'FRA': {'name': 'France', 'confederation': 'UEFA', 'qualified': False, 'ranking': 2},
-        }
-        
-        # Sample historical match data
-        self.matches_data = [
-            {'team1': 'ARG', 'team2': 'FRA', 'score1': 3, 'score2': 3, 'winner': 'ARG', 'tournament': 'World Cup 2022', 'stage': 'Final'},
-            {'team1': 'ARG', 'team2': 'BRA', 'score1': 1, 'score2': 0, 'winner': 'ARG', 'tournament': 'Copa America 2021', 'stage': 'Final'},
-            {'team1': 'ENG', 'team2': 'FRA', 'score1': 1, 'score2': 2, 'winner': 'FRA', 'tournament': 'World Cup 2022', 'stage': 'Quarter-final'},
-            {'team1': 'USA', 'team2': 'MEX', 'score1': 2, 'score2': 0, 'winner': 'USA', 'tournament': 'CONCACAF Nations League 2023', 'stage': 'Final'},
-            {'team1': 'JPN', 'team2': 'IRN', 'score1': 3, 'score2': 0, 'winner': 'JPN', 'tournament': 'Asian Cup 2023', 'stage': 'Semi-final'},
-        ]
+        """Load team and match data from the shared data store now rather than on first access."""
+        self.store.load_dataset('teams')
+        self.store.load_dataset('match_history')
+    
+    @property
+    def teams_data(self):
+        """Team data keyed by team code."""
+        return self.store.teams_data
+    
+    @property
+    def matches_data(self):
+        """Historical match results."""
+        return self.store.match_history
     
     def get_team_info(self, team_code):
         """Get basic information about a team."""
@@ -59,37 +79,51 @@ class TeamAnalyzer:
     
     def get_qualified_teams(self):
         """Get a list of all qualified teams."""
-        return {code: data for code, data in self.teams_data.items() 
-                if data.get('qualified', False)}
+        return {code: self.teams_data[code] for code in self.store.qualified_teams}
     
     def get_teams_by_confederation(self, confederation):
         """Get teams from a specific confederation."""
-        return {code: data for code, data in self.teams_data.items() 
-                if data.get('confederation') == confederation}
+        return {code: self.teams_data[code]
+                for code in self.store.teams_by_confederation.get(confederation, [])}
     
     def get_team_matches(self, team_code):
         """Get all matches involving a specific team."""
-        return [match for match in self.matches_data 
-                if match['team1'] == team_code or match['team2'] == team_code]
+        return list(self.store.history_by_team.get(team_code, []))
     
     def calculate_win_percentage(self, team_code):
         """Calculate the win percentage for a team based on historical data."""
-        matches = self.get_team_matches(team_code)
-        if not matches:
-            return 0
+        if self.sql is not None:
+            played, wins = self.sql.team_record(team_code)
+        else:
+            record = self.store.team_records.get(team_code)
+            played, wins = (record['played'], record['won']) if record else (0, 0)
         
-        wins = sum(1 for match in matches if match['winner'] == team_code)
-        return (wins / len(matches)) * 100
+        if not played:
+            return 0
+        return (wins / played) * 100
+    
+    def get_team_record(self, team_code):
+        """Get a team's running record: played, won, drawn, lost, goals, shootouts and recent form."""
+        record = self.store.team_records.get(team_code)
+        if record is None:
+            return {'played': 0, 'won': 0, 'drawn': 0, 'lost': 0, 'goals_for': 0, 'goals_against': 0,
+                    'shootout_wins': 0, 'shootout_losses': 0, 'form': []}
+        return dict(record, form=list(record['form']))
+    
+    def get_team_form(self, team_code):
+        """Get a team's most recent results, oldest first, as 'W', 'D' or 'L'."""
+        record = self.store.team_records.get(team_code)
+        return list(record['form']) if record else []
     
     def head_to_head(self, team1_code, team2_code):
         """Analyze head-to-head record between two teams."""
-        matches = [match for match in self.matches_data 
-                  if (match['team1'] == team1_code and match['team2'] == team2_code) or
-                     (match['team1'] == team2_code and match['team2'] == team1_code)]
-        
-        team1_wins = sum(1 for match in matches if match['winner'] == team1_code)
-        team2_wins = sum(1 for match in matches if match['winner'] == team2_code)
-        draws = len(matches) - team1_wins - team2_wins
+        if self.sql is not None:
+            matches = self.sql.head_to_head(team1_code, team2_code)
+            team1_wins, team2_wins, draws = self.sql.head_to_head_tallies(team1_code, team2_code)
+        else:
+            pair = team_pair(team1_code, team2_code)
+            matches = list(self.store.history_by_pair.get(pair, []))
+            team1_wins, team2_wins, draws = self._pair_tallies(team1_code, team2_code)
         
         return {
             'total_matches': len(matches),
@@ -99,22 +133,43 @@ class TeamAnalyzer:
             'matches': matches
         }
     
+    def _pair_tallies(self, team1_code, team2_code):
+        """Get the (team1 wins, team2 wins, draws) tallies of two teams from the pair index."""
+        pair = team_pair(team1_code, team2_code)
+        first_wins, second_wins, draws = self.store.head_to_head_tallies.get(pair, (0, 0, 0))
+        if team1_code == pair[0]:
+            return first_wins, second_wins, draws
+        return second_wins, first_wins, draws
+    
+    def all_head_to_heads(self, teams):
+        """Get the head-to-head records among many teams as a dense matrix.
+        
+        Returns an int array of shape (teams, teams, 3) whose entry [i, j] holds
+        the [wins, draws, losses] of teams[i] against teams[j].
+        """
+        import numpy as np
+        
+        records = np.zeros((len(teams), len(teams), 3), dtype=np.int64)
+        for i, team1 in enumerate(teams):
+            for j in range(i + 1, len(teams)):
+                team1_wins, team2_wins, draws = self._pair_tallies(team1, teams[j])
+                records[i, j] = (team1_wins, draws, team2_wins)
+                records[j, i] = (team2_wins, draws, team1_wins)
+        return records
+    
     def predict_group_standings(self, group_teams):
         """Predict the standings in a group based on team rankings and historical performance."""
         if len(group_teams) != 4:
             raise ValueError("Group must contain exactly 4 teams")
         
-        # Simple prediction model based on FIFA ranking and win percentage
+        # Elo ratings seeded by FIFA ranking and built from historical results
+        ratings = self.store.get_rating_engine()
         standings = []
         for team in group_teams:
             if team not in self.teams_data:
                 raise ValueError(f"Team {team} not found in data")
             
-            ranking_score = 1 / self.teams_data[team]['ranking']  # Inverse ranking (higher is better)
-            win_pct = self.calculate_win_percentage(team) / 100
-            
-            # Combined score (70% ranking, 30% win percentage)
-            score = (0.7 * ranking_score) + (0.3 * win_pct)
+            score = ratings.rating(team)
             
             standings.append({
                 'team': team,
@@ -125,36 +180,70 @@ class TeamAnalyzer:
         # Sort by score (higher is better)
         return sorted(standings, key=lambda x: x['score'], reverse=True)
     
+    def predict_all_groups(self, groups):
+        """Project every group of the draw at once: expected points and position probabilities per team.
+        
+        groups maps group names to lists of 4 team codes (or is a list of such
+        lists). Match outcomes are predicted from the Elo ratings used by
+        predict_group_standings, and all 729 outcome combinations of every group
+        are weighted in one vectorized pass. Teams not in the data are given the
+        average rating of the known teams and flagged with 'known': False
+        instead of raising. Returns each group's teams sorted by expected points.
+        """
+        import numpy as np
+        from tournament_simulator import GROUP_FIXTURES, GROUP_SIZE
+        
+        if not isinstance(groups, dict):
+            groups = {chr(ord('A') + i): teams for i, teams in enumerate(groups)}
+        for name, teams in groups.items():
+            if len(teams) != GROUP_SIZE:
+                raise ValueError(f"Group {name} must contain exactly {GROUP_SIZE} teams")
+        
+        codes = np.array([list(teams) for teams in groups.values()], dtype=object)
+        known = np.array([[team in self.teams_data for team in teams] for teams in codes], dtype=bool)
+        engine = self.store.get_rating_engine()
+        ratings = engine.lookup(codes.ravel()).reshape(codes.shape)
+        if known.any():
+            ratings[~known] = ratings[known].mean()
+        
+        # Outcome probabilities of every fixture of every group: (groups, fixtures, 3)
+        fixture_probs = engine.predict_ratings(ratings[:, [i for i, _ in GROUP_FIXTURES]],
+                                               ratings[:, [j for _, j in GROUP_FIXTURES]])
+        
+        # Probability of each outcome combination: (groups, 729)
+        outcomes, points, position_shares = _group_outcome_tables()
+        fixture_index = np.arange(len(GROUP_FIXTURES))
+        scenario_probs = fixture_probs[:, fixture_index, outcomes].prod(axis=2)
+        
+        expected_points = scenario_probs @ points
+        position_probs = np.einsum('gs,stp->gtp', scenario_probs, position_shares)
+        
+        projections = {}
+        for g, name in enumerate(groups):
+            standings = [{
+                'team': team,
+                'name': self.teams_data[team]['name'] if known[g, t] else team,
+                'known': bool(known[g, t]),
+                'expected_points': float(expected_points[g, t]),
+                'position_probabilities': [float(p) for p in position_probs[g, t]]
+            } for t, team in enumerate(codes[g])]
+            projections[name] = sorted(standings, key=lambda x: x['expected_points'], reverse=True)
+        return projections
+    
     def generate_team_performance_chart(self, team_code, output_file=None):
         """Generate a visualization of team performance."""
+        import matplotlib.pyplot as plt
+        
         if team_code not in self.teams_data:
             raise ValueError(f"Team {team_code} not found in data")
         
         team_name = self.teams_data[team_code]['name']
-        matches = self.get_team_matches(team_code)
         
-        # Extract results
-        results = []
-        for match in matches:
-            if match['team1'] == team_code:
-                if match['winner'] == team_code:
-                    results.append('Win')
-                elif match['winner'] is None:
-                    results.append('Draw')
-                else:
-                    results.append('Loss')
-            else:  # team2
-                if match['winner'] == team_code:
-                    results.append('Win')
-                elif match['winner'] is None:
-                    results.append('Draw')
-                else:
-                    results.append('Loss')
-        
-        # Count results
-        win_count = results.count('Win')
-        draw_count = results.count('Draw')
-        loss_count = results.count('Loss')
+        # Count results from the running record
+        record = self.get_team_record(team_code)
+        win_count = record['won']
+        draw_count = record['drawn']
+        loss_count = record['lost']
         
         # Create pie chart
         plt.figure(figsize=(10, 6))
@@ -188,6 +277,7 @@ class TeamAnalyzer:
             'qualified': team_info.get('qualified', False),
             'matches_analyzed': len(matches),
             'win_percentage': win_pct,
+            'record': self.get_team_record(team_code),
             'matches': matches
         }
         
@@ -227,6 +317,12 @@ if __name__ == "__main__":
     for i, team in enumerate(group_prediction):
         print(f"{i+1}. {team['name']}")
     
+    # Project all groups of a draw at once
+    projections = analyzer.predict_all_groups({'A': ['ARG', 'MEX', 'JPN', 'NZL'], 'B': ['FRA', 'USA', 'MAR', 'KOR']})
+    for team in projections['B']:
+        print(f"{team['name']}: {team['expected_points']:.2f} expected points, "
+              f"{team['position_probabilities'][0]:.0%} to win the group")
+    
     # Generate and save performance chart
     chart_file = analyzer.generate_team_performance_chart('ARG', 'argentina_performance.png')
     print(f"Chart saved to: {chart_file}")
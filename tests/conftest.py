@@ -0,0 +1,22 @@
+"""
+Test configuration for FIFA World Cup 2026
+
+This module makes the project's top-level modules importable from the tests
+and provides an empty data directory, for which the data store falls back to
+its sample data.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+
+@pytest.fixture
+def sample_dir(tmp_path):
+    """Get a fresh data directory without dataset files, so that sample data is used."""
+    return tmp_path
@@ -0,0 +1,83 @@
+"""Tests for the shared indexed data store in data_store."""
+
+import pytest
+
+from data_store import DataStore
+from qualification_analyzer import QualificationAnalyzer
+from sqlite_store import SqliteStore
+
+
+@pytest.fixture
+def store(sample_dir):
+    store = DataStore(sample_dir)
+    store.load_data()
+    return store
+
+
+def test_readding_a_team_replaces_its_index_entries(store):
+    store.add_team('CAN', {'name': 'Canada', 'confederation': 'CONCACAF', 'qualified': True, 'ranking': 40})
+    store.add_team('CAN', {'name': 'Canada', 'confederation': 'UEFA', 'qualified': False, 'ranking': 40})
+
+    assert store.teams_by_confederation['CONCACAF'] == ['MEX', 'USA', 'CRC']
+    assert store.teams_by_confederation['UEFA'].count('CAN') == 1
+    assert 'CAN' not in store.qualified_teams
+
+
+def test_readding_a_player_replaces_its_index_entries(store):
+    store.add_player('P004', dict(store.players_data['P004']))
+    store.add_player('P004', dict(store.players_data['P004'], team='USA', position='Midfielder'))
+
+    assert store.players_by_team['CAN'] == []
+    assert store.players_by_team['USA'] == ['P005', 'P004']
+    assert store.players_by_position['Defender'] == []
+    assert store.players_by_position['Midfielder'] == ['P005', 'P009', 'P004']
+
+
+def test_readding_a_match_replaces_its_index_entries(store):
+    match = dict(store.matches_data['M001'])
+    team1, team2 = match['team1'], match['team2']
+    store.add_match('M001', match)
+    store.add_match('M001', dict(match, team1='CAN', team2='USA'))
+
+    assert 'M001' not in store.matches_by_team[team1]
+    assert 'M001' not in store.matches_by_team[team2]
+    assert store.matches_by_team['CAN'].count('M001') == 1
+    assert store.matches_by_team['USA'].count('M001') == 1
+
+
+def test_qualification_status_index_follows_updates(store):
+    qual_data = dict(store.qualification_data['BRA'])
+    store.set_qualification('BRA', dict(qual_data, status='qualified'))
+    store.set_qualification('BRA', dict(qual_data, status='qualified'))
+
+    assert 'BRA' not in store.qualification_by_status['in_progress']
+    assert list(store.qualification_by_status['qualified']) == ['ARG', 'JPN', 'IRN', 'NZL', 'BRA']
+
+
+def test_sqlite_listener_replaces_records(store):
+    sql = SqliteStore()
+    sql.load_from(store)
+    store.listeners.append(sql)
+
+    store.add_match('M001', dict(store.matches_data['M001'], team1='CAN', team2='USA'))
+    store.add_player('P001', dict(store.players_data['P001'], name='Leo Example'))
+
+    assert sql.connection.execute("SELECT COUNT(*), team1_id, team2_id FROM matches "
+                                  "WHERE match_id = 'M001'").fetchone()[:] == (1, 'CAN', 'USA')
+    # The player's old names no longer match them in events
+    assert sql._player_id_by_name('ARG', 'Messi') is None
+    assert sql._player_id_by_name('ARG', 'Example') == 'P001'
+
+
+def test_player_sample_teams_stay_out_of_qualification_stats(sample_dir):
+    analyzer = QualificationAnalyzer(sample_dir)
+    # The shared sample includes POR, a team of the player sample only
+    assert 'POR' in analyzer.store.teams_by_confederation['UEFA']
+
+    assert sorted(analyzer.get_confederation_teams('UEFA')) == ['ENG', 'ESP', 'FRA', 'GER', 'ITA']
+    assert analyzer.calculate_confederation_stats('UEFA') == {
+        'confederation': 'UEFA', 'team_count': 5, 'qualified_teams': 0, 'avg_matches': 4.0,
+        'avg_points': 8.2, 'avg_goals_for': 7.8, 'avg_goals_against': 3.0, 'total_slots': 16}
+    assert analyzer.calculate_confederation_stats('CONCACAF') == {
+        'confederation': 'CONCACAF', 'team_count': 4, 'qualified_teams': 0, 'avg_matches': 0.0,
+        'avg_points': 0, 'avg_goals_for': 0, 'avg_goals_against': 0, 'total_slots': 6}
@@ -0,0 +1,70 @@
+"""Tests for batched momentum in event_table."""
+
+import numpy as np
+import pytest
+
+from event_table import EventTable
+from match_analyzer import MatchAnalyzer
+
+MATCHES = {
+    'M1': {'team1': 'ARG', 'team2': 'FRA'},
+    'M2': {'team1': 'ENG', 'team2': 'USA'},
+}
+
+# Given out of minute order; the 95th-minute card is stoppage time
+EVENTS = [
+    {'match_id': 'M1', 'team': 'ARG', 'event_type': 'goal', 'minute': 23, 'phase': '16-30'},
+    {'match_id': 'M2', 'team': 'ENG', 'event_type': 'red_card', 'minute': 95, 'phase': '61-90'},
+    {'match_id': 'M1', 'team': 'FRA', 'event_type': 'yellow_card', 'minute': 10, 'phase': '0-15'},
+    {'match_id': 'M2', 'team': 'USA', 'event_type': 'goal', 'minute': 5, 'phase': '0-15'},
+    {'match_id': 'M1', 'team': 'FRA', 'event_type': 'goal', 'minute': 80, 'phase': '61-90'},
+]
+
+
+@pytest.fixture
+def table():
+    return EventTable.from_events(EVENTS, MATCHES)
+
+
+def test_momentum_curves_with_repeated_ids(table):
+    curves = table.momentum_curves(['M2', 'M1', 'M2', 'MX'])
+
+    assert curves['match_ids'] == ['M2', 'M1', 'M2', 'MX']
+    assert curves['offsets'].tolist() == [0, 2, 5, 7, 7]
+    assert curves['minutes'].tolist() == [5, 95, 10, 23, 80, 5, 95]
+    assert curves['momentum'].tolist() == [-2.0, -2.5, 0.5, 2.5, 0.5, -2.0, -2.5]
+
+
+def test_momentum_grid_with_repeated_ids(table):
+    grid = table.momentum_grid(['M1', 'M2', 'M1'], max_minute=90)
+
+    expected_m1 = np.zeros(91)
+    expected_m1[10:] = 0.5
+    expected_m1[23:] = 2.5
+    expected_m1[80:] = 0.5
+    expected_m2 = np.zeros(91)
+    expected_m2[5:] = -2.0
+    expected_m2[90] = -2.5
+
+    assert grid.shape == (3, 91)
+    np.testing.assert_array_equal(grid, [expected_m1, expected_m2, expected_m1])
+
+
+def test_batched_momentum_matches_per_match(sample_dir):
+    analyzer = MatchAnalyzer(sample_dir)
+    columnar = MatchAnalyzer(sample_dir, columnar=True)
+    match_ids = ['M002', 'M001', 'M002', 'M003']
+
+    curves = columnar.calculate_all_match_momentum(match_ids)
+    assert list(curves) == ['M002', 'M001', 'M003']
+    for match_id in match_ids:
+        assert curves[match_id] == analyzer.calculate_match_momentum(match_id)
+
+    ids, grid = columnar.calculate_momentum_grid(match_ids)
+    assert ids == match_ids
+    np.testing.assert_array_equal(grid[0], grid[2])
+    # M001: ARG goal 23', ARG card 34', BRA goal 45', BRA card 56', ARG goal 78'
+    assert grid[1, [22, 23, 34, 45, 56, 78, 90]].tolist() == [0.0, 2.0, 1.5, -0.5, 0.0, 2.0, 2.0]
+
+    with pytest.raises(ValueError, match="Match MX not found in data"):
+        columnar.calculate_momentum_grid(['M001', 'MX'])
@@ -0,0 +1,89 @@
+"""Tests for the heap-based top scorer leaderboards in leaderboards."""
+
+import random
+
+import pytest
+
+from leaderboards import Leaderboard, Leaderboards, ranking_key
+from player_performance_analyzer import PlayerAnalyzer
+
+
+def player(goals, caps, team='AAA', position='Forward'):
+    return {'name': 'Player', 'team': team, 'position': position, 'goals': goals, 'caps': caps}
+
+
+def test_ties_broken_by_caps_assists_and_id():
+    board = Leaderboard()
+    board.update('P4', ranking_key('P4', player(10, 50), assists=3))
+    board.update('P3', ranking_key('P3', player(10, 50), assists=3))
+    board.update('P2', ranking_key('P2', player(10, 50), assists=5))
+    board.update('P1', ranking_key('P1', player(10, 40), assists=9))
+    board.update('P5', ranking_key('P5', player(11, 1)))
+
+    assert board.top(10) == ['P5', 'P2', 'P3', 'P4', 'P1']
+    assert board.top(2) == ['P5', 'P2']
+    # Reading the top does not consume the heap
+    assert board.top(10) == ['P5', 'P2', 'P3', 'P4', 'P1']
+
+
+def test_outdated_entries_are_skipped():
+    board = Leaderboard()
+    board.update('P1', ranking_key('P1', player(5, 10)))
+    board.update('P2', ranking_key('P2', player(6, 10)))
+    # P1 overtakes P2, then drops back to an earlier key, leaving stale and repeated entries
+    board.update('P1', ranking_key('P1', player(7, 10)))
+    board.update('P1', ranking_key('P1', player(5, 10)))
+    board.update('P2', ranking_key('P2', player(5, 10)))
+
+    assert board.top(10) == ['P1', 'P2']
+    assert len(board) == 2
+
+    board.remove('P1')
+    assert board.top(10) == ['P2']
+    assert len(board) == 1
+
+
+def test_matches_a_full_sort_after_many_updates():
+    rng = random.Random(0)
+    leaderboards = Leaderboards()
+    players = {}
+    for _ in range(2000):
+        player_id = f'P{rng.randrange(60):03d}'
+        players[player_id] = player(rng.randrange(8), rng.randrange(4), team=rng.choice(['AAA', 'BBB', 'CCC']),
+                                    position=rng.choice(['Forward', 'Defender']))
+        leaderboards.update(player_id, players[player_id])
+
+    def expected(ids):
+        return sorted(ids, key=lambda player_id: ranking_key(player_id, players[player_id]))[:10]
+
+    assert leaderboards.top(10) == expected(players)
+    for team in ('AAA', 'BBB', 'CCC'):
+        assert leaderboards.top(10, 'team', team) == expected(
+            [player_id for player_id, record in players.items() if record['team'] == team])
+    for position in ('Forward', 'Defender'):
+        assert leaderboards.top(10, 'position', position) == expected(
+            [player_id for player_id, record in players.items() if record['position'] == position])
+
+
+def test_unknown_scope_raises():
+    with pytest.raises(ValueError, match="Unknown leaderboard scope"):
+        Leaderboards().top(5, 'club', 'X')
+
+
+def test_live_goals_update_leaderboards(sample_dir):
+    analyzer = PlayerAnalyzer(sample_dir)
+    assert [pid for pid, _ in analyzer.get_top_scorers_by_confederation('CONCACAF')] == ['P005', 'P006', 'P004']
+
+    # Davies draws level with Lozano on 18 goals but has fewer caps
+    for minute in (10, 20, 30, 40):
+        analyzer.record_goal('M100', 'P004', minute)
+    assert analyzer.players_data['P004']['goals'] == 18
+    assert [pid for pid, _ in analyzer.get_top_scorers_by_confederation('CONCACAF')] == ['P005', 'P006', 'P004']
+
+    analyzer.record_goal('M100', 'P004', 50)
+    assert [pid for pid, _ in analyzer.get_top_scorers_by_confederation('CONCACAF')] == ['P005', 'P004', 'P006']
+    assert [pid for pid, _ in analyzer.get_top_scorers_by_team('CAN')] == ['P004']
+    assert [pid for pid, _ in analyzer.get_top_scorers(3)] == ['P002', 'P001', 'P008']
+
+    with pytest.raises(ValueError, match="Player P999 not found in data"):
+        analyzer.record_goal('M100', 'P999', 60)
@@ -0,0 +1,65 @@
+"""Tests for incremental qualification updates in qualification_analyzer."""
+
+import pytest
+
+from qualification_analyzer import QualificationAnalyzer
+
+
+@pytest.fixture
+def analyzer(sample_dir):
+    analyzer = QualificationAnalyzer(sample_dir)
+    analyzer.load_data()
+    return analyzer
+
+
+def test_apply_result_updates_both_records(analyzer):
+    analyzer.apply_result('ENG', 'FRA', 2, 1)
+
+    assert analyzer.get_team_qualification_data('ENG') == {
+        'matches_played': 5, 'wins': 4, 'draws': 1, 'losses': 0, 'goals_for': 12, 'goals_against': 3,
+        'points': 13, 'status': 'in_progress'}
+    assert analyzer.get_team_qualification_data('FRA') == {
+        'matches_played': 5, 'wins': 3, 'draws': 0, 'losses': 2, 'goals_for': 9, 'goals_against': 5,
+        'points': 9, 'status': 'in_progress'}
+
+
+def test_apply_result_draw(analyzer):
+    analyzer.apply_result('ESP', 'GER', 1, 1)
+
+    assert analyzer.get_team_qualification_data('ESP')['draws'] == 3
+    assert analyzer.get_team_qualification_data('ESP')['points'] == 9
+    assert analyzer.get_team_qualification_data('GER')['draws'] == 2
+    assert analyzer.get_team_qualification_data('GER')['points'] == 8
+
+
+def test_apply_result_unknown_team_changes_nothing(analyzer):
+    before = {code: dict(qual) for code, qual in analyzer.qualification_data.items()}
+    standings = analyzer.get_confederation_standings('UEFA')
+    version = analyzer.store.qualification_version
+
+    for team1, team2 in (('ENG', 'XXX'), ('XXX', 'ENG')):
+        with pytest.raises(ValueError, match="Team XXX not found in data"):
+            analyzer.apply_result(team1, team2, 1, 0)
+
+    assert analyzer.qualification_data == before
+    assert analyzer.get_confederation_standings('UEFA') == standings
+    assert analyzer.store.qualification_version == version
+
+
+def test_standings_and_stats_follow_results(analyzer):
+    assert [code for code, _ in analyzer.get_confederation_standings('UEFA')] == ['ENG', 'FRA', 'ESP', 'GER', 'ITA']
+
+    analyzer.apply_result('ITA', 'ENG', 3, 0)
+    analyzer.apply_result('ESP', 'GER', 1, 1)
+
+    # ENG and ITA level on points and goal difference, ENG ahead on goals scored
+    assert [code for code, _ in analyzer.get_confederation_standings('UEFA')] == ['ENG', 'ITA', 'ESP', 'FRA', 'GER']
+    stats = analyzer.calculate_confederation_stats('UEFA')
+    assert stats['team_count'] == 5
+    assert stats['avg_matches'] == pytest.approx(24 / 5)
+    assert stats['avg_points'] == pytest.approx(46 / 5)
+
+    # The incremental aggregates match a full rebuild
+    analyzer.invalidate_confederation_stats()
+    assert analyzer.calculate_confederation_stats('UEFA') == stats
+    assert [code for code, _ in analyzer.get_confederation_standings('UEFA')] == ['ENG', 'ITA', 'ESP', 'FRA', 'GER']
@@ -0,0 +1,69 @@
+"""Tests for the qualification scenario simulator in qualification_simulator."""
+
+import pytest
+
+from qualification_analyzer import QualificationAnalyzer
+from qualification_simulator import QualificationSimulator
+
+
+def home_wins(team1, team2):
+    return {'team1_win': 1.0, 'draw': 0.0, 'team2_win': 0.0}
+
+
+def open_match(team1, team2):
+    return {'team1_win': 0.4, 'draw': 0.3, 'team2_win': 0.3}
+
+
+@pytest.fixture
+def analyzer(sample_dir):
+    return QualificationAnalyzer(sample_dir)
+
+
+def test_certain_results_fill_group_places(analyzer):
+    # FRA 9 -> 12 points, ENG stays on 10 and ITA 7 -> 10; ENG is ahead of ITA on goal difference
+    fixtures = {'UEFA': [('FRA', 'ENG'), ('ITA', 'ESP')]}
+    probabilities = QualificationSimulator(analyzer, fixtures, predict=home_wins).run(1000, seed=1)
+
+    assert probabilities['FRA'] == {'confederation': 'UEFA', 'direct': 1.0, 'playoff': 0.0,
+                                    'qualification_probability': 1.0}
+    assert probabilities['ENG'] == {'confederation': 'UEFA', 'direct': 0.0, 'playoff': 1.0,
+                                    'qualification_probability': 0.25}
+    for team in ('ITA', 'ESP', 'GER'):
+        assert probabilities[team]['qualification_probability'] == 0.0
+
+
+def test_qualified_and_eliminated_teams(analyzer):
+    probabilities = QualificationSimulator(analyzer, {}, predict=home_wins).run(1000, seed=1)
+
+    # ARG holds one of CONMEBOL's 6 places, leaving enough for every other contender
+    assert probabilities['ARG']['direct'] == 1.0
+    for team in ('BRA', 'URU', 'COL'):
+        assert probabilities[team]['direct'] == 1.0
+    # NZL holds OFC's only place and SOL is eliminated
+    assert probabilities['NZL']['qualification_probability'] == 1.0
+    assert probabilities['SOL'] == {'confederation': 'OFC', 'direct': 0.0, 'playoff': 0.0,
+                                    'qualification_probability': 0.0}
+
+
+def test_runs_are_reproducible(analyzer):
+    fixtures = {'UEFA': [('ENG', 'FRA'), ('ESP', 'GER'), ('ITA', 'ENG')],
+                'AFC': [('KOR', 'AUS'), ('QAT', 'KOR')]}
+    simulator = QualificationSimulator(analyzer, fixtures, predict=open_match)
+
+    first = simulator.run(5000, seed=7, chunk_size=1000)
+    assert simulator.run(5000, seed=7, chunk_size=1000) == first
+    assert simulator.run(5000, seed=7, chunk_size=1000, n_workers=2) == first
+    assert simulator.run(5000, seed=8, chunk_size=1000) != first
+
+    for team in ('ENG', 'FRA', 'ESP', 'GER', 'ITA'):
+        assert 0.0 < first[team]['qualification_probability'] < 1.0
+    # Each UEFA group has one direct and one playoff place
+    assert sum(first[team]['direct'] for team in ('ENG', 'FRA', 'ESP', 'GER', 'ITA')) == pytest.approx(1.0)
+    assert sum(first[team]['playoff'] for team in ('ENG', 'FRA', 'ESP', 'GER', 'ITA')) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('n_samples', [0, -5])
+def test_non_positive_sample_counts_raise(analyzer, n_samples):
+    simulator = QualificationSimulator(analyzer, {}, predict=home_wins)
+    with pytest.raises(ValueError, match="n_samples must be positive"):
+        simulator.run(n_samples)
@@ -0,0 +1,57 @@
+"""Tests for the running team records and head-to-head tallies in team_performance_analyzer."""
+
+import pytest
+
+from team_performance_analyzer import TeamAnalyzer
+
+
+@pytest.fixture(params=[False, True], ids=['memory', 'sql'])
+def analyzer(sample_dir, request):
+    return TeamAnalyzer(sample_dir, sql=request.param)
+
+
+def test_level_score_with_winner_is_a_draw(sample_dir):
+    # The sample 2022 final is ARG 3-3 FRA with ARG named as winner on penalties
+    analyzer = TeamAnalyzer(sample_dir)
+
+    assert analyzer.get_team_record('ARG') == {
+        'played': 2, 'won': 1, 'drawn': 1, 'lost': 0, 'goals_for': 4, 'goals_against': 3,
+        'shootout_wins': 1, 'shootout_losses': 0, 'form': ['D', 'W']}
+    assert analyzer.get_team_record('FRA') == {
+        'played': 2, 'won': 1, 'drawn': 1, 'lost': 0, 'goals_for': 5, 'goals_against': 4,
+        'shootout_wins': 0, 'shootout_losses': 1, 'form': ['D', 'W']}
+
+
+def test_win_percentage_and_tallies(analyzer):
+    assert analyzer.calculate_win_percentage('ARG') == 50.0
+    assert analyzer.calculate_win_percentage('FRA') == 50.0
+    assert analyzer.calculate_win_percentage('ENG') == 0.0
+    assert analyzer.calculate_win_percentage('XXX') == 0
+
+    head_to_head = analyzer.head_to_head('FRA', 'ARG')
+    assert (head_to_head['total_matches'], head_to_head['team1_wins'], head_to_head['team2_wins'],
+            head_to_head['draws']) == (1, 0, 0, 1)
+
+
+def test_results_added_later(analyzer):
+    store = analyzer.store
+    store.add_historical_match({'team1': 'FRA', 'team2': 'ARG', 'winner': 'FRA'})
+    store.add_historical_match({'team1': 'ARG', 'team2': 'FRA', 'score1': 1, 'score2': 1})
+    store.add_historical_match({'team1': 'FRA', 'team2': 'ARG', 'score1': 0, 'score2': 2, 'winner': 'FRA'})
+
+    # Missing scores leave the result to 'winner'; otherwise the scores decide it
+    head_to_head = analyzer.head_to_head('ARG', 'FRA')
+    assert (head_to_head['total_matches'], head_to_head['team1_wins'], head_to_head['team2_wins'],
+            head_to_head['draws']) == (4, 1, 1, 2)
+    assert analyzer.calculate_win_percentage('ARG') == 40.0
+    assert analyzer.calculate_win_percentage('FRA') == 40.0
+
+
+def test_all_head_to_heads(sample_dir):
+    records = TeamAnalyzer(sample_dir).all_head_to_heads(['ARG', 'FRA', 'BRA'])
+
+    assert records.tolist() == [
+        [[0, 0, 0], [0, 1, 0], [1, 0, 0]],
+        [[0, 1, 0], [0, 0, 0], [0, 0, 0]],
+        [[0, 0, 1], [0, 0, 0], [0, 0, 0]],
+    ]
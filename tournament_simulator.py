@@ -0,0 +1,255 @@
+"""
+Tournament Simulator for FIFA World Cup 2026
+
+This module provides a Monte Carlo simulator for the 48-team tournament format:
+12 groups of 4, group winners, runners-up and the best third-placed teams
+advancing to a round of 32, then single-elimination knockout rounds. Match
+outcomes are sampled in vectorized NumPy batches from pairwise outcome
+probabilities such as those of MatchAnalyzer.predict_match_outcome. With 12
+groups the knockout stage follows the fixed group-position bracket of the
+2026 match schedule.
+"""
+
+from itertools import combinations
+
+import numpy as np
+
+from parallel import run_chunked
+
+KNOCKOUT_ROUNDS = {
+    32: 'round_of_32',
+    16: 'round_of_16',
+    8: 'quarter_final',
+    4: 'semi_final',
+    2: 'final',
+    1: 'champion'
+}
+
+# Pairings of the four group slots that make up the six group matches
+GROUP_FIXTURES = [(0, 1), (2, 3), (0, 2), (1, 3), (0, 3), (1, 2)]
+
+GROUP_SIZE = 4
+
+# Round of 32 of the 12-group format (matches 73-88) as pairs of group slots:
+# '1E' is the winner of group E, '2A' the runner-up of group A and '3ABCDF' a
+# third-placed team from one of groups A, B, C, D or F. Matches are listed in
+# bracket order, so that adjacent winners meet in the round of 16 and so on.
+ROUND_OF_32 = [
+    ('1E', '3ABCDF'), ('1I', '3CDFGH'), ('2A', '2B'), ('1F', '2C'),
+    ('2K', '2L'), ('1H', '2J'), ('1D', '3BEFIJ'), ('1G', '3AEHIJ'),
+    ('1C', '2F'), ('2E', '2I'), ('1A', '3CEFHI'), ('1L', '3EHIJK'),
+    ('1J', '2H'), ('2D', '2G'), ('1B', '3EFGIJ'), ('1K', '3DEIJL'),
+]
+
+
+def _third_place_slots(slot_groups, n_groups):
+    """Assign the qualifying third-placed teams to round of 32 slots for every set of groups they come from.
+
+    Returns an array of shape (2 ** n_groups, slots) giving, for each bit mask
+    of the groups whose third-placed teams qualify, the group whose team fills
+    each slot. Each team goes to a slot that lists its group, as in the
+    schedule's table of third-placed team combinations.
+    """
+    table = np.full((1 << n_groups, len(slot_groups)), -1, dtype=np.int64)
+
+    def assign(groups, slot, used):
+        if slot == len(slot_groups):
+            return []
+        for group in groups:
+            if group in slot_groups[slot] and group not in used:
+                rest = assign(groups, slot + 1, used | {group})
+                if rest is not None:
+                    return [group] + rest
+        return None
+
+    for groups in combinations(range(n_groups), len(slot_groups)):
+        assignment = assign(groups, 0, frozenset())
+        if assignment is not None:
+            table[sum(1 << group for group in groups)] = assignment
+    return table
+
+
+def _bracket_order(size):
+    """Get the bracket position of each seed so that top seeds meet as late as possible."""
+    order = [0]
+    while len(order) < size:
+        n = len(order) * 2
+        order = [s for seed in order for s in (seed, n - 1 - seed)]
+    return np.array(order)
+
+
+class TournamentSimulator:
+    """Class for simulating the World Cup group and knockout stages with Monte Carlo sampling."""
+
+    def __init__(self, groups, outcome_probs):
+        """Initialize the simulator with the group draw and pairwise outcome probabilities.
+
+        groups is a dict mapping group names to lists of 4 team codes (or a list
+        of such lists). outcome_probs is an array of shape (teams, teams, 3) with
+        the [team1_win, draw, team2_win] probabilities for every ordered pair,
+        indexed in the order the teams appear in the groups.
+        """
+        if not isinstance(groups, dict):
+            groups = {chr(ord('A') + i): teams for i, teams in enumerate(groups)}
+        for name, teams in groups.items():
+            if len(teams) != GROUP_SIZE:
+                raise ValueError(f"Group {name} must contain exactly {GROUP_SIZE} teams")
+
+        self.groups = groups
+        self.teams = [team for teams in groups.values() for team in teams]
+        if len(set(self.teams)) != len(self.teams):
+            raise ValueError("A team cannot appear in more than one group")
+
+        n_groups = len(groups)
+        n_teams = len(self.teams)
+
+        # Knockout bracket: group winners and runners-up plus enough third-placed teams
+        # to fill the next power of two (8 of 12 for the 48-team format)
+        self.bracket_size = 1 << (2 * n_groups - 1).bit_length()
+        self.n_best_thirds = self.bracket_size - 2 * n_groups
+        if self.n_best_thirds > n_groups:
+            raise ValueError("Not enough third-placed teams to fill the knockout bracket")
+        self.stages = ['group_winner'] + [KNOCKOUT_ROUNDS[size] for size in sorted(KNOCKOUT_ROUNDS, reverse=True)
+                                          if size <= self.bracket_size]
+        self._bracket_order = _bracket_order(self.bracket_size)
+
+        # With 12 groups, bracket positions index [winners, runners-up, thirds in slot order]
+        self._bracket_slots = None
+        if n_groups == 12:
+            group_index = {letter: g for g, letter in enumerate('ABCDEFGHIJKL')}
+            third_slots = []
+            bracket_slots = []
+            for slot in (slot for match in ROUND_OF_32 for slot in match):
+                if slot[0] == '3':
+                    bracket_slots.append(2 * n_groups + len(third_slots))
+                    third_slots.append({group_index[letter] for letter in slot[1:]})
+                else:
+                    bracket_slots.append((int(slot[0]) - 1) * n_groups + group_index[slot[1]])
+            self._bracket_slots = np.array(bracket_slots)
+            self._third_place_slots = _third_place_slots(third_slots, n_groups)
+
+        # Group fixtures as team positions with their outcome probabilities
+        outcome_probs = np.asarray(outcome_probs, dtype=float)
+        home = np.array([g * GROUP_SIZE + i for g in range(n_groups) for i, _ in GROUP_FIXTURES])
+        away = np.array([g * GROUP_SIZE + j for g in range(n_groups) for _, j in GROUP_FIXTURES])
+        self._p_home = outcome_probs[home, away, 0]
+        self._p_home_or_draw = self._p_home + outcome_probs[home, away, 1]
+        self._home_onehot = np.eye(n_teams, dtype=np.float32)[home]
+        self._away_onehot = np.eye(n_teams, dtype=np.float32)[away]
+
+        # Knockout matches cannot be drawn: split the draw probability in proportion
+        # to the win probabilities to model extra time and penalties
+        wins = outcome_probs[:, :, 0]
+        losses = outcome_probs[:, :, 2]
+        decisive = wins + losses
+        self._p_advance = np.divide(wins, decisive, out=np.full_like(wins, 0.5), where=decisive > 0)
+
+    @classmethod
+    def from_predictor(cls, groups, predict):
+        """Create a simulator from a predictor such as MatchAnalyzer.predict_match_outcome."""
+        teams_by_group = groups.values() if isinstance(groups, dict) else groups
+        teams = [team for group in teams_by_group for team in group]
+
+        outcome_probs = np.zeros((len(teams), len(teams), 3))
+        for i, team1 in enumerate(teams):
+            for j, team2 in enumerate(teams):
+                if i != j:
+                    prediction = predict(team1, team2)
+                    outcome_probs[i, j] = [prediction['team1_win'], prediction['draw'], prediction['team2_win']]
+        return cls(groups, outcome_probs)
+
+    def _simulate_batch(self, rng, n_tournaments):
+        """Simulate a batch of tournaments and count how often each team reaches each stage."""
+        n_groups = len(self.groups)
+        n_teams = len(self.teams)
+        counts = np.zeros((len(self.stages), n_teams), dtype=np.int64)
+
+        # Group stage: sample every match of every tournament at once
+        u = rng.random((n_tournaments, len(self._p_home)))
+        home_win = u < self._p_home
+        draw = ~home_win & (u < self._p_home_or_draw)
+        away_win = ~home_win & ~draw
+        points = ((3 * home_win + draw).astype(np.float32) @ self._home_onehot +
+                  (3 * away_win + draw).astype(np.float32) @ self._away_onehot)
+
+        # Rank on points, with ties broken by drawing of lots
+        keys = (points + rng.random((n_tournaments, n_teams))).reshape(n_tournaments, n_groups, GROUP_SIZE)
+        order = np.argsort(-keys, axis=2)
+        ranked_keys = np.take_along_axis(keys, order, axis=2)
+        ranked_teams = order + np.arange(n_groups)[:, None] * GROUP_SIZE
+
+        winners, runners_up, thirds = ranked_teams[:, :, 0], ranked_teams[:, :, 1], ranked_teams[:, :, 2]
+        best = np.argsort(-ranked_keys[:, :, 2], axis=1)[:, :self.n_best_thirds]
+        best_thirds = np.take_along_axis(thirds, best, axis=1)
+        best_third_keys = np.take_along_axis(ranked_keys[:, :, 2], best, axis=1)
+
+        if self._bracket_slots is not None:
+            # Fixed bracket: each qualifying third-placed team fills the slot its group combination gives it
+            mask = np.bitwise_or.reduce(np.left_shift(1, best), axis=1)
+            slot_thirds = np.take_along_axis(thirds, self._third_place_slots[mask], axis=1)
+            bracket = np.concatenate([winners, runners_up, slot_thirds], axis=1)[:, self._bracket_slots]
+        else:
+            # Other formats seed the qualifiers (group winners, then runners-up, then
+            # third-placed teams) and pair top seeds with bottom ones; unlike the
+            # fixed bracket, this can pair teams from the same group
+            qualifiers = np.concatenate([winners, runners_up, best_thirds], axis=1)
+            seed_keys = np.concatenate([ranked_keys[:, :, 0] + 2000, ranked_keys[:, :, 1] + 1000,
+                                        best_third_keys], axis=1)
+            seeded = np.take_along_axis(qualifiers, np.argsort(-seed_keys, axis=1), axis=1)
+            bracket = seeded[:, self._bracket_order]
+
+        counts[0] = np.bincount(winners.ravel(), minlength=n_teams)
+        stage = 1
+        counts[stage] = np.bincount(bracket.ravel(), minlength=n_teams)
+
+        # Knockout rounds: adjacent bracket positions meet, winners move on
+        while bracket.shape[1] > 1:
+            team1, team2 = bracket[:, 0::2], bracket[:, 1::2]
+            team1_through = rng.random(team1.shape) < self._p_advance[team1, team2]
+            bracket = np.where(team1_through, team1, team2)
+            stage += 1
+            counts[stage] = np.bincount(bracket.ravel(), minlength=n_teams)
+
+        return counts
+
+    def simulate(self, n_tournaments, seed=None, batch_size=100000, n_workers=1):
+        """Simulate tournaments and return the stage counts array of shape (stages, teams).
+
+        Batches run on n_workers processes (None for all cores); the counts for
+        a given seed and batch_size do not depend on the number of workers.
+        """
+        return run_chunked(self._simulate_batch, n_tournaments, seed=seed,
+                           chunk_size=batch_size, n_workers=n_workers)
+
+    def stage_probabilities(self, counts, n_tournaments):
+        """Convert stage counts into per-team probabilities of reaching each stage."""
+        return {
+            team: {stage: float(counts[s, t] / n_tournaments) for s, stage in enumerate(self.stages)}
+            for t, team in enumerate(self.teams)
+        }
+
+    def run(self, n_tournaments=100000, seed=None, batch_size=100000, n_workers=1):
+        """Simulate tournaments and return per-team probabilities of reaching each stage."""
+        counts = self.simulate(n_tournaments, seed=seed, batch_size=batch_size, n_workers=n_workers)
+        return self.stage_probabilities(counts, n_tournaments)
+
+
+# Example usage
+if __name__ == "__main__":
+    from match_analyzer import MatchAnalyzer
+
+    analyzer = MatchAnalyzer()
+    groups = {
+        'A': ['MEX', 'JPN', 'NZL', 'EGY'],
+        'B': ['CAN', 'FRA', 'KOR', 'SEN'],
+        'C': ['USA', 'ENG', 'QAT', 'IRN'],
+        'D': ['ARG', 'BRA', 'ESP', 'MAR'],
+    }
+
+    outcome_probs, _ = analyzer.predict_matrix([team for teams in groups.values() for team in teams])
+    simulator = TournamentSimulator(groups, outcome_probs)
+    probabilities = simulator.run(100000, seed=2026)
+
+    print("Champion probabilities:")
+    for team, stages in sorted(probabilities.items(), key=lambda x: x[1]['champion'], reverse=True):
+        print(f"{team}: {stages['champion']:.1%}")